@@ -0,0 +1,83 @@
+"""add answers_fts search index
+
+Revision ID: 9b1e4c6d2f80
+Revises: 3f9c2d7a41e5
+Create Date: 2026-10-19 14:05:48.215630
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9b1e4c6d2f80'
+down_revision: Union[str, Sequence[str], None] = '3f9c2d7a41e5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(
+        """
+        CREATE VIRTUAL TABLE answers_fts USING fts5(
+            answer_text,
+            question_text,
+            user_id,
+            tokenize = 'unicode61 remove_diacritics 2',
+            prefix = '2 3'
+        )
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER answers_fts_insert AFTER INSERT ON answers BEGIN
+            INSERT INTO answers_fts(rowid, answer_text, question_text, user_id)
+            SELECT new.id, new.answer_text, questions.question_text, new.user_id
+            FROM questions WHERE questions.id = new.question_id;
+        END
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER answers_fts_update AFTER UPDATE OF answer_text, question_id ON answers BEGIN
+            DELETE FROM answers_fts WHERE rowid = old.id;
+            INSERT INTO answers_fts(rowid, answer_text, question_text, user_id)
+            SELECT new.id, new.answer_text, questions.question_text, new.user_id
+            FROM questions WHERE questions.id = new.question_id;
+        END
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER answers_fts_delete AFTER DELETE ON answers BEGIN
+            DELETE FROM answers_fts WHERE rowid = old.id;
+        END
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER questions_fts_update AFTER UPDATE OF question_text ON questions BEGIN
+            UPDATE answers_fts SET question_text = new.question_text
+            WHERE rowid IN (SELECT id FROM answers WHERE question_id = new.id);
+        END
+        """
+    )
+    # Индексируем уже существующие ответы
+    op.execute(
+        """
+        INSERT INTO answers_fts(rowid, answer_text, question_text, user_id)
+        SELECT answers.id, answers.answer_text, questions.question_text, answers.user_id
+        FROM answers JOIN questions ON questions.id = answers.question_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS questions_fts_update")
+    op.execute("DROP TRIGGER IF EXISTS answers_fts_delete")
+    op.execute("DROP TRIGGER IF EXISTS answers_fts_update")
+    op.execute("DROP TRIGGER IF EXISTS answers_fts_insert")
+    op.execute("DROP TABLE IF EXISTS answers_fts")
@@ -0,0 +1,42 @@
+"""add user_stats table
+
+Revision ID: c4a8e2f17b93
+Revises: 9b1e4c6d2f80
+Create Date: 2026-10-19 16:22:07.538104
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4a8e2f17b93'
+down_revision: Union[str, Sequence[str], None] = '9b1e4c6d2f80'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Rows are built on first /stats or by the nightly rebuild job, no backfill needed
+    op.create_table(
+        'user_stats',
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('total_answers', sa.Integer(), nullable=False),
+        sa.Column('last_run_start', sa.String(length=10), nullable=True),
+        sa.Column('last_run_end', sa.String(length=10), nullable=True),
+        sa.Column('longest_run', sa.Integer(), nullable=False),
+        sa.Column('longest_run_end', sa.String(length=10), nullable=True),
+        sa.Column('answers_by_year', sa.JSON(), nullable=False),
+        sa.Column('dates_by_years', sa.JSON(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('user_id')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('user_stats')
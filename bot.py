@@ -1,14 +1,30 @@
 import asyncio
 import logging
+import signal
 from aiogram import Bot, Dispatcher
-from aiogram.fsm.storage.memory import MemoryStorage
 from aiogram.client.default import DefaultBotProperties
+from aiogram.client.session.aiohttp import AiohttpSession
+from aiogram.client.telegram import TelegramAPIServer
 from aiogram.enums import ParseMode
+from aiogram.fsm.storage.base import BaseStorage
+from aiogram.webhook.aiohttp_server import SimpleRequestHandler, setup_application
+from aiohttp import web
+from apscheduler.triggers.interval import IntervalTrigger
 
 import config
+from callbacks import filter_routers_by_callback
 from database import init_db
-from handlers import start, daily, commands, settings, date_view, evening_reminder
+from database.db import engine
+from database.fsm_storage import SQLiteStorage, create_fsm_storage, create_events_isolation
+from i18n import get_catalog
+from handlers import start, daily, commands, settings, date_view, evening_reminder, admin, export, file_import, search, inline, stats
 from scheduler import ReminderScheduler
+from middlewares import (
+    UpdateTraceMiddleware, HandlerNameMiddleware, LatencyMiddleware, FlowContextMiddleware,
+    ThrottlingMiddleware, I18nMiddleware, CallbackDataMiddleware
+)
+from monitoring import install_query_hooks, db_cost, LATENCY, LoopLagMonitor
+from monitoring.http import start_metrics_server
 
 # Настройка логирования
 logging.basicConfig(
@@ -18,6 +34,101 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def create_dispatcher(storage: BaseStorage, router_filters: bool = True) -> Dispatcher:
+    """Диспетчер со всеми middleware и роутерами бота"""
+    # Апдейты одного чата обрабатываются по очереди, разных чатов - параллельно
+    dp = Dispatcher(storage=storage, events_isolation=create_events_isolation(storage))
+
+    # Трейс апдейта и задержка по хендлерам
+    dp.update.outer_middleware(UpdateTraceMiddleware())
+    dp.update.outer_middleware(LatencyMiddleware())
+    dp.message.middleware(HandlerNameMiddleware())
+    dp.callback_query.middleware(HandlerNameMiddleware())
+    dp.inline_query.middleware(HandlerNameMiddleware())
+    
+    # Контекст сценария: одно чтение и одна запись FSM data на апдейт
+    dp.update.outer_middleware(FlowContextMiddleware())
+    
+    # Язык пользователя: каталог по умолчанию компилируется сразу, остальные - по запросу
+    get_catalog(config.DEFAULT_LANGUAGE)
+    i18n_middleware = I18nMiddleware()
+    dp.message.middleware(i18n_middleware)
+    dp.callback_query.middleware(i18n_middleware)
+    dp.inline_query.middleware(i18n_middleware)
+
+    # Защита от флуда: лишние апдейты одного пользователя не доходят до хендлеров
+    # (после I18nMiddleware: ответ об ограничении отправляется на языке пользователя)
+    throttling = ThrottlingMiddleware(config.THROTTLE_LIMITS)
+    dp.message.middleware(throttling)
+    dp.callback_query.middleware(throttling)
+
+    # callback_data кнопок разбирается один раз, до фильтров хендлеров
+    dp.callback_query.outer_middleware(CallbackDataMiddleware())
+    
+    # Регистрация роутеров (порядок важен!)
+    dp.include_router(admin.router)
+    dp.include_router(start.router)
+    dp.include_router(settings.router)
+    dp.include_router(commands.router)
+    dp.include_router(export.router)
+    dp.include_router(file_import.router)
+    dp.include_router(search.router)
+    dp.include_router(inline.router)
+    dp.include_router(stats.router)
+    dp.include_router(date_view.router)
+    dp.include_router(evening_reminder.router)
+    dp.include_router(daily.router)
+
+    if router_filters:
+        # Роутеры без хендлера для префикса callback_data отсекаются одной проверкой
+        filter_routers_by_callback(dp)
+    return dp
+
+
+async def start_webhook_server(dp: Dispatcher, bot: Bot) -> web.AppRunner:
+    """Поднять aiohttp-сервер, принимающий апдейты на WEBHOOK_PATH, и зарегистрировать webhook"""
+    app = web.Application()
+    SimpleRequestHandler(
+        dispatcher=dp,
+        bot=bot,
+        secret_token=config.WEBHOOK_SECRET or None
+    ).register(app, path=config.WEBHOOK_PATH)
+    setup_application(app, dp, bot=bot)
+
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, config.WEBAPP_HOST, config.WEBAPP_PORT).start()
+
+    # Каждый инстанс регистрирует один и тот же URL, поэтому вызов идемпотентен
+    await bot.set_webhook(
+        url=config.WEBHOOK_URL.rstrip("/") + config.WEBHOOK_PATH,
+        secret_token=config.WEBHOOK_SECRET or None,
+        allowed_updates=dp.resolve_used_update_types()
+    )
+    logger.info(f"Webhook server listening on {config.WEBAPP_HOST}:{config.WEBAPP_PORT}{config.WEBHOOK_PATH}")
+    return runner
+
+
+async def run_webhook(dp: Dispatcher, bot: Bot) -> None:
+    """Работать в webhook-режиме до SIGINT/SIGTERM"""
+    runner = await start_webhook_server(dp, bot)
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop.set)
+        except NotImplementedError:
+            # Windows: остаётся KeyboardInterrupt
+            pass
+
+    try:
+        await stop.wait()
+    finally:
+        # Webhook не удаляем: остальные инстансы за прокси продолжают работать
+        await runner.cleanup()
+
+
 async def main():
     # Проверка токена
     if not config.BOT_TOKEN:
@@ -29,33 +140,66 @@ async def main():
     logger.info("Database ready. Use 'alembic upgrade head' to apply migrations if needed.")
     
     # Создание бота и диспетчера
+    session = None
+    if config.TELEGRAM_API_URL:
+        session = AiohttpSession(api=TelegramAPIServer.from_base(config.TELEGRAM_API_URL))
     bot = Bot(
         token=config.BOT_TOKEN,
+        session=session,
         default=DefaultBotProperties(parse_mode=ParseMode.HTML)
     )
     
-    storage = MemoryStorage()
-    dp = Dispatcher(storage=storage)
+    storage = create_fsm_storage()
+    dp = create_dispatcher(storage)
     
-    # Регистрация роутеров (порядок важен!)
-    dp.include_router(start.router)
-    dp.include_router(settings.router)
-    dp.include_router(commands.router)
-    dp.include_router(date_view.router)
-    dp.include_router(evening_reminder.router)
-    dp.include_router(daily.router)
+    # Инструментирование: запросы к БД приписываются текущему апдейту
+    install_query_hooks(engine)
     
     # Запуск планировщика напоминаний
-    logger.info("Starting reminder scheduler...")
-    reminder_scheduler = ReminderScheduler(bot)
-    reminder_scheduler.start()
+    reminder_scheduler = None
+    if config.SCHEDULER_ENABLED:
+        logger.info("Starting reminder scheduler...")
+        reminder_scheduler = ReminderScheduler(bot)
+        if isinstance(storage, SQLiteStorage):
+            # Периодически удаляем брошенные FSM-состояния
+            reminder_scheduler.scheduler.add_job(
+                storage.compact,
+                trigger=IntervalTrigger(minutes=config.FSM_COMPACT_INTERVAL_MINUTES),
+                id='compact_fsm_storage',
+                replace_existing=True
+            )
+        reminder_scheduler.start()
+    
+    # Мониторинг задержки event loop
+    loop_lag_monitor = LoopLagMonitor(
+        interval=config.LOOP_LAG_INTERVAL_MS / 1000,
+        threshold=config.LOOP_LAG_THRESHOLD_MS / 1000
+    )
+    loop_lag_monitor.start()
+    
+    # HTTP-эндпоинт с метриками (опционально)
+    metrics_runner = None
+    if config.METRICS_PORT:
+        metrics_runner = await start_metrics_server(config.METRICS_HOST, config.METRICS_PORT)
     
     try:
-        logger.info("Bot started")
-        await dp.start_polling(bot)
+        if config.WEBHOOK_URL:
+            logger.info("Bot started (webhook)")
+            await run_webhook(dp, bot)
+        else:
+            logger.info("Bot started (polling)")
+            # Если раньше работали через webhook, Telegram не отдаст апдейты в getUpdates
+            await bot.delete_webhook()
+            await dp.start_polling(bot)
     finally:
         logger.info("Shutting down...")
-        reminder_scheduler.shutdown()
+        if reminder_scheduler is not None:
+            reminder_scheduler.shutdown()
+        await loop_lag_monitor.stop()
+        if metrics_runner is not None:
+            await metrics_runner.cleanup()
+        logger.info("DB cost per handler:\n" + db_cost.format_report())
+        logger.info("Latency per handler:\n" + LATENCY.format_report())
         await bot.session.close()
 
 
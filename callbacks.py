@@ -0,0 +1,370 @@
+import logging
+from dataclasses import dataclass, fields
+from datetime import date, timedelta
+from typing import Any, Callable, ClassVar, NewType, Optional
+
+from aiogram import Router
+from aiogram.filters import Filter
+from aiogram.types import CallbackQuery
+
+# callback_data кнопок с параметрами: короткий префикс и значения через ':'.
+# Числа записываются в base36, дата (MM-DD) - номером дня в високосном году,
+# например calendar_edit_answer:03-15:2024:123456 -> ce:22:1k8:2n9c.
+# Разбирается callback_data один раз на апдейт (CallbackDataMiddleware) по таблице
+# префиксов, хендлеры получают готовый объект в аргументе callback_data.
+
+logger = logging.getLogger(__name__)
+
+# Лимит Telegram на callback_data в байтах
+MAX_CALLBACK_DATA_LENGTH = 64
+
+_SEPARATOR = ":"
+
+# Дата MM-DD; в callback_data хранится номером дня в году
+DateKey = NewType("DateKey", str)
+
+# Високосный год, чтобы у 29 февраля был свой номер
+_LEAP_YEAR = 2024
+_DATE_KEYS = [
+    (date(_LEAP_YEAR, 1, 1) + timedelta(days=day)).strftime("%m-%d")
+    for day in range(366)
+]
+_DAY_OF_YEAR = {date_key: day for day, date_key in enumerate(_DATE_KEYS)}
+
+_DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+
+
+def _pack_int(value: int) -> str:
+    if value < 0:
+        return "-" + _pack_int(-value)
+    packed = ""
+    while True:
+        value, digit = divmod(value, 36)
+        packed = _DIGITS[digit] + packed
+        if not value:
+            return packed
+
+
+def _unpack_int(packed: str) -> int:
+    return int(packed, 36)
+
+
+def _pack_date_key(date_key: str) -> str:
+    return _pack_int(_DAY_OF_YEAR[date_key])
+
+
+def _unpack_date_key(packed: str) -> str:
+    day = _unpack_int(packed)
+    if day < 0:
+        raise ValueError(f"Bad day of year: {packed!r}")
+    return _DATE_KEYS[day]
+
+
+def _pack_str(value: str) -> str:
+    if _SEPARATOR in value:
+        raise ValueError(f"Separator in callback value: {value!r}")
+    return value
+
+
+# тип поля -> (запись, чтение)
+_CODECS: dict[Any, tuple[Callable[[Any], str], Callable[[str], Any]]] = {
+    int: (_pack_int, _unpack_int),
+    bool: (lambda value: "1" if value else "0", lambda packed: packed == "1"),
+    str: (_pack_str, str),
+    DateKey: (_pack_date_key, _unpack_date_key),
+}
+
+# префикс -> разбор значений после префикса
+_DECODERS: dict[str, Callable[[str], Any]] = {}
+
+
+class CallbackData:
+    """Базовый класс callback_data кнопок; наследники объявляются через @callback_data"""
+
+    __slots__ = ()
+
+    prefix: ClassVar[str]
+    _encoders: ClassVar[tuple[tuple[str, Callable[[Any], str]], ...]]
+
+    def pack(self) -> str:
+        """Строка для InlineKeyboardButton.callback_data"""
+        packed = _SEPARATOR.join(
+            [self.prefix, *(encode(getattr(self, name)) for name, encode in self._encoders)]
+        )
+        if len(packed.encode()) > MAX_CALLBACK_DATA_LENGTH:
+            raise ValueError(f"callback_data is too long: {packed!r}")
+        return packed
+
+    @classmethod
+    def filter(cls) -> "CallbackDataFilter":
+        """Фильтр хендлера: callback_data этого типа"""
+        return CallbackDataFilter(cls)
+
+
+def callback_data(prefix: str) -> Callable[[type], type]:
+    """Объявить тип callback_data с коротким префиксом; поля - int, bool, str или DateKey"""
+
+    def decorator(cls: type) -> type:
+        if prefix in _DECODERS or _SEPARATOR in prefix:
+            raise ValueError(f"Bad callback prefix: {prefix!r}")
+        cls = dataclass(frozen=True, slots=True)(cls)
+        cls.prefix = prefix
+        cls_fields = fields(cls)
+        cls._encoders = tuple((field.name, _CODECS[field.type][0]) for field in cls_fields)
+        decoders = tuple(_CODECS[field.type][1] for field in cls_fields)
+
+        def decode(payload: str) -> CallbackData:
+            values = payload.split(_SEPARATOR) if payload else []
+            if len(values) != len(decoders):
+                raise ValueError(f"Expected {len(decoders)} values, got {len(values)}")
+            return cls(*(decode_value(value) for decode_value, value in zip(decoders, values)))
+
+        _DECODERS[prefix] = decode
+        return cls
+
+    return decorator
+
+
+def decode(data: Optional[str]) -> Optional[CallbackData]:
+    """Разобрать callback_data; None для кнопок без параметров и неизвестных строк"""
+    if not data:
+        return None
+    prefix, _, payload = data.partition(_SEPARATOR)
+    decoder = _DECODERS.get(prefix)
+    if decoder is None:
+        return None
+    try:
+        return decoder(payload)
+    except (ValueError, KeyError, IndexError):
+        return None
+
+
+class CallbackDataFilter(Filter):
+    """Пропускает callback, если CallbackDataMiddleware разобрал его в нужный тип"""
+
+    def __init__(self, callback_type: type[CallbackData]):
+        self.callback_type = callback_type
+
+    async def __call__(self, callback: CallbackQuery, callback_data: Optional[CallbackData] = None) -> bool:
+        return isinstance(callback_data, self.callback_type)
+
+
+class ButtonFilter(Filter):
+    """Кнопка без параметров: callback_data целиком равен data"""
+
+    def __init__(self, data: str):
+        self.data = data
+
+    async def __call__(self, callback: CallbackQuery) -> bool:
+        return callback.data == self.data
+
+
+class RouterCallbackFilter(Filter):
+    """
+    Общий фильтр callback_query роутера: пропускает только callback, который может принять
+    один из его хендлеров (typed callback с одним из префиксов или кнопка из buttons)
+    """
+
+    def __init__(self, prefixes: frozenset[str], buttons: frozenset[str]):
+        self.prefixes = prefixes
+        self.buttons = buttons
+
+    async def __call__(self, callback: CallbackQuery, callback_data: Optional[CallbackData] = None) -> bool:
+        if callback_data is not None and callback_data.prefix in self.prefixes:
+            return True
+        return callback.data in self.buttons
+
+
+def filter_routers_by_callback(root: Router) -> None:
+    """
+    Поставить RouterCallbackFilter на callback_query каждого роутера под root
+
+    Без него апдейт проверяется каждым хендлером каждого роутера по очереди; с ним роутер,
+    у которого нет хендлера для этого префикса или кнопки, отсекается одной проверкой
+    до своих хендлеров. Ключи собираются из CallbackDataFilter и ButtonFilter хендлеров,
+    поэтому вызывать после include_router. Роутер пропускается (обходится как раньше),
+    если у какого-то хендлера нет ни одного из этих фильтров или у роутера есть вложенные:
+    общий фильтр роутера отсёк бы и их.
+    """
+    for router in root.chain_tail:
+        if router.sub_routers:
+            continue
+        prefixes, buttons = set(), set()
+        for handler in router.callback_query.handlers:
+            keys = [
+                filter_.callback for filter_ in handler.filters or ()
+                if isinstance(filter_.callback, (CallbackDataFilter, ButtonFilter))
+            ]
+            if not keys:
+                logger.warning(f"Callback filter skipped for router {router.name}: handler {handler.callback.__name__} has no key")
+                break
+            if isinstance(keys[0], CallbackDataFilter):
+                prefixes.add(keys[0].callback_type.prefix)
+            else:
+                buttons.add(keys[0].data)
+        else:
+            router.callback_query.filter(RouterCallbackFilter(frozenset(prefixes), frozenset(buttons)))
+
+
+# ============================================================================
+# /today: прошлые ответы и выбор прошлого года
+# ============================================================================
+
+
+@callback_data("pp")
+class PastAnswersPage(CallbackData):
+    """Страница прошлых ответов: соседняя с годом year в сторону backwards"""
+    question_id: int
+    has_current_year: bool
+    backwards: bool
+    year: int
+
+
+@callback_data("y")
+class PastYear(CallbackData):
+    """Год из клавиатуры выбора прошлого года"""
+    year: int
+
+
+# ============================================================================
+# /date: сетка месяца, просмотр даты и действия с ней
+# ============================================================================
+
+
+@callback_data("cm")
+class CalendarMonth(CallbackData):
+    month: int
+
+
+@callback_data("cd")
+class CalendarDay(CallbackData):
+    date_key: DateKey
+
+
+@callback_data("dn")
+class DateShift(CallbackData):
+    """Соседний день: сообщение сейчас показывает date_key, сдвинуть на days"""
+    date_key: DateKey
+    days: int
+
+
+@callback_data("bd")
+class BackdatedEntry(CallbackData):
+    date_key: DateKey
+
+
+@callback_data("cs")
+class CalendarSelectYear(CallbackData):
+    date_key: DateKey
+    question_id: int
+
+
+@callback_data("cp")
+class CalendarYearPicked(CallbackData):
+    date_key: DateKey
+    question_id: int
+    year: int
+
+
+@callback_data("cc")
+class CalendarCustomYear(CallbackData):
+    date_key: DateKey
+    question_id: int
+
+
+@callback_data("cq")
+class CalendarCreateQuestion(CallbackData):
+    date_key: DateKey
+    year: int
+
+
+@callback_data("ca")
+class CalendarAddAnswer(CallbackData):
+    date_key: DateKey
+    year: int
+    question_id: int
+
+
+@callback_data("ce")
+class CalendarEditAnswer(CallbackData):
+    date_key: DateKey
+    year: int
+    answer_id: int
+
+
+@callback_data("cx")
+class CalendarDeleteAnswer(CallbackData):
+    date_key: DateKey
+    year: int
+    answer_id: int
+
+
+# ============================================================================
+# Напоминания, поиск, настройки
+# ============================================================================
+
+
+@callback_data("ya")
+class YesterdayAnswer(CallbackData):
+    date_key: DateKey
+    year: int
+
+
+@callback_data("yq")
+class YesterdayQuestion(CallbackData):
+    date_key: DateKey
+    year: int
+
+
+@callback_data("s")
+class SearchPage(CallbackData):
+    offset: int
+
+
+@callback_data("l")
+class SetLanguage(CallbackData):
+    language: str
+
+
+# ============================================================================
+# Старый формат (полные имена и MM-DD) - для кнопок в уже отправленных сообщениях
+# ============================================================================
+
+
+def _legacy(callback_type: type[CallbackData], *types: Any) -> Callable[[str], CallbackData]:
+    def decode_legacy(payload: str) -> CallbackData:
+        values = payload.split(_SEPARATOR)
+        if len(values) != len(types):
+            raise ValueError(f"Expected {len(types)} values, got {len(values)}")
+        return callback_type(*(_legacy_value(type_, value) for type_, value in zip(types, values)))
+
+    return decode_legacy
+
+
+def _legacy_value(type_: Any, value: str) -> Any:
+    if type_ is int:
+        return int(value)
+    if type_ is DateKey:
+        return _DATE_KEYS[_DAY_OF_YEAR[value]]
+    return value
+
+
+def _legacy_date_shift(days: int) -> Callable[[str], DateShift]:
+    return lambda payload: DateShift(_legacy_value(DateKey, payload), days)
+
+
+_DECODERS.update({
+    "select_year": _legacy(PastYear, int),
+    "date_prev": _legacy_date_shift(-1),
+    "date_next": _legacy_date_shift(1),
+    "add_backdated": _legacy(BackdatedEntry, DateKey),
+    "calendar_select_year": _legacy(CalendarSelectYear, DateKey, int),
+    "calendar_year_selected": _legacy(CalendarYearPicked, DateKey, int, int),
+    "calendar_custom_year": _legacy(CalendarCustomYear, DateKey, int),
+    "calendar_create_question": _legacy(CalendarCreateQuestion, DateKey, int),
+    "calendar_add_answer": _legacy(CalendarAddAnswer, DateKey, int, int),
+    "calendar_edit_answer": _legacy(CalendarEditAnswer, DateKey, int, int),
+    "calendar_delete_answer": _legacy(CalendarDeleteAnswer, DateKey, int, int),
+    "morning_yesterday_answer": _legacy(YesterdayAnswer, DateKey, int),
+    "morning_yesterday_add": _legacy(YesterdayQuestion, DateKey, int),
+})
@@ -13,4 +13,72 @@ DATABASE_URL = "sqlite+aiosqlite:///fivebook.db"
 DEFAULT_TIMEZONE = "Asia/Ho_Chi_Minh"
 
 # Default reminder time
-DEFAULT_REMINDER_TIME = "09:00"
\ No newline at end of file
+DEFAULT_REMINDER_TIME = "09:00"
+
+# Performance monitoring
+# Апдейт, который сделал больше запросов или потратил больше времени в БД, попадает в лог
+DB_QUERY_BUDGET = int(os.getenv("DB_QUERY_BUDGET", "5"))
+DB_TIME_BUDGET_MS = float(os.getenv("DB_TIME_BUDGET_MS", "100"))
+# Апдейт, обработка которого заняла дольше SLOW_UPDATE_MS, попадает в лог
+SLOW_UPDATE_MS = float(os.getenv("SLOW_UPDATE_MS", "500"))
+# Сколько последних апдейтов на хендлер учитывать в перцентилях
+LATENCY_WINDOW = int(os.getenv("LATENCY_WINDOW", "500"))
+# HTTP-эндпоинт /metrics в формате Prometheus; не запускается, если METRICS_PORT не задан
+METRICS_HOST = os.getenv("METRICS_HOST", "127.0.0.1")
+METRICS_PORT = int(os.getenv("METRICS_PORT", "0"))
+# Как часто мерить задержку event loop и с какой задержки писать стек блокирующего кода
+LOOP_LAG_INTERVAL_MS = float(os.getenv("LOOP_LAG_INTERVAL_MS", "500"))
+LOOP_LAG_THRESHOLD_MS = float(os.getenv("LOOP_LAG_THRESHOLD_MS", "250"))
+
+# Admins
+# Telegram ID администраторов через запятую (доступ к /profile)
+ADMIN_IDS = frozenset(
+    int(admin_id) for admin_id in os.getenv("ADMIN_IDS", "").split(",") if admin_id.strip()
+)
+
+# FSM storage: sqlite (таблица fsm_states), redis или memory
+FSM_STORAGE = os.getenv("FSM_STORAGE", "sqlite")
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+# Незавершённые сценарии, к которым не возвращались дольше TTL, удаляются
+FSM_STATE_TTL_HOURS = float(os.getenv("FSM_STATE_TTL_HOURS", "72"))
+FSM_CACHE_SIZE = int(os.getenv("FSM_CACHE_SIZE", "10000"))
+FSM_COMPACT_INTERVAL_MINUTES = int(os.getenv("FSM_COMPACT_INTERVAL_MINUTES", "30"))
+
+# Webhook mode: если WEBHOOK_URL задан, бот принимает апдейты через aiohttp-сервер вместо polling
+# WEBHOOK_URL - внешний адрес (https://example.com), на который Telegram шлёт апдейты
+WEBHOOK_URL = os.getenv("WEBHOOK_URL", "")
+WEBHOOK_PATH = os.getenv("WEBHOOK_PATH", "/webhook")
+# Секрет из заголовка X-Telegram-Bot-Api-Secret-Token (A-Z, a-z, 0-9, _ и -)
+WEBHOOK_SECRET = os.getenv("WEBHOOK_SECRET", "")
+WEBAPP_HOST = os.getenv("WEBAPP_HOST", "0.0.0.0")
+WEBAPP_PORT = int(os.getenv("WEBAPP_PORT", "8080"))
+# Адрес Bot API (свой сервер или devtools/fake_telegram.py); по умолчанию api.telegram.org
+TELEGRAM_API_URL = os.getenv("TELEGRAM_API_URL", "")
+# При нескольких инстансах за прокси напоминания должен рассылать только один из них
+SCHEDULER_ENABLED = os.getenv("SCHEDULER_ENABLED", "1") == "1"
+
+# Throttling: (запросов в секунду, размер пачки) на пользователя для каждого класса хендлеров
+# Класс задаётся флагом хендлера throttling_key, по умолчанию - "default"
+THROTTLE_LIMITS = {
+    "default": (2.0, 10),
+    "date_nav": (10.0, 20),
+}
+# Быстрые нажатия ◀/▶ в одном сообщении склеиваются: рисуется только последняя дата
+DATE_NAV_DEBOUNCE_MS = float(os.getenv("DATE_NAV_DEBOUNCE_MS", "300"))
+
+# Date view: сколько соседних дат с каждой стороны подгружать одним запросом
+DATE_VIEW_PREFETCH_DAYS = int(os.getenv("DATE_VIEW_PREFETCH_DAYS", "7"))
+DATE_VIEW_CACHE_TTL_SECONDS = float(os.getenv("DATE_VIEW_CACHE_TTL_SECONDS", "120"))
+DATE_VIEW_CACHE_USERS = int(os.getenv("DATE_VIEW_CACHE_USERS", "1000"))
+
+# Export: файл выгрузки держится в памяти до этого размера, дальше пишется во временный файл
+EXPORT_SPOOL_BYTES = int(os.getenv("EXPORT_SPOOL_BYTES", str(1024 * 1024)))
+
+# Search: недавние результаты поиска держатся в памяти (inline-запросы приходят на каждую букву)
+SEARCH_CACHE_TTL_SECONDS = float(os.getenv("SEARCH_CACHE_TTL_SECONDS", "30"))
+SEARCH_CACHE_USERS = int(os.getenv("SEARCH_CACHE_USERS", "1000"))
+# Inline mode: сколько результатов Telegram может кэшировать у себя (секунды, per-user)
+INLINE_CACHE_TIME = int(os.getenv("INLINE_CACHE_TIME", "30"))
+
+# Язык интерфейса для новых пользователей и для строк, которых нет в каталоге языка
+DEFAULT_LANGUAGE = os.getenv("DEFAULT_LANGUAGE", "ru")
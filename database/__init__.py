@@ -2,34 +2,57 @@ from database.db import (
     init_db,
     get_or_create_user,
     update_user_reminder_time,
+    get_user_language,
+    update_user_language,
     get_question_for_date,
+    get_question_with_answers,
+    get_month_summary,
     create_question,
     get_answers_for_question,
+    get_answers_page,
     get_answer_for_year,
     create_answer,
     get_all_users,
+    iter_journal,
+    import_journal_rows,
     update_answer_text,
     update_answer_year,
     delete_answer,
-    get_answer_by_id
+    get_answer_by_id,
+    get_user_stats,
+    rebuild_all_user_stats
 )
-from database.models import User, Question, Answer
+from database.search import search_answers, search_answers_cached, SearchHit
+from database.models import User, Question, Answer, UserStats
 
 __all__ = [
     "init_db",
     "get_or_create_user",
     "update_user_reminder_time",
+    "get_user_language",
+    "update_user_language",
     "get_question_for_date",
+    "get_question_with_answers",
+    "get_month_summary",
     "create_question",
     "get_answers_for_question",
+    "get_answers_page",
     "get_answer_for_year",
     "create_answer",
     "get_all_users",
+    "iter_journal",
+    "import_journal_rows",
     "update_answer_text",
     "update_answer_year",
     "delete_answer",
     "get_answer_by_id",
+    "get_user_stats",
+    "rebuild_all_user_stats",
+    "search_answers",
+    "search_answers_cached",
+    "SearchHit",
     "User",
     "Question",
-    "Answer"
+    "Answer",
+    "UserStats"
 ]
\ No newline at end of file
@@ -0,0 +1,107 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Dict, Optional, Tuple
+
+from database.models import Question
+from monitoring.metrics import CACHE_REQUESTS
+
+_BASE_YEAR = 2024  # leap year, so that 02-29 is part of the cycle
+
+
+def date_keys_around(date_key: str, days: int) -> list[str]:
+    """date_key and `days` keys on each side of it (MM-DD), wrapping around the new year"""
+    center = datetime.strptime(f"{_BASE_YEAR}-{date_key}", "%Y-%m-%d")
+    return [
+        (center + timedelta(days=offset)).strftime("%m-%d")
+        for offset in range(-days, days + 1)
+    ]
+
+
+class GenerationTokens:
+    """
+    Per-user tokens for dropping results read before an invalidation, bounded like the caches
+
+    A reader takes token() before querying and the cache stores the result only if
+    is_current() still holds. invalidate() drops the user's token, so every token handed
+    out before it stops being current and the next reader gets a fresh object(). Tokens
+    live in an LRU of max_users entries: evicting one only means a result read around
+    that time is not cached.
+    """
+
+    def __init__(self, max_users: int):
+        self.max_users = max_users
+        self._tokens: OrderedDict[int, object] = OrderedDict()
+
+    def token(self, user_id: int) -> object:
+        token = self._tokens.get(user_id)
+        if token is None:
+            token = self._tokens[user_id] = object()
+            while len(self._tokens) > self.max_users:
+                self._tokens.popitem(last=False)
+        else:
+            self._tokens.move_to_end(user_id)
+        return token
+
+    def is_current(self, user_id: int, token: object) -> bool:
+        return self._tokens.get(user_id) is token
+
+    def invalidate(self, user_id: int) -> None:
+        self._tokens.pop(user_id, None)
+
+    def __len__(self) -> int:
+        return len(self._tokens)
+
+
+@dataclass(slots=True)
+class _Window:
+    questions: Dict[str, Optional[Question]]
+    loaded_at: float = field(default_factory=time.monotonic)
+
+
+class QuestionWindowCache:
+    """
+    Short-lived per-user cache of questions (with answers) around the last viewed date
+
+    Every write to a user's questions or answers must call invalidate(); the TTL only
+    bounds how stale data written by another process can get. A reader takes
+    generation() before querying and passes it to put(): if the user's data was
+    invalidated in between, the window it read may be stale and is not cached.
+    """
+
+    def __init__(self, ttl: float, max_users: int = 1000):
+        self.ttl = ttl
+        self.max_users = max_users
+        self._windows: OrderedDict[int, _Window] = OrderedDict()
+        self._generations = GenerationTokens(max_users)
+
+    def generation(self, user_id: int) -> object:
+        return self._generations.token(user_id)
+
+    def get(self, user_id: int, date_key: str) -> Tuple[bool, Optional[Question]]:
+        """(True, question or None) if the date is cached for the user, (False, None) otherwise"""
+        window = self._windows.get(user_id)
+        if window is not None and time.monotonic() - window.loaded_at > self.ttl:
+            del self._windows[user_id]
+            window = None
+
+        if window is None or date_key not in window.questions:
+            CACHE_REQUESTS.inc(cache="date_view", result="miss")
+            return False, None
+
+        self._windows.move_to_end(user_id)
+        CACHE_REQUESTS.inc(cache="date_view", result="hit")
+        return True, window.questions[date_key]
+
+    def put(self, user_id: int, questions: Dict[str, Optional[Question]], generation: object) -> None:
+        if not self._generations.is_current(user_id, generation):
+            return
+        self._windows[user_id] = _Window(questions)
+        self._windows.move_to_end(user_id)
+        while len(self._windows) > self.max_users:
+            self._windows.popitem(last=False)
+
+    def invalidate(self, user_id: int) -> None:
+        self._generations.invalidate(user_id)
+        self._windows.pop(user_id, None)
@@ -1,7 +1,13 @@
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
-from sqlalchemy import select
-from database.models import Base, User, Question, Answer
-from typing import Optional
+from sqlalchemy import Row, select, or_, func
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.orm import contains_eager
+from database.models import Base, User, Question, Answer, UserStats
+from database.date_cache import QuestionWindowCache, date_keys_around
+from database.search_cache import SearchResultCache
+from database.stats import record_answer_added, record_answer_removed, rebuild_user_stats
+from collections import OrderedDict
+from typing import AsyncIterator, Optional
 from datetime import datetime
 import config
 
@@ -16,6 +22,35 @@ AsyncSessionLocal = async_sessionmaker(
     expire_on_commit=False
 )
 
+# Questions around recently viewed dates (date view navigation)
+question_window_cache = QuestionWindowCache(
+    ttl=config.DATE_VIEW_CACHE_TTL_SECONDS,
+    max_users=config.DATE_VIEW_CACHE_USERS
+)
+# Recent search results (inline mode asks again on every typed character)
+search_result_cache = SearchResultCache(
+    ttl=config.SEARCH_CACHE_TTL_SECONDS,
+    max_users=config.SEARCH_CACHE_USERS
+)
+
+
+def _invalidate_user_caches(user_id: int) -> None:
+    """Drop cached reads of the user after their questions or answers change"""
+    question_window_cache.invalidate(user_id)
+    search_result_cache.invalidate(user_id)
+
+
+# telegram_id -> language: needed for every update, changes only through /language
+_user_languages: OrderedDict[int, str] = OrderedDict()
+_USER_LANGUAGES_MAX = 10000
+
+
+def _remember_language(telegram_id: int, language: str) -> None:
+    _user_languages[telegram_id] = language
+    _user_languages.move_to_end(telegram_id)
+    while len(_user_languages) > _USER_LANGUAGES_MAX:
+        _user_languages.popitem(last=False)
+
 
 async def init_db():
     """Initialize database tables"""
@@ -35,7 +70,8 @@ async def get_or_create_user(telegram_id: int) -> User:
             user = User(
                 telegram_id=telegram_id,
                 timezone=config.DEFAULT_TIMEZONE,
-                reminder_time=config.DEFAULT_REMINDER_TIME
+                reminder_time=config.DEFAULT_REMINDER_TIME,
+                language=config.DEFAULT_LANGUAGE
             )
             session.add(user)
             await session.commit()
@@ -60,6 +96,39 @@ async def update_user_reminder_time(telegram_id: int, reminder_time: str) -> boo
         return False
 
 
+async def get_user_language(telegram_id: int) -> str:
+    """Get user's interface language (cached; default language for unknown users)"""
+    language = _user_languages.get(telegram_id)
+    if language is not None:
+        _user_languages.move_to_end(telegram_id)
+        return language
+
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(
+            select(User.language).where(User.telegram_id == telegram_id)
+        )
+        language = result.scalar_one_or_none() or config.DEFAULT_LANGUAGE
+    _remember_language(telegram_id, language)
+    return language
+
+
+async def update_user_language(telegram_id: int, language: str) -> bool:
+    """Update user's interface language"""
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(
+            select(User).where(User.telegram_id == telegram_id)
+        )
+        user = result.scalar_one_or_none()
+
+        if user:
+            user.language = language
+            user.updated_at = datetime.utcnow()
+            await session.commit()
+            _remember_language(telegram_id, language)
+            return True
+        return False
+
+
 async def get_question_for_date(user_id: int, date_key: str) -> Optional[Question]:
     """Get question for specific date (MM-DD format)"""
     async with AsyncSessionLocal() as session:
@@ -72,6 +141,58 @@ async def get_question_for_date(user_id: int, date_key: str) -> Optional[Questio
         return result.scalar_one_or_none()
 
 
+async def get_question_with_answers(user_id: int, date_key: str) -> Optional[Question]:
+    """
+    Get question for a date with its answers (ordered by year) loaded
+
+    On a cache miss the neighbouring DATE_VIEW_PREFETCH_DAYS dates on each side are
+    loaded in the same query, so stepping through the calendar is served from memory.
+    """
+    found, question = question_window_cache.get(user_id, date_key)
+    if found:
+        return question
+
+    generation = question_window_cache.generation(user_id)
+    date_keys = date_keys_around(date_key, config.DATE_VIEW_PREFETCH_DAYS)
+    first_key, last_key = date_keys[0], date_keys[-1]
+    if first_key <= last_key:
+        in_window = Question.date_key.between(first_key, last_key)
+    else:
+        # Window crosses the new year: 12-30 .. 01-02
+        in_window = or_(Question.date_key >= first_key, Question.date_key <= last_key)
+
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(
+            select(Question)
+            .outerjoin(Question.answers)
+            .options(contains_eager(Question.answers))
+            .where(Question.user_id == user_id, in_window)
+            .order_by(Question.date_key, Answer.year.asc())
+        )
+        questions = result.unique().scalars().all()
+
+    window: dict[str, Optional[Question]] = dict.fromkeys(date_keys)
+    for question in questions:
+        window[question.date_key] = question
+    question_window_cache.put(user_id, window, generation)
+    return window[date_key]
+
+
+async def get_month_summary(user_id: int, month: int) -> dict[str, int]:
+    """Get {date_key: number of answered years} for every day of the month that has a question"""
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(
+            select(Question.date_key, func.count(Answer.id))
+            .outerjoin(Question.answers)
+            .where(
+                Question.user_id == user_id,
+                Question.date_key.between(f"{month:02d}-01", f"{month:02d}-31")
+            )
+            .group_by(Question.date_key)
+        )
+        return {date_key: answered for date_key, answered in result.all()}
+
+
 async def create_question(user_id: int, date_key: str, question_text: str) -> Question:
     """Create new question for a date"""
     async with AsyncSessionLocal() as session:
@@ -83,20 +204,52 @@ async def create_question(user_id: int, date_key: str, question_text: str) -> Qu
         session.add(question)
         await session.commit()
         await session.refresh(question)
+        _invalidate_user_caches(user_id)
         return question
 
 
-async def get_answers_for_question(question_id: int) -> list[Answer]:
-    """Get all answers for a question, ordered by year"""
+async def get_answers_for_question(user_id: int, question_id: int) -> list[Answer]:
+    """Get all of the user's answers for a question, ordered by year"""
     async with AsyncSessionLocal() as session:
         result = await session.execute(
             select(Answer)
-            .where(Answer.question_id == question_id)
+            .where(Answer.user_id == user_id, Answer.question_id == question_id)
             .order_by(Answer.year.asc())
         )
         return list(result.scalars().all())
 
 
+async def get_answers_page(
+    user_id: int,
+    question_id: int,
+    limit: int,
+    after_year: Optional[int] = None,
+    before_year: Optional[int] = None
+) -> list[Answer]:
+    """
+    Get one page of the user's answers for a question, ordered by year (keyset pagination)
+
+    question_id may come from callback data, so the query is always limited to user_id.
+    after_year: the `limit` answers following this year; before_year: the `limit`
+    answers preceding it; neither: the first `limit` answers.
+    """
+    query = select(Answer).where(Answer.user_id == user_id, Answer.question_id == question_id)
+    if before_year is not None:
+        query = query.where(Answer.year < before_year).order_by(Answer.year.desc())
+    else:
+        if after_year is not None:
+            query = query.where(Answer.year > after_year)
+        query = query.order_by(Answer.year.asc())
+
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(query.limit(limit))
+        answers = list(result.scalars().all())
+
+    if before_year is not None:
+        answers.reverse()
+    return answers
+
+
 async def get_answer_for_year(user_id: int, question_id: int, year: int) -> Optional[Answer]:
     """Check if answer exists for specific year"""
     async with AsyncSessionLocal() as session:
@@ -121,11 +274,101 @@ async def create_answer(user_id: int, question_id: int, answer_text: str, answer
             year=year
         )
         session.add(answer)
+        await session.flush()
+        await record_answer_added(session, user_id, question_id, answer_date, year)
         await session.commit()
         await session.refresh(answer)
+        _invalidate_user_caches(user_id)
         return answer
 
 
+async def iter_journal(user_id: int, chunk_size: int = 500) -> AsyncIterator[list[Row]]:
+    """
+    Stream all questions of a user with their answers in chunks of rows
+
+    Rows are (date_key, question_text, year, answer_text), ordered by date and year;
+    a question without answers gives one row with year and answer_text set to None.
+    Only one chunk is held in memory at a time.
+    """
+    async with AsyncSessionLocal() as session:
+        result = await session.stream(
+            select(Question.date_key, Question.question_text, Answer.year, Answer.answer_text)
+            .outerjoin(Question.answers)
+            .where(Question.user_id == user_id)
+            .order_by(Question.date_key, Answer.year.asc())
+            .execution_options(yield_per=chunk_size)
+        )
+        async for rows in result.partitions(chunk_size):
+            yield rows
+
+
+async def import_journal_rows(
+    user_id: int,
+    rows: list[tuple[str, str, Optional[int], Optional[str]]]
+) -> tuple[int, int]:
+    """
+    Bulk insert (date_key, question_text, year, answer_text) rows in one transaction
+
+    Questions and answers go in as multi-row INSERT ... ON CONFLICT DO NOTHING, so a date
+    that already has a question (uq_user_date) keeps it and a year that already has an
+    answer (uq_user_question_year) keeps it. Rows with year None add only the question.
+    Returns the number of questions and answers actually inserted.
+    """
+    question_texts: dict[str, str] = {}
+    for date_key, question_text, _, _ in rows:
+        question_texts.setdefault(date_key, question_text)
+
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(
+            insert(Question)
+            .values([
+                {"user_id": user_id, "date_key": date_key, "question_text": question_text}
+                for date_key, question_text in question_texts.items()
+            ])
+            .on_conflict_do_nothing(index_elements=[Question.user_id, Question.date_key])
+            .returning(Question.id)
+        )
+        new_questions = len(result.all())
+
+        result = await session.execute(
+            select(Question.date_key, Question.id).where(
+                Question.user_id == user_id,
+                Question.date_key.in_(question_texts)
+            )
+        )
+        question_ids = dict(result.all())
+
+        answers = [
+            {
+                "user_id": user_id,
+                "question_id": question_ids[date_key],
+                "answer_text": answer_text,
+                "answer_date": f"{year}-{date_key}",
+                "year": year,
+            }
+            for date_key, _, year, answer_text in rows
+            if year is not None
+        ]
+        new_answers = 0
+        if answers:
+            result = await session.execute(
+                insert(Answer)
+                .values(answers)
+                .on_conflict_do_nothing(
+                    index_elements=[Answer.user_id, Answer.question_id, Answer.year]
+                )
+                .returning(Answer.id)
+            )
+            new_answers = len(result.all())
+        if new_answers:
+            await rebuild_user_stats(session, user_id)
+
+        await session.commit()
+
+    _invalidate_user_caches(user_id)
+    return new_questions, new_answers
+
+
 async def get_all_users() -> list[User]:
     """Get all users (for scheduler)"""
     async with AsyncSessionLocal() as session:
@@ -144,6 +387,7 @@ async def update_answer_text(answer_id: int, new_text: str) -> bool:
             answer.answer_text = new_text
             answer.updated_at = datetime.utcnow()
             await session.commit()
+            _invalidate_user_caches(answer.user_id)
             return True
         return False
 
@@ -160,7 +404,11 @@ async def update_answer_year(answer_id: int, new_year: int, date_key: str) -> bo
             answer.year = new_year
             answer.answer_date = f"{new_year}-{date_key}"
             answer.updated_at = datetime.utcnow()
+            await session.flush()
+            # Moving an answer to another year is a rare manual edit: recount the user
+            await rebuild_user_stats(session, answer.user_id)
             await session.commit()
+            _invalidate_user_caches(answer.user_id)
             return True
         return False
 
@@ -175,11 +423,43 @@ async def delete_answer(answer_id: int) -> bool:
         
         if answer:
             await session.delete(answer)
+            await session.flush()
+            await record_answer_removed(
+                session, answer.user_id, answer.question_id, answer.answer_date, answer.year
+            )
             await session.commit()
+            _invalidate_user_caches(answer.user_id)
             return True
         return False
 
 
+async def get_user_stats(user_id: int) -> UserStats:
+    """Get the user's stats row (built from their answers on first access)"""
+    async with AsyncSessionLocal() as session:
+        stats = await session.get(UserStats, user_id)
+        if stats is None:
+            await rebuild_user_stats(session, user_id)
+            await session.commit()
+            stats = await session.get(UserStats, user_id)
+        return stats
+
+
+async def rebuild_all_user_stats() -> int:
+    """Recompute stats of every user (consistency job); returns how many were out of sync"""
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(select(User.id))
+        user_ids = list(result.scalars().all())
+
+    out_of_sync = 0
+    for user_id in user_ids:
+        # One short transaction per user so the job does not block answer writes
+        async with AsyncSessionLocal() as session:
+            if await rebuild_user_stats(session, user_id):
+                out_of_sync += 1
+            await session.commit()
+    return out_of_sync
+
+
 async def get_answer_by_id(answer_id: int) -> Optional[Answer]:
     """Get answer by ID"""
     async with AsyncSessionLocal() as session:
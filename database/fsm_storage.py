@@ -0,0 +1,225 @@
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, AsyncGenerator, Dict, Optional, Tuple
+
+from aiogram.fsm.state import State
+from aiogram.fsm.storage.base import (
+    BaseEventIsolation, BaseStorage, DefaultKeyBuilder, StateType, StorageKey
+)
+from aiogram.fsm.storage.memory import MemoryStorage
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.sqlite import insert
+
+import config
+from database.db import AsyncSessionLocal
+from database.models import FsmRecord
+from monitoring.metrics import CACHE_REQUESTS, registry
+
+logger = logging.getLogger(__name__)
+
+CHAT_LOCKS = registry.gauge(
+    "fivebook_chat_locks",
+    "Chats with an update being processed or waiting"
+)
+CHAT_LOCK_WAIT = registry.histogram(
+    "fivebook_chat_lock_wait_seconds",
+    "Time an update waited for the previous update of the same chat",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+)
+
+
+@dataclass(slots=True)
+class _CachedRecord:
+    state: Optional[str] = None
+    data: Dict[str, Any] = field(default_factory=dict)
+    updated_at: datetime = field(default_factory=datetime.utcnow)
+
+
+class SQLiteStorage(BaseStorage):
+    """
+    FSM storage in the `fsm_states` table with a write-through LRU cache
+
+    Every change is written to the database immediately, so a restart does not lose
+    anyone's in-progress flow. States idle for longer than `state_ttl` are treated as
+    empty and removed by `compact()`; the cache holds at most `cache_size` keys.
+    """
+
+    def __init__(self, state_ttl: timedelta, cache_size: int = 10000):
+        self.state_ttl = state_ttl
+        self.cache_size = cache_size
+        self.key_builder = DefaultKeyBuilder(with_bot_id=True, with_destiny=True)
+        self._cache: OrderedDict[str, _CachedRecord] = OrderedDict()
+
+    def _is_expired(self, record: _CachedRecord) -> bool:
+        return datetime.utcnow() - record.updated_at > self.state_ttl
+
+    def _remember(self, key: str, record: _CachedRecord) -> None:
+        self._cache[key] = record
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    async def _load(self, key: str) -> _CachedRecord:
+        record = self._cache.get(key)
+        if record is not None:
+            if not self._is_expired(record):
+                self._cache.move_to_end(key)
+                CACHE_REQUESTS.inc(cache="fsm", result="hit")
+                return record
+            del self._cache[key]
+
+        CACHE_REQUESTS.inc(cache="fsm", result="miss")
+
+        async with AsyncSessionLocal() as session:
+            result = await session.execute(
+                select(FsmRecord).where(FsmRecord.key == key)
+            )
+            row = result.scalar_one_or_none()
+
+        record = _CachedRecord()
+        if row is not None:
+            loaded = _CachedRecord(row.state, json.loads(row.data), row.updated_at)
+            if not self._is_expired(loaded):
+                record = loaded
+        self._remember(key, record)
+        return record
+
+    async def _save(self, key: str, record: _CachedRecord) -> None:
+        """Write a new record for the key; the cache is updated only after the commit"""
+        try:
+            async with AsyncSessionLocal() as session:
+                if record.state is None and not record.data:
+                    # Empty states are not stored: state.clear() just deletes the row
+                    await session.execute(delete(FsmRecord).where(FsmRecord.key == key))
+                else:
+                    values = {
+                        "state": record.state,
+                        "data": json.dumps(record.data, ensure_ascii=False),
+                        "updated_at": record.updated_at,
+                    }
+                    await session.execute(
+                        insert(FsmRecord)
+                        .values(key=key, **values)
+                        .on_conflict_do_update(index_elements=[FsmRecord.key], set_=values)
+                    )
+                await session.commit()
+        except Exception:
+            # Whether the row changed is unknown: the next read goes to the database
+            self._cache.pop(key, None)
+            raise
+        self._remember(key, record)
+
+    async def set_state(self, key: StorageKey, state: StateType = None) -> None:
+        storage_key = self.key_builder.build(key)
+        record = await self._load(storage_key)
+        state = state.state if isinstance(state, State) else state
+        await self._save(storage_key, _CachedRecord(state, record.data))
+
+    async def get_state(self, key: StorageKey) -> Optional[str]:
+        record = await self._load(self.key_builder.build(key))
+        return record.state
+
+    async def set_data(self, key: StorageKey, data: Dict[str, Any]) -> None:
+        storage_key = self.key_builder.build(key)
+        record = await self._load(storage_key)
+        await self._save(storage_key, _CachedRecord(record.state, data.copy()))
+
+    async def get_data(self, key: StorageKey) -> Dict[str, Any]:
+        record = await self._load(self.key_builder.build(key))
+        return record.data.copy()
+
+    async def compact(self) -> int:
+        """Delete states idle for longer than state_ttl from the table and the cache"""
+        cutoff = datetime.utcnow() - self.state_ttl
+        for key in [key for key, record in self._cache.items() if record.updated_at < cutoff]:
+            del self._cache[key]
+
+        async with AsyncSessionLocal() as session:
+            result = await session.execute(
+                delete(FsmRecord).where(FsmRecord.updated_at < cutoff)
+            )
+            await session.commit()
+
+        if result.rowcount:
+            logger.info(f"FSM storage compaction removed {result.rowcount} idle states")
+        return result.rowcount
+
+    async def close(self) -> None:
+        self._cache.clear()
+
+
+@dataclass(slots=True)
+class _ChatLock:
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    users: int = 0
+
+
+class ChatEventIsolation(BaseEventIsolation):
+    """
+    Process updates of one chat one at a time, different chats concurrently
+
+    The dispatcher's FSM middleware takes this lock before reading the state, so the
+    next update of a chat sees the state and data left by the previous one. A lock
+    lives only while some update holds or waits for it, so the dict does not grow
+    with the number of users (unlike aiogram's SimpleEventIsolation).
+    """
+
+    def __init__(self):
+        self._locks: Dict[Tuple[int, int], _ChatLock] = {}
+
+    @asynccontextmanager
+    async def lock(self, key: StorageKey) -> AsyncGenerator[None, None]:
+        chat_key = (key.bot_id, key.chat_id)
+        entry = self._locks.get(chat_key)
+        if entry is None:
+            entry = self._locks[chat_key] = _ChatLock()
+            CHAT_LOCKS.set(len(self._locks))
+        entry.users += 1
+
+        started = time.perf_counter()
+        try:
+            async with entry.lock:
+                CHAT_LOCK_WAIT.observe(time.perf_counter() - started)
+                yield
+        finally:
+            entry.users -= 1
+            if not entry.users:
+                del self._locks[chat_key]
+                CHAT_LOCKS.set(len(self._locks))
+
+    async def close(self) -> None:
+        self._locks.clear()
+
+
+def create_fsm_storage() -> BaseStorage:
+    """Create the FSM storage selected by config.FSM_STORAGE (sqlite, redis or memory)"""
+    state_ttl = timedelta(hours=config.FSM_STATE_TTL_HOURS)
+
+    if config.FSM_STORAGE == "redis":
+        # Optional dependency: pip install redis
+        from aiogram.fsm.storage.redis import RedisStorage
+        return RedisStorage.from_url(
+            config.REDIS_URL,
+            state_ttl=state_ttl,
+            data_ttl=state_ttl
+        )
+
+    if config.FSM_STORAGE == "memory":
+        return MemoryStorage()
+
+    return SQLiteStorage(state_ttl=state_ttl, cache_size=config.FSM_CACHE_SIZE)
+
+
+def create_events_isolation(storage: BaseStorage) -> BaseEventIsolation:
+    """Per-chat update isolation matching the storage: Redis locks are shared between instances"""
+    if config.FSM_STORAGE == "redis":
+        from aiogram.fsm.storage.redis import RedisEventIsolation
+        return RedisEventIsolation(redis=storage.redis)
+
+    return ChatEventIsolation()
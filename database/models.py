@@ -1,7 +1,7 @@
 from datetime import datetime
-from sqlalchemy import BigInteger, String, Text, Integer, DateTime, UniqueConstraint, ForeignKey
+from sqlalchemy import BigInteger, String, Text, Integer, DateTime, JSON, UniqueConstraint, ForeignKey
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
-from typing import List
+from typing import List, Optional
 
 
 class Base(DeclarativeBase):
@@ -66,4 +66,37 @@ class Answer(Base):
     )
 
     def __repr__(self):
-        return f"<Answer(year={self.year}, text={self.answer_text[:30]}...)>"
\ No newline at end of file
+        return f"<Answer(year={self.year}, text={self.answer_text[:30]}...)>"
+
+
+class UserStats(Base):
+    """Per-user statistics kept up to date on every answer change (see database/stats.py)"""
+    __tablename__ = "user_stats"
+
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), primary_key=True)
+    total_answers: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    # Run of consecutive answered days that contains the latest answered day (YYYY-MM-DD)
+    last_run_start: Mapped[Optional[str]] = mapped_column(String(10), nullable=True)
+    last_run_end: Mapped[Optional[str]] = mapped_column(String(10), nullable=True)
+    longest_run: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    longest_run_end: Mapped[Optional[str]] = mapped_column(String(10), nullable=True)
+    # {"2024": 120, ...} - answers per year
+    answers_by_year: Mapped[dict] = mapped_column(JSON, default=dict, nullable=False)
+    # {"1": 200, "2": 35, ...} - how many dates have answers in exactly N years
+    dates_by_years: Mapped[dict] = mapped_column(JSON, default=dict, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<UserStats(user_id={self.user_id}, total_answers={self.total_answers})>"
+
+
+class FsmRecord(Base):
+    __tablename__ = "fsm_states"
+
+    key: Mapped[str] = mapped_column(String(255), primary_key=True)
+    state: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    data: Mapped[str] = mapped_column(Text, nullable=False, default="{}")
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, index=True)
+
+    def __repr__(self):
+        return f"<FsmRecord(key={self.key}, state={self.state})>"
@@ -0,0 +1,154 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from sqlalchemy import event, text
+
+from database.db import AsyncSessionLocal, search_result_cache
+from database.models import Base
+from database.search_cache import normalize_words
+
+# Full-text index over answers (and the text of their questions). The table is kept in
+# sync by triggers; the Alembic migration creates the same objects for existing databases.
+FTS_DDL = (
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS answers_fts USING fts5(
+        answer_text,
+        question_text,
+        user_id,
+        tokenize = 'unicode61 remove_diacritics 2',
+        prefix = '2 3'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS answers_fts_insert AFTER INSERT ON answers BEGIN
+        INSERT INTO answers_fts(rowid, answer_text, question_text, user_id)
+        SELECT new.id, new.answer_text, questions.question_text, new.user_id
+        FROM questions WHERE questions.id = new.question_id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS answers_fts_update AFTER UPDATE OF answer_text, question_id ON answers BEGIN
+        DELETE FROM answers_fts WHERE rowid = old.id;
+        INSERT INTO answers_fts(rowid, answer_text, question_text, user_id)
+        SELECT new.id, new.answer_text, questions.question_text, new.user_id
+        FROM questions WHERE questions.id = new.question_id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS answers_fts_delete AFTER DELETE ON answers BEGIN
+        DELETE FROM answers_fts WHERE rowid = old.id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS questions_fts_update AFTER UPDATE OF question_text ON questions BEGIN
+        UPDATE answers_fts SET question_text = new.question_text
+        WHERE rowid IN (SELECT id FROM answers WHERE question_id = new.id);
+    END
+    """,
+)
+
+# Snippet markers; the caller escapes the snippet and turns them into <b></b>
+MATCH_START = "\x02"
+MATCH_END = "\x03"
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _create_fts(target, connection, **kw):
+    """init_db() (create_all) creates the search index along with the tables"""
+    for statement in FTS_DDL:
+        connection.exec_driver_sql(statement)
+
+
+@dataclass(slots=True)
+class SearchHit:
+    answer_id: int
+    year: int
+    date_key: str
+    question_text: str
+    answer_text: str
+    snippet: str
+
+
+def build_match_query(user_id: int, query: str) -> Optional[str]:
+    """
+    Turn free text into an FTS5 MATCH expression limited to the user's entries
+
+    Every word becomes a quoted prefix term (so FTS syntax in user input is inert and
+    word forms like "отпуск"/"отпуске" match); all words must be present.
+    """
+    words = normalize_words(query)
+    if not words:
+        return None
+    terms = " ".join(f'"{word}"*' for word in words)
+    return f'user_id : "{user_id}" AND {{answer_text question_text}} : ({terms})'
+
+
+async def search_answers(user_id: int, query: str, limit: int, offset: int = 0) -> list[SearchHit]:
+    """Best-matching answers of the user first (bm25, answer text weighs more than the question)"""
+    match = build_match_query(user_id, query)
+    if match is None:
+        return []
+
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(
+            text(
+                """
+                SELECT answers.id, answers.year, questions.date_key, questions.question_text,
+                       answers.answer_text,
+                       snippet(answers_fts, 0, :start, :end, '…', 16),
+                       snippet(answers_fts, 1, :start, :end, '…', 16)
+                FROM answers_fts
+                JOIN answers ON answers.id = answers_fts.rowid
+                JOIN questions ON questions.id = answers.question_id
+                WHERE answers_fts MATCH :match
+                ORDER BY bm25(answers_fts, 1.0, 0.5, 0.0)
+                LIMIT :limit OFFSET :offset
+                """
+            ),
+            {
+                "start": MATCH_START,
+                "end": MATCH_END,
+                "match": match,
+                "limit": limit,
+                "offset": offset,
+            }
+        )
+        rows = result.all()
+
+    return [
+        SearchHit(
+            answer_id=answer_id,
+            year=year,
+            date_key=date_key,
+            question_text=question_text,
+            answer_text=answer_text,
+            # Show the answer fragment unless only the question matched
+            snippet=answer_snippet if MATCH_START in answer_snippet else question_snippet
+        )
+        for answer_id, year, date_key, question_text, answer_text, answer_snippet, question_snippet in rows
+    ]
+
+
+async def search_answers_cached(user_id: int, query: str, limit: int) -> list[SearchHit]:
+    """
+    Up to `limit` best hits, served from the short-lived result cache when possible
+
+    Meant for inline mode, where the same and ever longer queries arrive on every
+    typed character: a narrower query is filtered from a complete cached result.
+    Hits are cached with the snippets of the query that fetched them.
+    """
+    words = normalize_words(query)
+    if not words:
+        return []
+
+    hits = search_result_cache.get(user_id, words)
+    if hits is not None:
+        return hits
+
+    # One extra row tells whether the result is complete (safe to narrow in memory)
+    generation = search_result_cache.generation(user_id)
+    hits = await search_answers(user_id, query, limit + 1)
+    complete = len(hits) <= limit
+    hits = hits[:limit]
+    search_result_cache.put(user_id, words, hits, complete, generation)
+    return hits
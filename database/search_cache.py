@@ -0,0 +1,110 @@
+import re
+import time
+import unicodedata
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Optional, Sequence
+
+from database.date_cache import GenerationTokens
+from monitoring.metrics import CACHE_REQUESTS
+
+_MAX_TERMS = 8
+
+
+def _words(text: str) -> list[str]:
+    """Lowercased words without diacritics, the way the FTS5 unicode61 tokenizer sees them"""
+    decomposed = unicodedata.normalize("NFD", text.lower())
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return re.findall(r"[^\W_]+", stripped)
+
+
+def normalize_words(query: str) -> tuple[str, ...]:
+    """Search terms of a query; also the cache key, so "Море " and "море" share an entry"""
+    return tuple(_words(query)[:_MAX_TERMS])
+
+
+def _matches(words: Sequence[str], texts: Sequence[str]) -> bool:
+    """Every word is a prefix of some token of the texts (same rule as the FTS query)"""
+    tokens = [token for text in texts for token in _words(text)]
+    return all(any(token.startswith(word) for token in tokens) for word in words)
+
+
+def _narrows(cached: Sequence[str], words: Sequence[str]) -> bool:
+    """Results for `words` are a subset of results for `cached`"""
+    return all(any(word.startswith(term) for word in words) for term in cached)
+
+
+@dataclass(slots=True)
+class _Entry:
+    hits: list[Any]
+    # False if the result was cut at the limit and more matches exist
+    complete: bool
+    created_at: float = field(default_factory=time.monotonic)
+
+
+class SearchResultCache:
+    """
+    Short-lived per-user cache of recent search results
+
+    A query that only narrows a cached complete result (the user typed more letters or
+    another word: "мор" -> "море") is answered by filtering that result in memory
+    instead of querying FTS again. Hits must have answer_text and question_text.
+    As in QuestionWindowCache, put() takes the generation() read before the query and
+    drops results read before the last invalidate().
+    """
+
+    def __init__(self, ttl: float, queries_per_user: int = 8, max_users: int = 1000):
+        self.ttl = ttl
+        self.queries_per_user = queries_per_user
+        self.max_users = max_users
+        self._users: OrderedDict[int, OrderedDict[tuple[str, ...], _Entry]] = OrderedDict()
+        self._generations = GenerationTokens(max_users)
+
+    def generation(self, user_id: int) -> object:
+        return self._generations.token(user_id)
+
+    def get(self, user_id: int, words: tuple[str, ...]) -> Optional[list[Any]]:
+        entries = self._users.get(user_id)
+        if entries is None:
+            CACHE_REQUESTS.inc(cache="search", result="miss")
+            return None
+
+        now = time.monotonic()
+        for key in [key for key, entry in entries.items() if now - entry.created_at > self.ttl]:
+            del entries[key]
+
+        entry = entries.get(words)
+        if entry is not None:
+            entries.move_to_end(words)
+            CACHE_REQUESTS.inc(cache="search", result="hit")
+            return entry.hits
+
+        for cached_words, entry in reversed(entries.items()):
+            if entry.complete and _narrows(cached_words, words):
+                hits = [
+                    hit for hit in entry.hits
+                    if _matches(words, (hit.answer_text, hit.question_text))
+                ]
+                # Keep the parent's age: the filtered result is exactly as fresh
+                entries[words] = _Entry(hits, complete=True, created_at=entry.created_at)
+                CACHE_REQUESTS.inc(cache="search", result="hit")
+                return hits
+
+        CACHE_REQUESTS.inc(cache="search", result="miss")
+        return None
+
+    def put(self, user_id: int, words: tuple[str, ...], hits: list[Any], complete: bool, generation: object) -> None:
+        if not self._generations.is_current(user_id, generation):
+            return
+        entries = self._users.setdefault(user_id, OrderedDict())
+        self._users.move_to_end(user_id)
+        entries[words] = _Entry(hits, complete)
+        entries.move_to_end(words)
+        while len(entries) > self.queries_per_user:
+            entries.popitem(last=False)
+        while len(self._users) > self.max_users:
+            self._users.popitem(last=False)
+
+    def invalidate(self, user_id: int) -> None:
+        self._generations.invalidate(user_id)
+        self._users.pop(user_id, None)
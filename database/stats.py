@@ -0,0 +1,200 @@
+from dataclasses import dataclass, fields
+from datetime import date, timedelta
+from typing import Iterable, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database.models import Answer, UserStats
+
+# UserStats is updated in the same transaction as the answer change. Common changes
+# (answering today or the next day, adding or removing an answer outside of the
+# tracked runs) are applied as deltas; anything that can split or merge a tracked run,
+# bulk imports and year changes fall back to rebuild_user_stats, which is also what the
+# nightly consistency job runs.
+
+
+@dataclass(slots=True)
+class _Computed:
+    total_answers: int
+    last_run_start: Optional[str]
+    last_run_end: Optional[str]
+    longest_run: int
+    longest_run_end: Optional[str]
+    answers_by_year: dict
+    dates_by_years: dict
+
+
+def _parse_day(answer_date: str) -> Optional[date]:
+    """Answer date as a date; None for impossible dates like 02-29 of a common year"""
+    try:
+        return date.fromisoformat(answer_date)
+    except ValueError:
+        return None
+
+
+def _compute(rows: Iterable[tuple[str, int, int]]) -> _Computed:
+    """Stats from (answer_date, year, question_id) rows of one user"""
+    total = 0
+    answers_by_year: dict[str, int] = {}
+    years_per_question: dict[int, int] = {}
+    days = []
+    for answer_date, year, question_id in rows:
+        total += 1
+        answers_by_year[str(year)] = answers_by_year.get(str(year), 0) + 1
+        years_per_question[question_id] = years_per_question.get(question_id, 0) + 1
+        day = _parse_day(answer_date)
+        if day is not None:
+            days.append(day)
+
+    dates_by_years: dict[str, int] = {}
+    for years in years_per_question.values():
+        dates_by_years[str(years)] = dates_by_years.get(str(years), 0) + 1
+
+    run_start = run_end = None
+    longest_run, longest_run_end = 0, None
+    for day in sorted(set(days)):
+        if run_end is not None and day == run_end + timedelta(days=1):
+            run_end = day
+        else:
+            run_start = run_end = day
+        run_length = (run_end - run_start).days + 1
+        # On ties the later run wins, same as in record_answer_added
+        if run_length >= longest_run:
+            longest_run, longest_run_end = run_length, run_end
+
+    return _Computed(
+        total_answers=total,
+        last_run_start=run_start and run_start.isoformat(),
+        last_run_end=run_end and run_end.isoformat(),
+        longest_run=longest_run,
+        longest_run_end=longest_run_end and longest_run_end.isoformat(),
+        answers_by_year=answers_by_year,
+        dates_by_years=dates_by_years
+    )
+
+
+async def rebuild_user_stats(session: AsyncSession, user_id: int) -> bool:
+    """
+    Recompute the user's stats from all of their answers (one scan of the user's rows)
+
+    Returns True if the stored stats were missing or differed from the recomputed ones.
+    """
+    result = await session.execute(
+        select(Answer.answer_date, Answer.year, Answer.question_id)
+        .where(Answer.user_id == user_id)
+    )
+    computed = _compute(result.all())
+
+    stats = await session.get(UserStats, user_id)
+    if stats is None:
+        stats = UserStats(user_id=user_id)
+        session.add(stats)
+
+    changed = False
+    for field in fields(computed):
+        value = getattr(computed, field.name)
+        if getattr(stats, field.name) != value:
+            setattr(stats, field.name, value)
+            changed = True
+    return changed
+
+
+async def _question_years(session: AsyncSession, user_id: int, question_id: int) -> int:
+    """Number of years the question is answered in (uses uq_user_question_year)"""
+    result = await session.execute(
+        select(func.count()).select_from(Answer).where(
+            Answer.user_id == user_id,
+            Answer.question_id == question_id
+        )
+    )
+    return result.scalar_one()
+
+
+def _shift(counts: dict, decrement: Optional[str], increment: Optional[str]) -> dict:
+    """Copy of a JSON counter with one key decremented and another incremented"""
+    counts = dict(counts)
+    if decrement is not None:
+        counts[decrement] -= 1
+        if not counts[decrement]:
+            del counts[decrement]
+    if increment is not None:
+        counts[increment] = counts.get(increment, 0) + 1
+    return counts
+
+
+async def record_answer_added(
+    session: AsyncSession, user_id: int, question_id: int, answer_date: str, year: int
+) -> None:
+    """Apply a new answer to the stats; the answer must already be flushed"""
+    stats = await session.get(UserStats, user_id)
+    if stats is None:
+        await rebuild_user_stats(session, user_id)
+        return
+
+    day = _parse_day(answer_date)
+    if day is not None and stats.last_run_end is not None:
+        run_start = date.fromisoformat(stats.last_run_start)
+        run_end = date.fromisoformat(stats.last_run_end)
+        if day == run_end + timedelta(days=1):
+            run_end = day
+        elif day > run_end:
+            run_start = run_end = day
+        else:
+            # An answer before the latest run can join it with an earlier one
+            await rebuild_user_stats(session, user_id)
+            return
+    elif day is not None:
+        run_start = run_end = day
+
+    if day is not None:
+        stats.last_run_start = run_start.isoformat()
+        stats.last_run_end = run_end.isoformat()
+        run_length = (run_end - run_start).days + 1
+        if run_length >= stats.longest_run:
+            stats.longest_run = run_length
+            stats.longest_run_end = stats.last_run_end
+
+    years = await _question_years(session, user_id, question_id)
+    stats.total_answers += 1
+    stats.answers_by_year = _shift(stats.answers_by_year, None, str(year))
+    stats.dates_by_years = _shift(
+        stats.dates_by_years, str(years - 1) if years > 1 else None, str(years)
+    )
+
+
+async def record_answer_removed(
+    session: AsyncSession, user_id: int, question_id: int, answer_date: str, year: int
+) -> None:
+    """Apply a removed answer to the stats; the removal must already be flushed"""
+    stats = await session.get(UserStats, user_id)
+    if stats is None:
+        await rebuild_user_stats(session, user_id)
+        return
+
+    day = _parse_day(answer_date)
+    if day is not None and stats.last_run_end is not None:
+        in_last_run = stats.last_run_start <= answer_date <= stats.last_run_end
+        longest_end = date.fromisoformat(stats.longest_run_end)
+        longest_start = longest_end - timedelta(days=stats.longest_run - 1)
+        if in_last_run or longest_start <= day <= longest_end:
+            # Removing a day from a tracked run splits or shortens it
+            await rebuild_user_stats(session, user_id)
+            return
+
+    years = await _question_years(session, user_id, question_id)
+    stats.total_answers -= 1
+    stats.answers_by_year = _shift(stats.answers_by_year, str(year), None)
+    stats.dates_by_years = _shift(
+        stats.dates_by_years, str(years + 1), str(years) if years else None
+    )
+
+
+def current_streak(stats: UserStats, today: date) -> int:
+    """Days in the latest run if it is still going (ends today or yesterday), else 0"""
+    if stats.last_run_end is None:
+        return 0
+    run_end = date.fromisoformat(stats.last_run_end)
+    if run_end < today - timedelta(days=1):
+        return 0
+    return (run_end - date.fromisoformat(stats.last_run_start)).days + 1
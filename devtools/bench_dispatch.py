@@ -0,0 +1,94 @@
+"""
+Пропускная способность диспетчера на callback-апдейтах
+
+Запуск:
+    python -m devtools.bench_dispatch --updates 20000
+
+Собирает диспетчер как bot.py (все middleware и роутеры, FSM в памяти, база во
+временном каталоге), подставляет сессию, которая отвечает на вызовы Bot API без сети,
+и прогоняет фейковые callback-апдейты через dp.feed_update: сначала обычным обходом
+роутеров, затем с фильтрами роутеров по callback_data (filter_routers_by_callback). Хендлеры выбраны лёгкие
+(без запросов к БД), чтобы время уходило в маршрутизацию и middleware.
+"""
+import argparse
+import asyncio
+import logging
+import os
+import tempfile
+import time
+from typing import List
+
+from aiogram import Bot, Dispatcher
+from aiogram.fsm.storage.memory import MemoryStorage
+from aiogram.types import Update
+
+from devtools.fake_telegram import FakeTelegram, OfflineSession
+
+# callback_data -> хендлер; порядок роутеров в bot.py: settings, ..., date_view, evening_reminder, daily
+CALLBACKS = [
+    "l:xx",                     # settings.set_language (язык не поддерживается - сразу выходит)
+    "cal_noop",                 # date_view.month_grid_noop
+    "morning_yesterday_skip",   # evening_reminder
+    "finish_past_years",        # daily, последний роутер
+    "unknown",                  # нет хендлера: обходятся все
+]
+
+
+async def _run(dp: Dispatcher, bot: Bot, updates: List[Update]) -> float:
+    """Прогнать апдейты по одному, вернуть апдейтов в секунду"""
+    started = time.perf_counter()
+    for update in updates:
+        await dp.feed_update(bot, update)
+    return len(updates) / (time.perf_counter() - started)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Dispatcher throughput on fake callback updates")
+    parser.add_argument("--updates", type=int, default=20000, help="Updates per measurement")
+    parser.add_argument("--users", type=int, default=100, help="Distinct users sending the updates")
+    args = parser.parse_args()
+
+    # Относительный путь к базе из config указывает во временный каталог
+    os.chdir(tempfile.mkdtemp(prefix="fivebook-bench-"))
+
+    import config
+    # Троттлинг не должен отбрасывать апдейты: меряется маршрутизация
+    config.THROTTLE_LIMITS = {"default": (1e9, 10 ** 9)}
+
+    from bot import create_dispatcher
+    from callbacks import filter_routers_by_callback
+    from database import init_db
+
+    await init_db()
+    dp = create_dispatcher(MemoryStorage(), router_filters=False)
+    bot = Bot("42:TEST", session=OfflineSession())
+    fake = FakeTelegram()
+
+    def updates_for(data: str) -> List[Update]:
+        return [
+            Update.model_validate(fake.callback_update(1 + i % args.users, data), context={"bot": bot})
+            for i in range(args.updates)
+        ]
+
+    batches = {data: updates_for(data) for data in CALLBACKS}
+    mixed = [update for group in zip(*batches.values()) for update in group][:args.updates]
+
+    # Прогрев: кэш языков, каталоги, первые FSM-записи
+    await _run(dp, bot, mixed[:args.users * len(CALLBACKS)])
+
+    results = {}
+    for label in ("routers", "filtered"):
+        if label == "filtered":
+            filter_routers_by_callback(dp)
+        results[label] = {data: await _run(dp, bot, batch) for data, batch in batches.items()}
+        results[label]["mixed"] = await _run(dp, bot, mixed)
+
+    print(f"{'callback_data':<24} {'routers':>10} {'filtered':>10}   updates/s")
+    for data in [*CALLBACKS, "mixed"]:
+        before, after = results["routers"][data], results["filtered"][data]
+        print(f"{data:<24} {before:>10.0f} {after:>10.0f}   x{after / before:.2f}")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)
+    asyncio.run(main())
@@ -0,0 +1,251 @@
+"""
+Локальный фейковый Bot API для проверки webhook-режима без Telegram
+
+Запуск:
+    python -m devtools.fake_telegram --port 8081
+
+Затем бот в другом терминале:
+    BOT_TOKEN=42:TEST TELEGRAM_API_URL=http://127.0.0.1:8081 \\
+    WEBHOOK_URL=http://127.0.0.1:8080 WEBHOOK_SECRET=local python bot.py
+
+Фейковый сервер отвечает на вызовы Bot API правдоподобными объектами, ждёт setWebhook
+и прогоняет через webhook сценарий апдейтов, печатая ответы бота и время от отправки
+апдейта до первого ответного вызова API.
+
+Без сервера: OfflineSession подставляется в Bot(session=...) и отвечает на вызовы
+в том же процессе, а апдейты из FakeTelegram.text_update/callback_update подаются
+в dp.feed_update (так работают tests/ и devtools/bench_dispatch.py).
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import logging
+import time
+from typing import Any, Dict, List, Optional
+
+from aiogram.client.session.base import BaseSession
+from aiogram.methods import TelegramMethod
+from aiogram.types import Chat, Message, User
+from aiohttp import ClientSession, web
+
+logger = logging.getLogger(__name__)
+
+BOT_USER = {"id": 42, "is_bot": True, "first_name": "Fivebook", "username": "fivebook_bot"}
+
+# Методы, которые возвращают Message
+_MESSAGE_METHODS = {
+    "sendMessage", "editMessageText", "editMessageReplyMarkup", "sendDocument",
+}
+
+
+class FakeTelegram:
+    """Фейковый Bot API: записывает вызовы бота и шлёт ему апдейты на webhook"""
+
+    def __init__(self):
+        self.calls: List[Dict[str, Any]] = []
+        self.webhook_url: Optional[str] = None
+        self.webhook_secret: Optional[str] = None
+        self.webhook_set = asyncio.Event()
+        self._call_added = asyncio.Condition()
+        self._update_ids = itertools.count(1)
+        self._message_ids = itertools.count(1000)
+
+    def create_app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_post("/bot{token}/{method}", self._handle_method)
+        return app
+
+    async def _read_params(self, request: web.Request) -> Dict[str, Any]:
+        if request.content_type == "multipart/form-data":
+            params = {}
+            async for part in await request.multipart():
+                params[part.name] = part.filename or await part.text()
+            return params
+        return dict(await request.post())
+
+    async def _handle_method(self, request: web.Request) -> web.Response:
+        method = request.match_info["method"]
+        params = await self._read_params(request)
+
+        if method == "setWebhook":
+            self.webhook_url = params.get("url")
+            self.webhook_secret = params.get("secret_token")
+            self.webhook_set.set()
+        elif method == "deleteWebhook":
+            self.webhook_url = None
+            self.webhook_set.clear()
+
+        async with self._call_added:
+            self.calls.append({"method": method, "params": params, "time": time.perf_counter()})
+            self._call_added.notify_all()
+
+        return web.json_response({"ok": True, "result": self._result(method, params)})
+
+    def _result(self, method: str, params: Dict[str, Any]) -> Any:
+        if method == "getMe":
+            return BOT_USER
+        if method in _MESSAGE_METHODS:
+            chat_id = int(params.get("chat_id", 0))
+            message_id = params.get("message_id") or next(self._message_ids)
+            return {
+                "message_id": int(message_id),
+                "date": int(time.time()),
+                "chat": {"id": chat_id, "type": "private"},
+                "from": BOT_USER,
+                "text": params.get("text", ""),
+            }
+        return True
+
+    def _user(self, user_id: int) -> Dict[str, Any]:
+        return {"id": user_id, "is_bot": False, "first_name": f"user{user_id}", "language_code": "ru"}
+
+    def text_update(self, user_id: int, text: str) -> Dict[str, Any]:
+        update_id = next(self._update_ids)
+        message = {
+            "message_id": next(self._message_ids),
+            "date": int(time.time()),
+            "chat": {"id": user_id, "type": "private"},
+            "from": self._user(user_id),
+            "text": text,
+        }
+        if text.startswith("/"):
+            command = text.split()[0]
+            message["entities"] = [{"type": "bot_command", "offset": 0, "length": len(command)}]
+        return {"update_id": update_id, "message": message}
+
+    def callback_update(self, user_id: int, data: str, message_id: int = 1) -> Dict[str, Any]:
+        update_id = next(self._update_ids)
+        return {
+            "update_id": update_id,
+            "callback_query": {
+                "id": str(update_id),
+                "from": self._user(user_id),
+                "chat_instance": str(user_id),
+                "data": data,
+                "message": {
+                    "message_id": message_id,
+                    "date": int(time.time()),
+                    "chat": {"id": user_id, "type": "private"},
+                    "from": BOT_USER,
+                    "text": "…",
+                },
+            },
+        }
+
+    async def deliver(self, session: ClientSession, update: Dict[str, Any], timeout: float = 5.0) -> Optional[float]:
+        """
+        Отправить апдейт на webhook и дождаться первого ответного вызова API
+
+        Возвращает время до ответа в секундах или None, если бот не ответил за timeout.
+        """
+        headers = {"Content-Type": "application/json"}
+        if self.webhook_secret:
+            headers["X-Telegram-Bot-Api-Secret-Token"] = self.webhook_secret
+
+        calls_before = len(self.calls)
+        started = time.perf_counter()
+        async with session.post(self.webhook_url, data=json.dumps(update), headers=headers) as response:
+            if response.status != 200:
+                logger.warning(f"Webhook responded with HTTP {response.status}")
+                return None
+
+        try:
+            async with self._call_added:
+                await asyncio.wait_for(
+                    self._call_added.wait_for(lambda: len(self.calls) > calls_before),
+                    timeout
+                )
+        except asyncio.TimeoutError:
+            return None
+        return self.calls[calls_before]["time"] - started
+
+
+class OfflineSession(BaseSession):
+    """
+    Сессия aiogram без сети: на любой метод отвечает правдоподобным результатом
+    и записывает вызовы в calls
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.calls: List[TelegramMethod] = []
+        self._message_ids = itertools.count(1000)
+
+    async def make_request(self, bot, method, timeout=None):
+        self.calls.append(method)
+        if method.__returning__ is User:
+            return User.model_validate(BOT_USER)
+        if method.__returning__ is Message:
+            return Message(
+                message_id=next(self._message_ids),
+                date=int(time.time()),
+                chat=Chat(id=getattr(method, "chat_id", 0), type="private"),
+                from_user=User.model_validate(BOT_USER),
+                text=getattr(method, "text", None) or ""
+            )
+        return True
+
+    def texts(self) -> List[str]:
+        """Тексты отправленных и отредактированных сообщений по порядку"""
+        return [method.text for method in self.calls if isinstance(getattr(method, "text", None), str)]
+
+    async def stream_content(self, *args, **kwargs):
+        yield b""
+
+    async def close(self):
+        pass
+
+
+async def run_scenario(fake: FakeTelegram, user_id: int, steps: List[str]) -> None:
+    """Прогнать шаги сценария: текст, команда или 'cb:<callback_data>'"""
+    async with ClientSession() as session:
+        for step in steps:
+            if step.startswith("cb:"):
+                update = fake.callback_update(user_id, step[3:])
+            else:
+                update = fake.text_update(user_id, step)
+
+            calls_before = len(fake.calls)
+            elapsed = await fake.deliver(session, update)
+            if elapsed is None:
+                print(f"{step!r}: no response")
+                continue
+
+            # Даём боту дописать остальные вызовы этого апдейта
+            await asyncio.sleep(0.2)
+            print(f"{step!r}: first API call after {elapsed * 1000:.1f} ms")
+            for call in fake.calls[calls_before:]:
+                text = str(call["params"].get("text", ""))
+                print(f"    {call['method']} {text[:60]!r}")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Fake Telegram Bot API for webhook mode")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8081)
+    parser.add_argument("--user-id", type=int, default=1)
+    parser.add_argument(
+        "steps", nargs="*",
+        default=["/start", "/today"],
+        help="Updates to send: text, /command or cb:<callback_data>"
+    )
+    args = parser.parse_args()
+
+    fake = FakeTelegram()
+    runner = web.AppRunner(fake.create_app(), access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, args.host, args.port).start()
+    print(f"Fake Bot API on http://{args.host}:{args.port}, waiting for setWebhook...")
+
+    try:
+        await fake.webhook_set.wait()
+        print(f"Webhook registered: {fake.webhook_url}")
+        await run_scenario(fake, args.user_id, args.steps)
+    finally:
+        await runner.cleanup()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
@@ -0,0 +1,102 @@
+from typing import Optional
+
+from aiogram.fsm.context import FSMContext
+
+
+class FlowContext:
+    """
+    Данные текущего сценария пользователя (вместо разрозненных ключей в FSM data)
+
+    Загружается один раз на апдейт в FlowContextMiddleware и сохраняется один раз
+    в конце обработки, если что-то изменилось. В storage хранится компактный dict
+    с короткими ключами и только заполненными полями; производные значения
+    (full_date, date_label) вычисляются, а не хранятся.
+    """
+
+    # поле -> ключ в storage
+    _KEYS = {
+        "user_db_id": "u",
+        "question_id": "q",
+        "date_key": "d",
+        "year": "y",
+        "past_year": "p",
+        "answer_id": "a",
+        "answer_year": "ay",
+        "mode": "m",
+        "search_query": "s",
+    }
+
+    __slots__ = ("_state", "_dirty", *_KEYS)
+
+    def __init__(self, state: FSMContext, data: Optional[dict] = None):
+        self._state = state
+        self._dirty = False
+        data = data or {}
+        for field, key in self._KEYS.items():
+            setattr(self, field, data.get(key))
+
+    user_db_id: Optional[int]
+    question_id: Optional[int]
+    # Дата сценария в формате MM-DD
+    date_key: Optional[str]
+    # Год, за который пишется ответ (текущий, вчерашний, выбранный в календаре)
+    year: Optional[int]
+    # Прошлый год, выбранный при вводе ответов за прошлые годы
+    past_year: Optional[int]
+    # Ответ, который редактируется, и его год
+    answer_id: Optional[int]
+    answer_year: Optional[int]
+    # Режим выбора года: 'import', 'edit', 'change_year'
+    mode: Optional[str]
+    # Последний запрос /search (для перелистывания результатов)
+    search_query: Optional[str]
+
+    @classmethod
+    async def load(cls, state: FSMContext) -> "FlowContext":
+        """Прочитать контекст из FSM storage"""
+        return cls(state, await state.get_data())
+
+    @property
+    def full_date(self) -> Optional[str]:
+        """Полная дата ответа YYYY-MM-DD"""
+        if self.year is None or self.date_key is None:
+            return None
+        return f"{self.year}-{self.date_key}"
+
+    @property
+    def date_label(self) -> Optional[str]:
+        """Дата в формате ДД.ММ для отображения пользователю"""
+        if self.date_key is None:
+            return None
+        month, day = self.date_key.split("-")
+        return f"{day}.{month}"
+
+    def update(self, **fields) -> None:
+        """Изменить поля контекста (сохранятся в конце обработки апдейта)"""
+        for field, value in fields.items():
+            if field not in self._KEYS:
+                raise AttributeError(f"FlowContext has no field {field!r}")
+            setattr(self, field, value)
+        self._dirty = True
+
+    def pack(self) -> dict:
+        """Компактное представление для FSM storage"""
+        packed = {}
+        for field, key in self._KEYS.items():
+            value = getattr(self, field)
+            if value is not None:
+                packed[key] = value
+        return packed
+
+    async def flush(self) -> None:
+        """Записать контекст в storage, если он менялся"""
+        if self._dirty:
+            await self._state.set_data(self.pack())
+            self._dirty = False
+
+    async def clear(self) -> None:
+        """Завершить сценарий: сбросить FSM-состояние и все поля контекста"""
+        await self._state.clear()
+        for field in self._KEYS:
+            setattr(self, field, None)
+        self._dirty = False
@@ -1,3 +1,3 @@
-from handlers import start, daily, commands, settings, date_view
+from handlers import start, daily, commands, settings, date_view, admin, export, file_import, search, inline, stats
 
-__all__ = ["start", "daily", "commands", "settings", "date_view"]
\ No newline at end of file
+__all__ = ["start", "daily", "commands", "settings", "date_view", "admin", "export", "file_import", "search", "inline", "stats"]
\ No newline at end of file
@@ -0,0 +1,67 @@
+import asyncio
+import logging
+from datetime import datetime
+
+from aiogram import Bot, Router, F
+from aiogram.filters import Command, CommandObject
+from aiogram.types import Message, BufferedInputFile
+
+import config
+from i18n import Catalog
+from monitoring.profiler import profile_for, is_profiling
+
+logger = logging.getLogger(__name__)
+
+router = Router(name=__name__)
+# Все команды этого роутера доступны только администраторам из config.ADMIN_IDS
+router.message.filter(F.from_user.id.in_(config.ADMIN_IDS))
+
+_DEFAULT_PROFILE_SECONDS = 30
+_MAX_PROFILE_SECONDS = 300
+
+# Фоновые задачи профилирования (держим ссылки, чтобы их не собрал GC)
+_profile_tasks: set[asyncio.Task] = set()
+
+
+async def _run_profile(bot: Bot, chat_id: int, seconds: int, i18n: Catalog):
+    """Снять профиль и отправить отчёт файлом (i18n - каталог администратора, запустившего профиль)"""
+    try:
+        report = await profile_for(seconds)
+    except Exception as e:
+        logger.error(f"Profiling failed: {e}")
+        await bot.send_message(chat_id, i18n("admin.profile_failed", error=e))
+        return
+
+    filename = f"profile_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
+    await bot.send_document(
+        chat_id,
+        BufferedInputFile(report.encode("utf-8"), filename=filename),
+        caption=i18n("admin.profile_caption", seconds=seconds)
+    )
+
+
+@router.message(Command("profile"))
+async def cmd_profile(message: Message, command: CommandObject, i18n: Catalog):
+    """Команда /profile [секунды] - снять профиль работающего бота"""
+    seconds = _DEFAULT_PROFILE_SECONDS
+    if command.args:
+        try:
+            seconds = int(command.args.strip())
+        except ValueError:
+            await message.answer(i18n("admin.profile_usage"))
+            return
+
+    if seconds < 1 or seconds > _MAX_PROFILE_SECONDS:
+        await message.answer(i18n("admin.profile_bad_duration", max_seconds=_MAX_PROFILE_SECONDS))
+        return
+
+    if is_profiling():
+        await message.answer(i18n("admin.profile_busy"))
+        return
+
+    await message.answer(i18n("admin.profile_started", seconds=seconds))
+
+    # Профиль снимаем в фоне, чтобы не держать обработку апдейта всё это время
+    task = asyncio.create_task(_run_profile(message.bot, message.chat.id, seconds, i18n))
+    _profile_tasks.add(task)
+    task.add_done_callback(_profile_tasks.discard)
@@ -3,41 +3,19 @@ from aiogram.filters import Command
 from aiogram.types import Message
 from aiogram.fsm.context import FSMContext
 from handlers.daily import show_daily_question
+from flow import FlowContext
+from i18n import Catalog
 
-router = Router()
+router = Router(name=__name__)
 
 
 @router.message(Command("today"))
-async def cmd_today(message: Message, state: FSMContext):
+async def cmd_today(message: Message, state: FSMContext, flow: FlowContext, i18n: Catalog):
     """Команда /today - показать сегодняшний вопрос"""
-    await show_daily_question(message, state)
+    await show_daily_question(message, state, flow, i18n)
 
 
 @router.message(Command("help"))
-async def cmd_help(message: Message):
+async def cmd_help(message: Message, i18n: Catalog):
     """Команда /help - показать справку"""
-    help_text = (
-        "<b>Бот-пятибук 🌿</b>\n\n"
-        "Я помогаю тебе отвечать на один и тот же вопрос каждый год в одну и ту же дату, "
-        "чтобы наблюдать, как ты меняешься со временем.\n\n"
-        "<b>Как это работает:</b>\n"
-        "• Каждый день в установленное время я присылаю напоминание\n"
-        "• В первый раз ты создаёшь вопрос для этого дня\n"
-        "• Затем отвечаешь на него\n"
-        "• В следующие годы в эту же дату я покажу твои прошлые ответы\n\n"
-        "<b>Доступные команды:</b>\n"
-        "/today - посмотреть/ответить на сегодняшний вопрос\n"
-        "/date - посмотреть записи за выбранную дату\n"
-        "/import - добавить ответы за прошлые годы\n"
-        "/settings - изменить время напоминаний\n"
-        "/help - показать эту справку\n\n"
-        "Если есть вопросы или пожелания, напиши @твой_username 💚"
-    )
-    
-    await message.answer(help_text, parse_mode="HTML")
-
-
-@router.message(Command("import"))
-async def cmd_import(message: Message, state: FSMContext):
-    """Команда /import - добавить ответы за прошлые годы"""
-    await show_daily_question(message, state)
\ No newline at end of file
+    await message.answer(i18n("help.text"), parse_mode="HTML")
@@ -1,13 +1,15 @@
-from aiogram import Router, F
+from aiogram import Router
 from aiogram.types import Message, CallbackQuery
 from aiogram.fsm.context import FSMContext
 from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
+from callbacks import ButtonFilter, PastAnswersPage, PastYear
 from states import QuestionStates, PastYearsStates, EditAnswerStates
 from database import (
     get_or_create_user,
     get_question_for_date,
     create_question,
     get_answers_for_question,
+    get_answers_page,
     get_answer_for_year,
     create_answer,
     update_answer_text,
@@ -15,103 +17,98 @@ from database import (
     delete_answer,
     get_answer_by_id
 )
-from utils import is_editable, get_time_left_str, is_leap_year, get_year_keyboard
+from utils import is_editable, get_time_left_str, is_leap_year, edit_text_if_changed
+from flow import FlowContext
+from i18n import Catalog
+from keyboards import (
+    FIRST_YEAR,
+    get_year_keyboard,
+    daily_question_keyboard,
+    first_answer_keyboard,
+    back_keyboard,
+    answer_actions_keyboard,
+    more_past_years_keyboard,
+    delete_confirm_keyboard
+)
 from datetime import datetime
 
 
 
-router = Router()
+router = Router(name=__name__)
+
+# Прошлые ответы показываются страницами: не больше PAST_ANSWERS_PAGE_SIZE ответов
+# и не больше PAST_ANSWERS_PAGE_CHARS символов (лимит сообщения Telegram - 4096)
+PAST_ANSWERS_PAGE_SIZE = 5
+PAST_ANSWERS_PAGE_CHARS = 3500
 
 
 async def validate_and_process_year(
     year: int,
-    state: FSMContext,
+    flow: FlowContext,
     mode: str,
-    message_or_callback,
-    date_key: str = None,
-    user_db_id: int = None,
-    question_id: int = None,
-    current_year: int = None
+    i18n: Catalog
 ) -> tuple[bool, str]:
     """
     Валидирует год и возвращает результат валидации
     
     Args:
         year: Год для валидации
-        state: FSM контекст
+        flow: Контекст сценария (дата, вопрос, текущий год)
         mode: Режим ('import', 'edit', 'change_year')
-        message_or_callback: Message или CallbackQuery объект
-        date_key: Ключ даты (MM-DD)
-        user_db_id: ID пользователя в БД
-        question_id: ID вопроса
-        current_year: Текущий год
+        i18n: Каталог сообщений пользователя (текст ошибки)
         
     Returns:
         tuple[bool, str]: (успех, сообщение об ошибке или None)
     """
-    # Получаем данные из state если не переданы
-    data = await state.get_data()
-    if date_key is None:
-        date_key = data.get("date_key")
-    if user_db_id is None:
-        user_db_id = data.get("user_db_id")
-    if question_id is None:
-        question_id = data.get("question_id")
-    if current_year is None:
-        current_year = data.get("current_year", datetime.now().year)
-    
-    # Проверка диапазона: 2019 <= year <= current_year
-    if year < 2019:
-        return False, f"Год должен быть не меньше 2019. Выбери другой год."
+    date_key = flow.date_key
+    current_year = flow.year or datetime.now().year
+    
+    # Проверка диапазона: FIRST_YEAR <= year <= current_year
+    if year < FIRST_YEAR:
+        return False, i18n("year.too_early", first_year=FIRST_YEAR)
     
     if year > current_year:
-        return False, f"Год должен быть не больше текущего ({current_year}). Выбери другой год."
+        return False, i18n("year.too_late", current_year=current_year)
     
     # Для режима импорта: год должен быть меньше текущего
     if mode == "import" and year >= current_year:
-        return False, f"Для импорта год должен быть меньше текущего ({current_year}). Выбери другой год."
+        return False, i18n("year.import_not_past", current_year=current_year)
     
     # Проверка для 29 февраля - год должен быть високосным
     if date_key == "02-29" and not is_leap_year(year):
-        return False, f"Год {year} не является високосным, поэтому ответ за 29 февраля в этот год внести нельзя."
+        return False, i18n("year.not_leap", year=year)
     
     # Проверка уникальности (для импорта и изменения года)
     # Для режима "edit" не проверяем уникальность, так как мы ищем существующий ответ
     if mode in ("import", "change_year"):
-        existing_answer = await get_answer_for_year(user_db_id, question_id, year)
+        existing_answer = await get_answer_for_year(flow.user_db_id, flow.question_id, year)
         
         # Для изменения года проверяем что это не тот же ответ
         if mode == "change_year":
-            edit_answer_id = data.get("edit_answer_id")
-            if existing_answer and existing_answer.id != edit_answer_id:
-                return False, f"Ответ за {year} год уже существует. Выбери другой год."
+            if existing_answer and existing_answer.id != flow.answer_id:
+                return False, i18n("year.answer_exists", year=year)
         elif existing_answer:
-            return False, f"Ответ за {year} год уже существует. Выбери другой год."
+            return False, i18n("year.answer_exists", year=year)
     
     return True, None
 
 
-async def show_daily_question(message: Message, state: FSMContext, date_key: str = None):
+async def show_daily_question(
+    message: Message, state: FSMContext, flow: FlowContext, i18n: Catalog, date_key: str = None
+):
     """Показать вопрос дня (используется и для /today, и для напоминаний)"""
     user = await get_or_create_user(message.from_user.id)
     
-    # Определяем дату
+    # Определяем дату (date_key можно передать извне, например из scheduler)
+    now = datetime.now()
     if date_key is None:
-        now = datetime.now()
         date_key = now.strftime("%m-%d")
-        current_year = now.year
-        full_date = now.strftime("%Y-%m-%d")
-    else:
-        # Для случая когда передаём дату извне (из scheduler)
-        now = datetime.now()
-        current_year = now.year
-        full_date = now.strftime("%Y-%m-%d")
+    current_year = now.year
     
-    # Сохраняем контекст в state
-    await state.update_data(
+    # Сохраняем контекст сценария
+    flow.update(
         date_key=date_key,
-        current_year=current_year,
-        full_date=full_date,
+        year=current_year,
         user_db_id=user.id
     )
     
@@ -120,238 +117,259 @@ async def show_daily_question(message: Message, state: FSMContext, date_key: str
     
     if question is None:
         # Сценарий A: Первый год, вопрос не создан
-        await message.answer(
-            "Привет! Время для записи в пятибук 🌿\n\n"
-            "Сегодня у тебя ещё нет вопроса для этого дня.\n"
-            "Напиши, пожалуйста, вопрос дня, который хочешь задавать себе каждый год в эту дату."
-        )
+        await message.answer(i18n("today.no_question"))
         await state.set_state(QuestionStates.waiting_for_question)
     else:
         # Сценарий B: Вопрос уже существует
-        await state.update_data(question_id=question.id)
+        flow.update(question_id=question.id)
         
         # Проверяем, есть ли уже ответ за текущий год
         existing_answer = await get_answer_for_year(user.id, question.id, current_year)
         
         if existing_answer:
             # Ответ уже есть
-            keyboard = InlineKeyboardMarkup(inline_keyboard=[
-                [InlineKeyboardButton(
-                    text="📖 Посмотреть прошлые ответы",
-                    callback_data="show_past_answers"
-                )],
-                [InlineKeyboardButton(
-                    text="➕ Добавить ответы за прошлые годы",
-                    callback_data="add_past_years"
-                )]
-            ])
+            keyboard = daily_question_keyboard(i18n, current_year, True)
             
             await message.answer(
-                f"Сегодняшний вопрос:\n\n"
-                f"<b>{question.question_text}</b>\n\n"
-                f"Ты уже ответила на этот вопрос в {current_year} году ✅\n\n"
-                f"Твой ответ:\n{existing_answer.answer_text}",
+                i18n(
+                    "today.answered",
+                    question=question.question_text,
+                    year=current_year,
+                    answer=existing_answer.answer_text
+                ),
                 parse_mode="HTML",
                 reply_markup=keyboard
             )
         else:
             # Показываем вопрос и кнопки
-            keyboard = InlineKeyboardMarkup(inline_keyboard=[
-                [InlineKeyboardButton(
-                    text="📖 Посмотреть прошлые ответы",
-                    callback_data="show_past_answers"
-                )],
-                [InlineKeyboardButton(
-                    text=f"✍️ Написать ответ за {current_year}",
-                    callback_data="write_answer"
-                )],
-                [InlineKeyboardButton(
-                    text="➕ Добавить ответы за прошлые годы",
-                    callback_data="add_past_years"
-                )]
-            ])
+            keyboard = daily_question_keyboard(i18n, current_year, False)
             
             await message.answer(
-                f"Сегодняшний вопрос для тебя:\n\n"
-                f"<b>{question.question_text}</b>\n\n"
-                f"Хочешь сначала посмотреть прошлые ответы или сразу написать новый?",
+                i18n("today.question", question=question.question_text),
                 parse_mode="HTML",
                 reply_markup=keyboard
             )
 
 
 @router.message(QuestionStates.waiting_for_question)
-async def process_new_question(message: Message, state: FSMContext):
+async def process_new_question(message: Message, state: FSMContext, flow: FlowContext, i18n: Catalog):
     """Обработка нового вопроса"""
     question_text = message.text.strip()
     
     if not question_text:
-        await message.answer("Вопрос не может быть пустым. Попробуй ещё раз.")
+        await message.answer(i18n("common.empty_question"))
         return
     
-    data = await state.get_data()
-    date_key = data.get("date_key")
-    user_db_id = data.get("user_db_id")
-    
     # Создаём вопрос
-    question = await create_question(user_db_id, date_key, question_text)
+    question = await create_question(flow.user_db_id, flow.date_key, question_text)
     
-    await state.update_data(question_id=question.id)
+    flow.update(question_id=question.id)
     
-    await message.answer(
-        "Отлично, вопрос сохранён ✅\n\n"
-        "Теперь напиши свой ответ за этот год."
-    )
+    await message.answer(i18n("today.question_saved"))
     
     await state.set_state(QuestionStates.waiting_for_answer)
 
 
 @router.message(QuestionStates.waiting_for_answer)
-async def process_answer(message: Message, state: FSMContext):
+async def process_answer(message: Message, flow: FlowContext, i18n: Catalog):
     """Обработка ответа на вопрос"""
     answer_text = message.text.strip()
     
     if not answer_text:
-        await message.answer("Ответ не может быть пустым. Попробуй ещё раз.")
+        await message.answer(i18n("common.empty_answer"))
         return
     
-    data = await state.get_data()
-    user_db_id = data.get("user_db_id")
-    question_id = data.get("question_id")
-    current_year = data.get("current_year")
-    full_date = data.get("full_date")
+    user_db_id = flow.user_db_id
+    question_id = flow.question_id
+    current_year = flow.year
+    full_date = flow.full_date
     
     # Проверяем, нет ли уже ответа за этот год
     existing_answer = await get_answer_for_year(user_db_id, question_id, current_year)
     
     if existing_answer:
-        await message.answer(
-            f"На этот год ответ уже сохранён ✅\n\n"
-            f"Функцию редактирования добавим позже."
-        )
-        await state.clear()
+        await message.answer(i18n("today.already_answered"))
+        await flow.clear()
         return
     
     # Создаём ответ
     await create_answer(user_db_id, question_id, answer_text, full_date, current_year)
     
     # Проверяем, сколько это по счёту ответ (первый или нет)
-    all_answers = await get_answers_for_question(question_id)
+    all_answers = await get_answers_for_question(user_db_id, question_id)
     
     if len(all_answers) == 1:
         # Первый ответ - предлагаем внести прошлые годы
-        keyboard = InlineKeyboardMarkup(inline_keyboard=[
-            [InlineKeyboardButton(
-                text="➕ Внести прошлые годы",
-                callback_data="add_past_years"
-            )],
-            [InlineKeyboardButton(
-                text="⏭ Нет, на сегодня хватит",
-                callback_data="skip_past_years"
-            )]
-        ])
+        keyboard = first_answer_keyboard(i18n)
         
-        await message.answer(
-            "Записано 💚\n\n"
-            "Хочешь добавить свои ответы за прошлые годы из бумажного пятибука, "
-            "чтобы я показывал тебе полную историю?",
-            reply_markup=keyboard
-        )
+        await message.answer(i18n("today.first_answer_saved"), reply_markup=keyboard)
     else:
         # Не первый ответ
-        await message.answer(
-            f"Супер, ответ за {current_year} сохранён ✅"
-        )
-        await state.clear()
+        await message.answer(i18n("today.answer_saved", year=current_year))
+        await flow.clear()
+
+
+async def build_past_answers_page(
+    user_id: int,
+    question_id: int,
+    has_current_year: bool,
+    i18n: Catalog,
+    after_year: int | None = None,
+    before_year: int | None = None
+) -> tuple[str, InlineKeyboardMarkup | None] | None:
+    """
+    Формирует одну страницу прошлых ответов
+    
+    Загружается только одна страница (keyset-пагинация по году): ответы после after_year
+    или перед before_year. Страница заканчивается раньше PAST_ANSWERS_PAGE_SIZE ответов,
+    если следующий не помещается в PAST_ANSWERS_PAGE_CHARS.
+    
+    Args:
+        user_id: ID пользователя в БД (ответы других пользователей не показываются)
+        question_id: ID вопроса
+        has_current_year: Есть ли ответ за текущий год (влияет на подпись и кнопки)
+        i18n: Каталог сообщений пользователя
+        after_year: Показать ответы после этого года
+        before_year: Показать ответы до этого года
+        
+    Returns:
+        (текст, клавиатура) или None, если ответов нет
+    """
+    backwards = before_year is not None
+    # Лишний ответ показывает, есть ли ещё страница в эту сторону
+    answers = await get_answers_page(
+        user_id,
+        question_id,
+        limit=PAST_ANSWERS_PAGE_SIZE + 1,
+        after_year=after_year,
+        before_year=before_year
+    )
+    if not answers:
+        return None
+    
+    # Набираем страницу от её начала в сторону листания
+    candidates = list(reversed(answers)) if backwards else answers
+    page = []
+    page_chars = 0
+    for answer in candidates[:PAST_ANSWERS_PAGE_SIZE]:
+        line = f"• <b>{answer.year}</b>: {answer.answer_text}"
+        if len(line) > PAST_ANSWERS_PAGE_CHARS:
+            line = line[:PAST_ANSWERS_PAGE_CHARS - 1] + "…"
+        if page and page_chars + len(line) > PAST_ANSWERS_PAGE_CHARS:
+            break
+        page.append((answer.year, line))
+        page_chars += len(line)
+    more_in_direction = len(page) < len(candidates)
+    if backwards:
+        page.reverse()
+    
+    has_earlier = more_in_direction if backwards else after_year is not None
+    has_later = True if backwards else more_in_direction
+    
+    text = i18n("past.title") + "\n\n" + "\n\n".join(line for _, line in page) + "\n\n"
+    text += i18n("past.has_current_year") if has_current_year else i18n("past.write_current_year")
+    
+    buttons = []
+    navigation = []
+    if has_earlier:
+        navigation.append(InlineKeyboardButton(
+            text=i18n("button.earlier"),
+            callback_data=PastAnswersPage(question_id, has_current_year, True, page[0][0]).pack()
+        ))
+    if has_later:
+        navigation.append(InlineKeyboardButton(
+            text=i18n("button.later"),
+            callback_data=PastAnswersPage(question_id, has_current_year, False, page[-1][0]).pack()
+        ))
+    if navigation:
+        buttons.append(navigation)
+    if has_current_year:
+        buttons.append([InlineKeyboardButton(
+            text=i18n("button.edit_or_delete_answer"),
+            callback_data="edit_answer"
+        )])
+    
+    keyboard = InlineKeyboardMarkup(inline_keyboard=buttons) if buttons else None
+    return text, keyboard
 
 
-@router.callback_query(F.data == "show_past_answers")
-async def show_past_answers(callback: CallbackQuery, state: FSMContext):
-    """Показать прошлые ответы"""
+@router.callback_query(ButtonFilter("show_past_answers"))
+async def show_past_answers(callback: CallbackQuery, state: FSMContext, flow: FlowContext, i18n: Catalog):
+    """Показать прошлые ответы (первая страница)"""
     await callback.answer()
     
-    data = await state.get_data()
-    question_id = data.get("question_id")
-    current_year = data.get("current_year")
+    question_id = flow.question_id
     
     if not question_id:
-        await callback.message.answer("Произошла ошибка. Попробуй команду /today")
+        await callback.message.answer(i18n("common.error_try_today"))
         return
     
-    # Получаем все ответы
-    answers = await get_answers_for_question(question_id)
+    # Проверяем, есть ли ответ за текущий год
+    has_current_year = await get_answer_for_year(flow.user_db_id, question_id, flow.year) is not None
+    page = await build_past_answers_page(flow.user_db_id, question_id, has_current_year, i18n)
     
-    if not answers:
-        await callback.message.answer(
-            "У тебя пока нет ответов на этот вопрос.\n"
-            "Напиши свой первый ответ! ✍️"
-        )
+    if page is None:
+        await callback.message.answer(i18n("past.none"))
         await state.set_state(QuestionStates.waiting_for_answer)
         return
     
-    # Формируем список ответов
-    answers_text = "Твои ответы в этот день:\n\n"
-    for answer in answers:
-        answers_text += f"• <b>{answer.year}</b>: {answer.answer_text}\n\n"
+    text, keyboard = page
+    await callback.message.answer(text, parse_mode="HTML", reply_markup=keyboard)
     
-    # Проверяем, есть ли ответ за текущий год
-    has_current_year = any(a.year == current_year for a in answers)
-    
-    if has_current_year:
-        keyboard = InlineKeyboardMarkup(inline_keyboard=[
-        [InlineKeyboardButton(
-            text="✏️ Изменить/удалить ответ",
-            callback_data="edit_answer"
-        )]
-    ])
+    if not has_current_year:
+        await state.set_state(QuestionStates.waiting_for_answer)
+
+
+@router.callback_query(PastAnswersPage.filter())
+async def show_past_answers_page(callback: CallbackQuery, callback_data: PastAnswersPage, i18n: Catalog):
+    """Перелистнуть страницу прошлых ответов"""
+    await callback.answer()
     
-        await callback.message.answer(
-        answers_text + "На этот год ответ уже есть ✅",
-        parse_mode="HTML",
-        reply_markup=keyboard
+    # question_id пришёл от клиента: страница строится только из ответов этого пользователя
+    user = await get_or_create_user(callback.from_user.id)
+    year = callback_data.year
+    page = await build_past_answers_page(
+        user.id,
+        callback_data.question_id,
+        has_current_year=callback_data.has_current_year,
+        i18n=i18n,
+        after_year=None if callback_data.backwards else year,
+        before_year=year if callback_data.backwards else None
     )
-    else:
-        await callback.message.answer(
-            answers_text + "Теперь напиши свой ответ за этот год 👇",
-            parse_mode="HTML"
-        )
-        await state.set_state(QuestionStates.waiting_for_answer)
+    if page is None:
+        return
+    
+    text, keyboard = page
+    await edit_text_if_changed(callback.message, text, reply_markup=keyboard, parse_mode="HTML")
 
 
-@router.callback_query(F.data == "write_answer")
-async def write_answer_callback(callback: CallbackQuery, state: FSMContext):
+@router.callback_query(ButtonFilter("write_answer"))
+async def write_answer_callback(callback: CallbackQuery, state: FSMContext, flow: FlowContext, i18n: Catalog):
     """Начать писать ответ"""
     await callback.answer()
     
-    data = await state.get_data()
-    current_year = data.get("current_year")
-    
-    await callback.message.answer(
-        f"Отлично! Напиши свой ответ за {current_year} год 👇"
-    )
+    await callback.message.answer(i18n("today.write_answer", year=flow.year))
     
     await state.set_state(QuestionStates.waiting_for_answer)
 
 
-@router.callback_query(F.data == "add_past_years")
-async def add_past_years_start(callback: CallbackQuery, state: FSMContext):
+@router.callback_query(ButtonFilter("add_past_years"))
+async def add_past_years_start(callback: CallbackQuery, state: FSMContext, flow: FlowContext, i18n: Catalog):
     """Начать добавление ответов за прошлые годы"""
     await callback.answer()
     
-    # Проверяем что в state есть все нужные данные
-    data = await state.get_data()
-    if not data.get("question_id") or not data.get("date_key"):
-        await callback.message.answer("Произошла ошибка. Попробуй команду /today")
+    # Проверяем что в контексте есть все нужные данные
+    if not flow.question_id or not flow.date_key:
+        await callback.message.answer(i18n("common.error_try_today"))
         return
     
     # Сохраняем режим выбора года
-    await state.update_data(year_selection_mode="import")
+    flow.update(mode="import")
     
     year_keyboard = get_year_keyboard()
     
     await callback.message.answer(
-        "За какой год хочешь внести ответ?\n\n"
-        "Выбери год из списка или напиши год вручную:",
+        i18n("past_years.choose_year"),
         parse_mode="HTML",
         reply_markup=year_keyboard
     )
@@ -359,158 +377,95 @@ async def add_past_years_start(callback: CallbackQuery, state: FSMContext):
     await state.set_state(PastYearsStates.waiting_for_year)
 
 
-@router.callback_query(F.data == "skip_past_years")
-async def skip_past_years(callback: CallbackQuery, state: FSMContext):
+@router.callback_query(ButtonFilter("skip_past_years"))
+async def skip_past_years(callback: CallbackQuery, flow: FlowContext, i18n: Catalog):
     """Пропустить ввод прошлых годов"""
     await callback.answer()
     
-    await callback.message.answer(
-        "Хорошо! Ты всегда можешь добавить прошлые ответы позже через команду /today 💚"
-    )
+    await callback.message.answer(i18n("past_years.skipped"))
     
-    await state.clear()
+    await flow.clear()
 
 
-@router.callback_query(F.data.startswith("select_year:"))
-async def process_year_selection_callback(callback: CallbackQuery, state: FSMContext):
+@router.callback_query(PastYear.filter())
+async def process_year_selection_callback(
+    callback: CallbackQuery, callback_data: PastYear, state: FSMContext, flow: FlowContext, i18n: Catalog
+):
     """Обработка выбора года через callback"""
     await callback.answer()
     
-    # Извлекаем год из callback_data
-    year_str = callback.data.split(":")[1]
-    try:
-        year = int(year_str)
-    except ValueError:
-        await callback.message.answer("Ошибка: неверный формат года")
-        return
+    year = callback_data.year
     
-    # Определяем режим из state
-    data = await state.get_data()
-    mode = data.get("year_selection_mode", "import")
+    # Определяем режим из контекста
+    mode = flow.mode or "import"
     
     # Валидация года
-    is_valid, error_msg = await validate_and_process_year(
-        year=year,
-        state=state,
-        mode=mode,
-        message_or_callback=callback,
-        date_key=data.get("date_key"),
-        user_db_id=data.get("user_db_id"),
-        question_id=data.get("question_id"),
-        current_year=data.get("current_year", datetime.now().year)
-    )
+    is_valid, error_msg = await validate_and_process_year(year=year, flow=flow, mode=mode, i18n=i18n)
     
     if not is_valid:
         year_keyboard = get_year_keyboard()
         await callback.message.answer(
-            f"{error_msg}\n\nВыбери другой год:",
+            i18n("year.choose_another", error=error_msg),
             reply_markup=year_keyboard
         )
         return
     
     # Обработка в зависимости от режима
     if mode == "import":
-        # Сохраняем год в state и просим ответ
-        await state.update_data(past_year=year)
-        await callback.message.answer(
-            f"Напиши свой ответ за {year} год 👇"
-        )
+        # Сохраняем год в контексте и просим ответ
+        flow.update(past_year=year)
+        await callback.message.answer(i18n("past_years.write_answer", year=year))
         await state.set_state(PastYearsStates.waiting_for_past_answer)
         
     elif mode == "edit":
         # Показываем ответ за выбранный год
-        user_db_id = data.get("user_db_id")
-        question_id = data.get("question_id")
-        answer = await get_answer_for_year(user_db_id, question_id, year)
+        answer = await get_answer_for_year(flow.user_db_id, flow.question_id, year)
         
         if not answer:
-            keyboard = InlineKeyboardMarkup(inline_keyboard=[
-                [InlineKeyboardButton(
-                    text="⬅️ Назад",
-                    callback_data="back_to_today"
-                )]
-            ])
-            await callback.message.answer(
-                f"Ответа за {year} год нет.\n\n"
-                f"Попробуй другой год или вернись назад.",
-                reply_markup=keyboard
-            )
+            keyboard = back_keyboard(i18n)
+            await callback.message.answer(i18n("edit.no_answer", year=year), reply_markup=keyboard)
             return
         
-        # Сохраняем ID ответа в state
-        await state.update_data(edit_answer_id=answer.id, edit_answer_year=year)
+        # Сохраняем ID ответа в контексте
+        flow.update(answer_id=answer.id, answer_year=year)
         
         # Проверяем лимит 24 часа
         if is_editable(answer):
             # Можно редактировать
-            time_left = get_time_left_str(answer)
+            time_left = get_time_left_str(answer, i18n)
             
-            keyboard = InlineKeyboardMarkup(inline_keyboard=[
-                [InlineKeyboardButton(
-                    text="✏️ Изменить текст",
-                    callback_data="edit_text"
-                )],
-                [InlineKeyboardButton(
-                    text="📅 Изменить год",
-                    callback_data="edit_year"
-                )],
-                [InlineKeyboardButton(
-                    text="🗑 Удалить ответ",
-                    callback_data="delete_answer"
-                )],
-                [InlineKeyboardButton(
-                    text="⬅️ Назад",
-                    callback_data="back_to_today"
-                )]
-            ])
+            keyboard = answer_actions_keyboard(i18n)
             
             await callback.message.answer(
-                f"Сейчас у тебя сохранён ответ за {year} год:\n\n"
-                f"<i>{answer.answer_text}</i>\n\n"
-                f"⏰ На редактирование {time_left}\n\n"
-                f"Что хочешь сделать?",
+                i18n("edit.current_answer", year=year, answer=answer.answer_text, time_left=time_left),
                 parse_mode="HTML",
                 reply_markup=keyboard
             )
         else:
             # Прошло больше 24 часов
-            keyboard = InlineKeyboardMarkup(inline_keyboard=[
-                [InlineKeyboardButton(
-                    text="⬅️ Назад",
-                    callback_data="back_to_today"
-                )]
-            ])
+            keyboard = back_keyboard(i18n)
             
-            await callback.message.answer(
-                f"Ответ за {year} год нельзя изменить или удалить — "
-                f"он был сохранён более 24 часов назад.\n\n"
-                f"В пятибуке ответы фиксируются как часть истории 💛",
-                reply_markup=keyboard
-            )
+            await callback.message.answer(i18n("edit.locked", year=year), reply_markup=keyboard)
     
     elif mode == "change_year":
         # Изменяем год ответа
-        answer_id = data.get("edit_answer_id")
-        old_year = data.get("edit_answer_year")
-        date_key = data.get("date_key")
+        answer_id = flow.answer_id
+        old_year = flow.answer_year
+        date_key = flow.date_key
         
         # Обновляем год
         success = await update_answer_year(answer_id, year, date_key)
         
         if success:
-            await callback.message.answer(
-                f"Год для этого ответа изменён с {old_year} на {year} ✅"
-            )
+            await callback.message.answer(i18n("edit.year_changed", old_year=old_year, year=year))
         else:
-            await callback.message.answer(
-                "Произошла ошибка при обновлении. Попробуй ещё раз."
-            )
+            await callback.message.answer(i18n("common.update_error"))
         
-        await state.clear()
+        await flow.clear()
 
 
 @router.message(PastYearsStates.waiting_for_year)
-async def process_past_year(message: Message, state: FSMContext):
+async def process_past_year(message: Message, state: FSMContext, flow: FlowContext, i18n: Catalog):
     """Обработка ввода года для прошлого ответа (ручной ввод)"""
     
     year_text = message.text.strip()
@@ -521,68 +476,44 @@ async def process_past_year(message: Message, state: FSMContext):
     except ValueError:
         year_keyboard = get_year_keyboard()
         await message.answer(
-            "Пожалуйста, выбери год из списка или введи год числом (2019-текущий):",
+            i18n("year.not_a_number", first_year=FIRST_YEAR),
             parse_mode="HTML",
             reply_markup=year_keyboard
         )
         return
     
     # Валидация года
-    data = await state.get_data()
-    is_valid, error_msg = await validate_and_process_year(
-        year=year,
-        state=state,
-        mode="import",
-        message_or_callback=message,
-        date_key=data.get("date_key"),
-        user_db_id=data.get("user_db_id"),
-        question_id=data.get("question_id"),
-        current_year=data.get("current_year")
-    )
+    is_valid, error_msg = await validate_and_process_year(year=year, flow=flow, mode="import", i18n=i18n)
     
     if not is_valid:
         year_keyboard = get_year_keyboard()
-        keyboard = InlineKeyboardMarkup(inline_keyboard=[
-            [InlineKeyboardButton(
-                text="Выбрать другой год",
-                callback_data="add_past_years"
-            )],
-            [InlineKeyboardButton(
-                text="Закончить",
-                callback_data="finish_past_years"
-            )]
-        ])
         await message.answer(
-            f"{error_msg}\n\n"
-            f"Выбери год из списка или попробуй другой:",
+            i18n("year.choose_from_list", error=error_msg),
             reply_markup=year_keyboard
         )
         return
     
-    # Сохраняем год в state и просим ответ
-    await state.update_data(past_year=year)
+    # Сохраняем год в контексте и просим ответ
+    flow.update(past_year=year)
     
-    await message.answer(
-        f"Напиши свой ответ за {year} год 👇"
-    )
+    await message.answer(i18n("past_years.write_answer", year=year))
     
     await state.set_state(PastYearsStates.waiting_for_past_answer)
 
 
 @router.message(PastYearsStates.waiting_for_past_answer)
-async def process_past_answer(message: Message, state: FSMContext):
+async def process_past_answer(message: Message, flow: FlowContext, i18n: Catalog):
     """Обработка ответа за прошлый год"""
     answer_text = message.text.strip()
     
     if not answer_text:
-        await message.answer("Ответ не может быть пустым. Попробуй ещё раз.")
+        await message.answer(i18n("common.empty_answer"))
         return
     
-    data = await state.get_data()
-    user_db_id = data.get("user_db_id")
-    question_id = data.get("question_id")
-    past_year = data.get("past_year")
-    date_key = data.get("date_key")
+    user_db_id = flow.user_db_id
+    question_id = flow.question_id
+    past_year = flow.past_year
+    date_key = flow.date_key
     
     # Формируем полную дату для прошлого года
     past_date = f"{past_year}-{date_key}"
@@ -591,49 +522,32 @@ async def process_past_answer(message: Message, state: FSMContext):
     await create_answer(user_db_id, question_id, answer_text, past_date, past_year)
     
     # Предлагаем добавить ещё или закончить
-    keyboard = InlineKeyboardMarkup(inline_keyboard=[
-        [InlineKeyboardButton(
-            text="➕ Добавить ещё год",
-            callback_data="add_past_years"
-        )],
-        [InlineKeyboardButton(
-            text="✅ Закончить",
-            callback_data="finish_past_years"
-        )]
-    ])
-    
-    await message.answer(
-        f"Ответ за {past_year} сохранён ✅\n\n"
-        f"Хочешь добавить ещё один год?",
-        reply_markup=keyboard
-    )
+    keyboard = more_past_years_keyboard(i18n)
+    
+    await message.answer(i18n("past_years.answer_saved", year=past_year), reply_markup=keyboard)
 
 
-@router.callback_query(F.data == "finish_past_years")
-async def finish_past_years(callback: CallbackQuery, state: FSMContext):
+@router.callback_query(ButtonFilter("finish_past_years"))
+async def finish_past_years(callback: CallbackQuery, flow: FlowContext, i18n: Catalog):
     """Завершить ввод прошлых годов"""
     await callback.answer()
     
-    await callback.message.answer(
-        "Готово 💚\n\n"
-        "Теперь в эту дату я буду показывать тебе все сохранённые ответы за прошлые годы."
-    )
+    await callback.message.answer(i18n("past_years.finished"))
     
-    await state.clear()
+    await flow.clear()
 
-@router.callback_query(F.data == "edit_answer")
-async def edit_answer_start(callback: CallbackQuery, state: FSMContext):
+@router.callback_query(ButtonFilter("edit_answer"))
+async def edit_answer_start(callback: CallbackQuery, state: FSMContext, flow: FlowContext, i18n: Catalog):
     """Начать редактирование/удаление ответа"""
     await callback.answer()
     
     # Сохраняем режим выбора года
-    await state.update_data(year_selection_mode="edit")
+    flow.update(mode="edit")
     
     year_keyboard = get_year_keyboard()
     
     await callback.message.answer(
-        "За какой год хочешь изменить или удалить ответ?\n\n"
-        "Выбери год из списка или напиши год вручную:",
+        i18n("edit.choose_year"),
         parse_mode="HTML",
         reply_markup=year_keyboard
     )
@@ -642,7 +556,7 @@ async def edit_answer_start(callback: CallbackQuery, state: FSMContext):
 
 
 @router.message(EditAnswerStates.waiting_for_year_to_edit)
-async def process_year_to_edit(message: Message, state: FSMContext):
+async def process_year_to_edit(message: Message, flow: FlowContext, i18n: Catalog):
     """Обработка выбора года для редактирования"""
     year_text = message.text.strip()
     
@@ -650,173 +564,109 @@ async def process_year_to_edit(message: Message, state: FSMContext):
     try:
         year = int(year_text)
     except ValueError:
-        await message.answer(
-            "Пожалуйста, введи год числом, например: <b>2021</b>",
-            parse_mode="HTML"
-        )
+        await message.answer(i18n("year.enter_number"), parse_mode="HTML")
         return
     
-    data = await state.get_data()
-    user_db_id = data.get("user_db_id")
-    question_id = data.get("question_id")
-    
     # Ищем ответ за этот год
-    answer = await get_answer_for_year(user_db_id, question_id, year)
+    answer = await get_answer_for_year(flow.user_db_id, flow.question_id, year)
     
     if not answer:
-        keyboard = InlineKeyboardMarkup(inline_keyboard=[
-            [InlineKeyboardButton(
-                text="⬅️ Назад",
-                callback_data="back_to_today"
-            )]
-        ])
+        keyboard = back_keyboard(i18n)
         
-        await message.answer(
-            f"Ответа за {year} год нет.\n\n"
-            f"Попробуй другой год или вернись назад.",
-            reply_markup=keyboard
-        )
+        await message.answer(i18n("edit.no_answer", year=year), reply_markup=keyboard)
         return
     
-    # Сохраняем ID ответа в state
-    await state.update_data(edit_answer_id=answer.id, edit_answer_year=year)
+    # Сохраняем ID ответа в контексте
+    flow.update(answer_id=answer.id, answer_year=year)
     
     # Проверяем лимит 24 часа
     if is_editable(answer):
         # Можно редактировать
-        time_left = get_time_left_str(answer)
+        time_left = get_time_left_str(answer, i18n)
         
-        keyboard = InlineKeyboardMarkup(inline_keyboard=[
-            [InlineKeyboardButton(
-                text="✏️ Изменить текст",
-                callback_data="edit_text"
-            )],
-            [InlineKeyboardButton(
-                text="📅 Изменить год",
-                callback_data="edit_year"
-            )],
-            [InlineKeyboardButton(
-                text="🗑 Удалить ответ",
-                callback_data="delete_answer"
-            )],
-            [InlineKeyboardButton(
-                text="⬅️ Назад",
-                callback_data="back_to_today"
-            )]
-        ])
+        keyboard = answer_actions_keyboard(i18n)
         
         await message.answer(
-            f"Сейчас у тебя сохранён ответ за {year} год:\n\n"
-            f"<i>{answer.answer_text}</i>\n\n"
-            f"⏰ На редактирование {time_left}\n\n"
-            f"Что хочешь сделать?",
+            i18n("edit.current_answer", year=year, answer=answer.answer_text, time_left=time_left),
             parse_mode="HTML",
             reply_markup=keyboard
         )
     else:
         # Прошло больше 24 часов
-        keyboard = InlineKeyboardMarkup(inline_keyboard=[
-            [InlineKeyboardButton(
-                text="⬅️ Назад",
-                callback_data="back_to_today"
-            )]
-        ])
+        keyboard = back_keyboard(i18n)
         
-        await message.answer(
-            f"Ответ за {year} год нельзя изменить или удалить — "
-            f"он был сохранён более 24 часов назад.\n\n"
-            f"В пятибуке ответы фиксируются как часть истории 💛",
-            reply_markup=keyboard
-        )
+        await message.answer(i18n("edit.locked", year=year), reply_markup=keyboard)
 
 
-@router.callback_query(F.data == "edit_text")
-async def edit_text_start(callback: CallbackQuery, state: FSMContext):
+@router.callback_query(ButtonFilter("edit_text"))
+async def edit_text_start(callback: CallbackQuery, state: FSMContext, flow: FlowContext, i18n: Catalog):
     """Начать изменение текста ответа"""
     await callback.answer()
     
-    data = await state.get_data()
-    answer_id = data.get("edit_answer_id")
-    year = data.get("edit_answer_year")
+    answer_id = flow.answer_id
+    year = flow.answer_year
     
     # Проверяем что ответ всё ещё можно редактировать
     answer = await get_answer_by_id(answer_id)
     if not answer or not is_editable(answer):
-        await callback.message.answer(
-            "⚠️ Время на редактирование истекло (прошло больше 24 часов)."
-        )
-        await state.clear()
+        await callback.message.answer(i18n("edit.expired"))
+        await flow.clear()
         return
     
-    await callback.message.answer(
-        f"Напиши новый текст ответа за {year} год 👇"
-    )
+    await callback.message.answer(i18n("edit.write_new_text", year=year))
     
     await state.set_state(EditAnswerStates.waiting_for_new_text)
 
 
 @router.message(EditAnswerStates.waiting_for_new_text)
-async def process_new_text(message: Message, state: FSMContext):
+async def process_new_text(message: Message, flow: FlowContext, i18n: Catalog):
     """Обработка нового текста ответа"""
     new_text = message.text.strip()
     
     if not new_text:
-        await message.answer("Текст не может быть пустым. Попробуй ещё раз.")
+        await message.answer(i18n("common.empty_text"))
         return
     
-    data = await state.get_data()
-    answer_id = data.get("edit_answer_id")
-    year = data.get("edit_answer_year")
+    answer_id = flow.answer_id
+    year = flow.answer_year
     
     # Финальная проверка времени
     answer = await get_answer_by_id(answer_id)
     if not answer or not is_editable(answer):
-        await message.answer(
-            "⚠️ Время на редактирование истекло (прошло больше 24 часов)."
-        )
-        await state.clear()
+        await message.answer(i18n("edit.expired"))
+        await flow.clear()
         return
     
     # Обновляем текст
     success = await update_answer_text(answer_id, new_text)
     
     if success:
-        await message.answer(
-            f"Ответ за {year} год обновлён ✅"
-        )
+        await message.answer(i18n("edit.text_updated", year=year))
     else:
-        await message.answer(
-            "Произошла ошибка при обновлении. Попробуй ещё раз."
-        )
+        await message.answer(i18n("common.update_error"))
     
-    await state.clear()
+    await flow.clear()
 
 
-@router.callback_query(F.data == "edit_year")
-async def edit_year_start(callback: CallbackQuery, state: FSMContext):
+@router.callback_query(ButtonFilter("edit_year"))
+async def edit_year_start(callback: CallbackQuery, state: FSMContext, flow: FlowContext, i18n: Catalog):
     """Начать изменение года ответа"""
     await callback.answer()
     
-    data = await state.get_data()
-    answer_id = data.get("edit_answer_id")
-    
     # Проверяем что ответ всё ещё можно редактировать
-    answer = await get_answer_by_id(answer_id)
+    answer = await get_answer_by_id(flow.answer_id)
     if not answer or not is_editable(answer):
-        await callback.message.answer(
-            "⚠️ Время на редактирование истекло (прошло больше 24 часов)."
-        )
-        await state.clear()
+        await callback.message.answer(i18n("edit.expired"))
+        await flow.clear()
         return
     
     # Сохраняем режим выбора года
-    await state.update_data(year_selection_mode="change_year")
+    flow.update(mode="change_year")
     
     year_keyboard = get_year_keyboard()
     
     await callback.message.answer(
-        "На какой год нужно заменить?\n\n"
-        "Выбери год из списка или напиши год вручную:",
+        i18n("edit.choose_new_year"),
         parse_mode="HTML",
         reply_markup=year_keyboard
     )
@@ -825,7 +675,7 @@ async def edit_year_start(callback: CallbackQuery, state: FSMContext):
 
 
 @router.message(EditAnswerStates.waiting_for_new_year)
-async def process_new_year(message: Message, state: FSMContext):
+async def process_new_year(message: Message, flow: FlowContext, i18n: Catalog):
     """Обработка нового года для ответа (ручной ввод)"""
     year_text = message.text.strip()
     
@@ -835,42 +685,30 @@ async def process_new_year(message: Message, state: FSMContext):
     except ValueError:
         year_keyboard = get_year_keyboard()
         await message.answer(
-            "Пожалуйста, выбери год из списка или введи год числом (2019-текущий):",
+            i18n("year.not_a_number", first_year=FIRST_YEAR),
             parse_mode="HTML",
             reply_markup=year_keyboard
         )
         return
     
-    data = await state.get_data()
-    answer_id = data.get("edit_answer_id")
-    date_key = data.get("date_key")
-    old_year = data.get("edit_answer_year")
+    answer_id = flow.answer_id
+    date_key = flow.date_key
+    old_year = flow.answer_year
     
     # Финальная проверка времени
     answer = await get_answer_by_id(answer_id)
     if not answer or not is_editable(answer):
-        await message.answer(
-            "⚠️ Время на редактирование истекло (прошло больше 24 часов)."
-        )
-        await state.clear()
+        await message.answer(i18n("edit.expired"))
+        await flow.clear()
         return
     
     # Валидация года
-    is_valid, error_msg = await validate_and_process_year(
-        year=new_year,
-        state=state,
-        mode="change_year",
-        message_or_callback=message,
-        date_key=date_key,
-        user_db_id=data.get("user_db_id"),
-        question_id=data.get("question_id"),
-        current_year=data.get("current_year", datetime.now().year)
-    )
+    is_valid, error_msg = await validate_and_process_year(year=new_year, flow=flow, mode="change_year", i18n=i18n)
     
     if not is_valid:
         year_keyboard = get_year_keyboard()
         await message.answer(
-            f"{error_msg}\n\nВыбери другой год:",
+            i18n("year.choose_another", error=error_msg),
             reply_markup=year_keyboard
         )
         return
@@ -879,91 +717,67 @@ async def process_new_year(message: Message, state: FSMContext):
     success = await update_answer_year(answer_id, new_year, date_key)
     
     if success:
-        await message.answer(
-            f"Год для этого ответа изменён с {old_year} на {new_year} ✅"
-        )
+        await message.answer(i18n("edit.year_changed", old_year=old_year, year=new_year))
     else:
-        await message.answer(
-            "Произошла ошибка при обновлении. Попробуй ещё раз."
-        )
+        await message.answer(i18n("common.update_error"))
     
-    await state.clear()
+    await flow.clear()
 
-@router.callback_query(F.data == "delete_answer")
-async def delete_answer_confirm(callback: CallbackQuery, state: FSMContext):
+@router.callback_query(ButtonFilter("delete_answer"))
+async def delete_answer_confirm(callback: CallbackQuery, flow: FlowContext, i18n: Catalog):
     """Подтверждение удаления ответа"""
     await callback.answer()
     
-    data = await state.get_data()
-    answer_id = data.get("edit_answer_id")
-    year = data.get("edit_answer_year")
+    answer_id = flow.answer_id
+    year = flow.answer_year
     
     # Проверяем что ответ всё ещё можно удалить
     answer = await get_answer_by_id(answer_id)
     if not answer or not is_editable(answer):
-        await callback.message.answer(
-            "⚠️ Время на удаление истекло (прошло больше 24 часов)."
-        )
-        await state.clear()
+        await callback.message.answer(i18n("delete.expired"))
+        await flow.clear()
         return
     
-    keyboard = InlineKeyboardMarkup(inline_keyboard=[
-        [InlineKeyboardButton(
-            text="🗑 Да, удалить",
-            callback_data="confirm_delete"
-        )],
-        [InlineKeyboardButton(
-            text="⬅️ Отмена",
-            callback_data="back_to_today"
-        )]
-    ])
+    keyboard = delete_confirm_keyboard(i18n)
     
     await callback.message.answer(
-        f"Точно удалить ответ за {year} год?\n\n"
-        f"<i>{answer.answer_text}</i>",
+        i18n("delete.confirm", year=year, answer=answer.answer_text),
         parse_mode="HTML",
         reply_markup=keyboard
     )    
 
 
-@router.callback_query(F.data == "confirm_delete")
-async def delete_answer_execute(callback: CallbackQuery, state: FSMContext):
+@router.callback_query(ButtonFilter("confirm_delete"))
+async def delete_answer_execute(callback: CallbackQuery, flow: FlowContext, i18n: Catalog):
     """Выполнение удаления ответа"""
     await callback.answer()
     
-    data = await state.get_data()
-    answer_id = data.get("edit_answer_id")
-    year = data.get("edit_answer_year")
+    answer_id = flow.answer_id
+    year = flow.answer_year
     
     # Финальная проверка времени
     answer = await get_answer_by_id(answer_id)
     if not answer or not is_editable(answer):
-        await callback.message.answer(
-            "⚠️ Время на удаление истекло (прошло больше 24 часов)."
-        )
-        await state.clear()
+        await callback.message.answer(i18n("delete.expired"))
+        await flow.clear()
         return
     
     # Удаляем ответ
     success = await delete_answer(answer_id)
     
     if success:
-        await callback.message.answer(
-            f"Ответ за {year} год удалён ❌"
-        )
+        await callback.message.answer(i18n("delete.done", year=year))
     else:
-        await callback.message.answer(
-            "Произошла ошибка при удалении. Попробуй ещё раз."
-        )
+        await callback.message.answer(i18n("common.delete_error"))
     
-    await state.clear()
+    await flow.clear()
 
 
-@router.callback_query(F.data == "back_to_today")
-async def back_to_today(callback: CallbackQuery, state: FSMContext):
+@router.callback_query(ButtonFilter("back_to_today"))
+async def back_to_today(callback: CallbackQuery, state: FSMContext, flow: FlowContext, i18n: Catalog):
     """Вернуться к сегодняшнему вопросу"""
     await callback.answer()
-    await state.clear()
+    await flow.clear()
     
     # Создаём фейковое сообщение для повторного вызова show_daily_question
-    await show_daily_question(callback.message, state)
\ No newline at end of file
+    await show_daily_question(callback.message, state, flow, i18n)
\ No newline at end of file
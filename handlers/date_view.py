@@ -1,14 +1,33 @@
+import asyncio
+import calendar
+import logging
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 
-from aiogram import Router, F
+from aiogram import Router
 from aiogram.filters import Command
 from aiogram.fsm.context import FSMContext
 from aiogram.types import Message, CallbackQuery, InlineKeyboardMarkup, InlineKeyboardButton
 
+import config
+from callbacks import (
+    ButtonFilter,
+    CalendarMonth,
+    CalendarDay,
+    DateShift,
+    BackdatedEntry,
+    CalendarSelectYear,
+    CalendarYearPicked,
+    CalendarCustomYear,
+    CalendarCreateQuestion,
+    CalendarAddAnswer,
+    CalendarEditAnswer,
+    CalendarDeleteAnswer
+)
 from database import (
     get_or_create_user,
-    get_question_for_date,
-    get_answers_for_question,
+    get_question_with_answers,
+    get_month_summary,
     create_question,
     create_answer,
     get_answer_for_year
@@ -21,8 +40,14 @@ from states import (
     CalendarEditStates,
     CalendarYearSelectionStates
 )
+from flow import FlowContext
+from i18n import Catalog
+from keyboards import calendar_year_keyboard
+from monitoring import current_trace
+from utils import edit_text_if_changed, remember_rendered
 
-router = Router()
+router = Router(name=__name__)
+logger = logging.getLogger(__name__)
 
 _BASE_YEAR = 2024  # високосный год, чтобы корректно работать с 29 февраля
 
@@ -58,40 +83,39 @@ def _parse_user_date(date_text: str) -> str | None:
     return date_obj.strftime("%m-%d")
 
 
-async def _render_date_view(target: Message | CallbackQuery, date_key: str, year: int = None, state: FSMContext = None):
+async def _render_date_view(
+    target: Message | CallbackQuery, date_key: str, i18n: Catalog, year: int = None, state: FSMContext = None
+):
     """Отображает вопрос и ответы для указанной даты."""
     telegram_id = target.from_user.id
     user = await get_or_create_user(telegram_id)
-    question = await get_question_for_date(user.id, date_key)
-    answers = await get_answers_for_question(question.id) if question else []
+    question = await get_question_with_answers(user.id, date_key)
+    answers = question.answers if question else []
 
     date_label = _format_date_label(date_key)
-    lines: list[str] = [f"📅 Дата: <b>{date_label}</b>"]
+    lines: list[str] = [i18n("date.title", date=date_label)]
 
     # Строим клавиатуру
     keyboard_buttons = []
 
     # Сценарий 1: Вопроса нет
     if not question:
-        lines.append(
-            f"Для даты {date_label} у тебя пока нет вопроса.\n"
-            f"Хочешь создать вопрос для этой даты?"
-        )
+        lines.append(i18n("date.no_question", date=date_label))
 
         # Кнопки: Создать вопрос
         keyboard_buttons.append([
             InlineKeyboardButton(
-                text="➕ Создать вопрос",
-                callback_data=f"calendar_create_question:{date_key}:{datetime.now().year}"
+                text=i18n("button.create_question"),
+                callback_data=CalendarCreateQuestion(date_key, datetime.now().year).pack()
             )
         ])
     else:
         # Показываем вопрос
-        lines.append(f"<b>Вопрос:</b>\n{question.question_text}")
+        lines.append(i18n("date.question", question=question.question_text))
 
         # Показываем все ответы по годам
         if answers:
-            lines.append("<b>Ответы по годам:</b>")
+            lines.append(i18n("date.answers_title"))
             for answer in answers:
                 # Проверяем, можно ли редактировать/удалять этот ответ (меньше 24 часов)
                 time_since_creation = datetime.utcnow() - answer.created_at
@@ -104,22 +128,22 @@ async def _render_date_view(target: Message | CallbackQuery, date_key: str, year
                 if can_edit:
                     keyboard_buttons.append([
                         InlineKeyboardButton(
-                            text=f"✏️ Изменить ответ за {answer.year}",
-                            callback_data=f"calendar_edit_answer:{date_key}:{answer.year}:{answer.id}"
+                            text=i18n("button.edit_answer_for_year", year=answer.year),
+                            callback_data=CalendarEditAnswer(date_key, answer.year, answer.id).pack()
                         ),
                         InlineKeyboardButton(
-                            text=f"🗑 Удалить за {answer.year}",
-                            callback_data=f"calendar_delete_answer:{date_key}:{answer.year}:{answer.id}"
+                            text=i18n("button.delete_answer_for_year", year=answer.year),
+                            callback_data=CalendarDeleteAnswer(date_key, answer.year, answer.id).pack()
                         )
                     ])
         else:
-            lines.append("Ответов пока нет. ✍️")
+            lines.append(i18n("date.no_answers"))
 
         # Кнопка "Добавить ответ за прошлый год"
         keyboard_buttons.append([
             InlineKeyboardButton(
-                text="➕ Добавить ответ за прошлый год",
-                callback_data=f"calendar_select_year:{date_key}:{question.id}"
+                text=i18n("button.add_past_answer"),
+                callback_data=CalendarSelectYear(date_key, question.id).pack()
             )
         ])
 
@@ -131,72 +155,182 @@ async def _render_date_view(target: Message | CallbackQuery, date_key: str, year
     keyboard_buttons.append([
         InlineKeyboardButton(
             text=f"◀ {_format_date_label(prev_key)}",
-            callback_data=f"date_prev:{date_key}"
+            callback_data=DateShift(date_key, -1).pack()
         ),
         InlineKeyboardButton(
             text=f"{_format_date_label(next_key)} ▶",
-            callback_data=f"date_next:{date_key}"
+            callback_data=DateShift(date_key, 1).pack()
         )
     ])
+    keyboard_buttons.append([
+        InlineKeyboardButton(text=i18n("button.calendar"), callback_data=CalendarMonth(int(date_key[:2])).pack())
+    ])
 
     keyboard = InlineKeyboardMarkup(inline_keyboard=keyboard_buttons)
 
     if isinstance(target, CallbackQuery):
-        await target.message.edit_text(text, parse_mode="HTML", reply_markup=keyboard)
+        # Повторный рендер того же содержимого не тратит вызов API
+        await edit_text_if_changed(target.message, text, reply_markup=keyboard, parse_mode="HTML")
+    else:
+        sent = await target.answer(text, parse_mode="HTML", reply_markup=keyboard)
+        remember_rendered(sent, text, reply_markup=keyboard, parse_mode="HTML")
+
+
+_GRID_COLUMNS = 7
+
+
+def _days_in_month(month: int) -> int:
+    """Количество дней в месяце (в феврале всегда 29)."""
+    return calendar.monthrange(_BASE_YEAR, month)[1]
+
+
+def _build_month_keyboard(month: int, summary: dict[str, int], i18n: Catalog) -> InlineKeyboardMarkup:
+    """Сетка дней месяца: • - есть вопрос, число после точки - сколько лет с ответами."""
+    prev_month = 12 if month == 1 else month - 1
+    next_month = 1 if month == 12 else month + 1
+    rows = [[
+        InlineKeyboardButton(text="◀", callback_data=CalendarMonth(prev_month).pack()),
+        InlineKeyboardButton(text=i18n(f"month.{month}"), callback_data="cal_noop"),
+        InlineKeyboardButton(text="▶", callback_data=CalendarMonth(next_month).pack())
+    ]]
+
+    days = []
+    for day in range(1, _days_in_month(month) + 1):
+        date_key = f"{month:02d}-{day:02d}"
+        text = str(day)
+        if date_key in summary:
+            answered = summary[date_key]
+            text += f"•{answered}" if answered else "•"
+        days.append(InlineKeyboardButton(text=text, callback_data=CalendarDay(date_key).pack()))
+
+    for i in range(0, len(days), _GRID_COLUMNS):
+        rows.append(days[i:i + _GRID_COLUMNS])
+
+    return InlineKeyboardMarkup(inline_keyboard=rows)
+
+
+async def _render_month_grid(target: Message | CallbackQuery, month: int, i18n: Catalog):
+    """Отображает сетку месяца: один агрегирующий запрос на весь месяц."""
+    user = await get_or_create_user(target.from_user.id)
+    summary = await get_month_summary(user.id, month)
+    keyboard = _build_month_keyboard(month, summary, i18n)
+    text = i18n("date.month_grid", month=i18n(f"month.{month}"))
+
+    if isinstance(target, CallbackQuery):
+        await edit_text_if_changed(target.message, text, reply_markup=keyboard, parse_mode="HTML")
     else:
-        await target.answer(text, parse_mode="HTML", reply_markup=keyboard)
+        sent = await target.answer(text, parse_mode="HTML", reply_markup=keyboard)
+        remember_rendered(sent, text, reply_markup=keyboard, parse_mode="HTML")
 
 
 @router.message(Command("date"))
-async def cmd_date(message: Message, state: FSMContext):
-    """Запрос даты для просмотра вопросов и ответов."""
-    await message.answer(
-        "Введи дату в формате <b>ДД.ММ</b>, например: <b>05.03</b>",
-        parse_mode="HTML"
-    )
+async def cmd_date(message: Message, state: FSMContext, i18n: Catalog):
+    """Запрос даты для просмотра вопросов и ответов: сетка текущего месяца или ввод ДД.ММ."""
+    await _render_month_grid(message, datetime.now().month, i18n)
     await state.set_state(DateViewStates.waiting_for_date)
 
 
+@router.callback_query(CalendarMonth.filter(), flags={"throttling_key": "date_nav"})
+async def show_month(callback: CallbackQuery, callback_data: CalendarMonth, i18n: Catalog):
+    """Перейти к другому месяцу в сетке."""
+    await callback.answer()
+    await _render_month_grid(callback, callback_data.month, i18n)
+
+
+@router.callback_query(CalendarDay.filter())
+async def show_day_from_grid(
+    callback: CallbackQuery, callback_data: CalendarDay, flow: FlowContext, raw_state: str | None, i18n: Catalog
+):
+    """Открыть выбранный в сетке день."""
+    await callback.answer()
+    await _render_date_view(callback, callback_data.date_key, i18n)
+    # Если ждали ввода даты текстом - больше не ждём
+    if raw_state == DateViewStates.waiting_for_date.state:
+        await flow.clear()
+
+
+@router.callback_query(ButtonFilter("cal_noop"))
+async def month_grid_noop(callback: CallbackQuery):
+    """Нажатие на название месяца ничего не делает."""
+    await callback.answer()
+
+
 @router.message(DateViewStates.waiting_for_date)
-async def process_date_input(message: Message, state: FSMContext):
+async def process_date_input(message: Message, flow: FlowContext, i18n: Catalog):
     """Обработка пользовательского ввода даты."""
     date_key = _parse_user_date(message.text or "")
     if not date_key:
-        await message.answer(
-            "Не понимаю эту дату. Пожалуйста, введи в формате <b>ДД.ММ</b>, например 05.03",
-            parse_mode="HTML"
-        )
+        await message.answer(i18n("date.invalid"), parse_mode="HTML")
         return
 
-    await _render_date_view(message, date_key)
-    await state.clear()
+    await _render_date_view(message, date_key, i18n)
+    await flow.clear()
 
 
-@router.callback_query(F.data.startswith("date_prev:"))
-async def show_previous_day(callback: CallbackQuery):
-    """Перейти к предыдущему дню."""
-    await callback.answer()
-    current_date_key = callback.data.split(":", 1)[1]
-    prev_date_key = _shift_date_key(current_date_key, -1)
-    await _render_date_view(callback, prev_date_key)
+@dataclass(slots=True)
+class _PendingNavigation:
+    """Отложенная отрисовка навигации по датам для одного сообщения."""
+    date_key: str
+    callback: CallbackQuery
+    # Фоновой отрисовке данные хендлера недоступны: каталог берётся из последнего нажатия
+    i18n: Catalog
+    task: asyncio.Task | None = None
+
+
+# (chat_id, message_id) -> дата, которую нужно показать в этом сообщении
+_pending_navigation: dict[tuple[int, int], _PendingNavigation] = {}
+
+
+async def _render_pending_navigation(key: tuple[int, int]) -> None:
+    """Дождаться паузы в нажатиях и отрисовать только последнюю запрошенную дату."""
+    # Задача живёт дольше апдейта, который её создал: запросы не должны попасть в его трейс
+    current_trace.set(None)
+    try:
+        while True:
+            await asyncio.sleep(config.DATE_NAV_DEBOUNCE_MS / 1000)
+            pending = _pending_navigation[key]
+            date_key = pending.date_key
+            await _render_date_view(pending.callback, date_key, pending.i18n)
+            # Пока рисовали, могли нажать ещё раз - тогда рисуем новую дату
+            if pending.date_key == date_key:
+                return
+    except Exception as e:
+        logger.error(f"Date navigation render failed: {e}")
+    finally:
+        del _pending_navigation[key]
+
+
+def _navigate(callback: CallbackQuery, date_key: str, days: int, i18n: Catalog) -> None:
+    """Сдвинуть дату сообщения (в кнопках - date_key) на days, склеивая быстрые нажатия в одну отрисовку."""
+    key = (callback.message.chat.id, callback.message.message_id)
+    pending = _pending_navigation.get(key)
+    if pending is not None:
+        # В кнопках ещё старая дата: считаем от уже запрошенной
+        pending.date_key = _shift_date_key(pending.date_key, days)
+        pending.callback = callback
+        pending.i18n = i18n
+        return
 
+    pending = _PendingNavigation(_shift_date_key(date_key, days), callback, i18n)
+    _pending_navigation[key] = pending
+    pending.task = asyncio.create_task(_render_pending_navigation(key))
 
-@router.callback_query(F.data.startswith("date_next:"))
-async def show_next_day(callback: CallbackQuery):
-    """Перейти к следующему дню."""
+
+@router.callback_query(DateShift.filter(), flags={"throttling_key": "date_nav"})
+async def show_adjacent_day(callback: CallbackQuery, callback_data: DateShift, i18n: Catalog):
+    """Перейти к предыдущему или следующему дню."""
     await callback.answer()
-    current_date_key = callback.data.split(":", 1)[1]
-    next_date_key = _shift_date_key(current_date_key, 1)
-    await _render_date_view(callback, next_date_key)
+    _navigate(callback, callback_data.date_key, callback_data.days, i18n)
 
 
-@router.callback_query(F.data.startswith("add_backdated:"))
-async def add_backdated_entry(callback: CallbackQuery, state: FSMContext):
+@router.callback_query(BackdatedEntry.filter())
+async def add_backdated_entry(
+    callback: CallbackQuery, callback_data: BackdatedEntry, state: FSMContext, flow: FlowContext, i18n: Catalog
+):
     """Начать создание вопроса и ответа задним числом."""
     await callback.answer()
 
-    # Извлекаем date_key из callback_data
-    date_key = callback.data.split(":", 1)[1]
+    date_key = callback_data.date_key
     date_label = _format_date_label(date_key)
 
     # Получаем год выбранной даты
@@ -205,82 +339,57 @@ async def add_backdated_entry(callback: CallbackQuery, state: FSMContext):
 
     # Проверяем что дата не в будущем
     if selected_date.date() > today.date():
-        await callback.message.answer(
-            "⚠️ Нельзя создавать записи для будущих дат.\n\n"
-            "Выбери дату не позже сегодняшней."
-        )
+        await callback.message.answer(i18n("date.future"))
         return
 
-    # Сохраняем информацию о выбранной дате в state
+    # Сохраняем информацию о выбранной дате в контексте сценария
     user = await get_or_create_user(callback.from_user.id)
-    await state.update_data(
-        backdated_date_key=date_key,
-        backdated_date_label=date_label,
-        backdated_full_date=selected_date.strftime("%Y-%m-%d"),
-        backdated_year=selected_date.year,
+    flow.update(
+        date_key=date_key,
+        year=selected_date.year,
         user_db_id=user.id
     )
 
-    await callback.message.answer(
-        f"Напиши, пожалуйста, вопрос, который хочешь задавать себе каждый год в дату {date_label}."
-    )
+    await callback.message.answer(i18n("date.ask_question", date=date_label))
 
     await state.set_state(BackdatedEntryStates.waiting_for_backdated_question)
 
 
 @router.message(BackdatedEntryStates.waiting_for_backdated_question)
-async def process_backdated_question(message: Message, state: FSMContext):
+async def process_backdated_question(message: Message, state: FSMContext, flow: FlowContext, i18n: Catalog):
     """Обработка вопроса для записи задним числом."""
     question_text = message.text.strip()
 
     if not question_text:
-        await message.answer("Вопрос не может быть пустым. Попробуй ещё раз.")
+        await message.answer(i18n("common.empty_question"))
         return
 
-    data = await state.get_data()
-    date_key = data.get("backdated_date_key")
-    date_label = data.get("backdated_date_label")
-    user_db_id = data.get("user_db_id")
-    backdated_year = data.get("backdated_year")
-
     # Создаём вопрос
-    question = await create_question(user_db_id, date_key, question_text)
+    question = await create_question(flow.user_db_id, flow.date_key, question_text)
 
-    # Сохраняем ID вопроса в state
-    await state.update_data(question_id=question.id)
+    # Сохраняем ID вопроса в контексте
+    flow.update(question_id=question.id)
 
-    await message.answer(
-        f"Отлично, вопрос сохранён ✅\n\n"
-        f"А теперь напиши свой ответ за {date_label}.{backdated_year} 👇"
-    )
+    await message.answer(i18n("date.backdated_question_saved", date=flow.date_label, year=flow.year))
 
     await state.set_state(BackdatedEntryStates.waiting_for_backdated_answer)
 
 
 @router.message(BackdatedEntryStates.waiting_for_backdated_answer)
-async def process_backdated_answer(message: Message, state: FSMContext):
+async def process_backdated_answer(message: Message, flow: FlowContext, i18n: Catalog):
     """Обработка ответа для записи задним числом."""
     answer_text = message.text.strip()
 
     if not answer_text:
-        await message.answer("Ответ не может быть пустым. Попробуй ещё раз.")
+        await message.answer(i18n("common.empty_answer"))
         return
 
-    data = await state.get_data()
-    user_db_id = data.get("user_db_id")
-    question_id = data.get("question_id")
-    backdated_full_date = data.get("backdated_full_date")
-    backdated_year = data.get("backdated_year")
-    date_label = data.get("backdated_date_label")
-
     # Создаём ответ с датой выбранного дня
-    await create_answer(user_db_id, question_id, answer_text, backdated_full_date, backdated_year)
+    await create_answer(flow.user_db_id, flow.question_id, answer_text, flow.full_date, flow.year)
 
-    await message.answer(
-        f"Ответ за {date_label}.{backdated_year} сохранён ✅"
-    )
+    await message.answer(i18n("date.answer_saved", date=flow.date_label, year=flow.year))
 
-    await state.clear()
+    await flow.clear()
 
 
 # ============================================================================
@@ -288,69 +397,41 @@ async def process_backdated_answer(message: Message, state: FSMContext):
 # ============================================================================
 
 
-@router.callback_query(F.data.startswith("calendar_select_year:"))
-async def calendar_select_year(callback: CallbackQuery, state: FSMContext):
+@router.callback_query(CalendarSelectYear.filter())
+async def calendar_select_year(
+    callback: CallbackQuery, callback_data: CalendarSelectYear, flow: FlowContext, i18n: Catalog
+):
     """Показать кнопки для выбора года."""
     await callback.answer()
 
-    parts = callback.data.split(":")
-    date_key = parts[1]
-    question_id = int(parts[2])
+    date_key = callback_data.date_key
+    question_id = callback_data.question_id
     date_label = _format_date_label(date_key)
 
-    # Сохраняем информацию в state
+    # Сохраняем информацию в контексте сценария
     user = await get_or_create_user(callback.from_user.id)
-    await state.update_data(
-        calendar_date_key=date_key,
-        calendar_date_label=date_label,
+    flow.update(
+        date_key=date_key,
         question_id=question_id,
         user_db_id=user.id
     )
 
-    # Создаём кнопки с годами
-    current_year = datetime.now().year
-    keyboard_buttons = []
-
-    # Добавляем годы с 2019 по текущий год в обратном порядке (сначала текущий)
-    years = list(range(2019, current_year + 1))
-    years.reverse()
-
-    # Размещаем по 3 кнопки в ряд
-    for i in range(0, len(years), 3):
-        row = []
-        for year in years[i:i+3]:
-            row.append(InlineKeyboardButton(
-                text=str(year),
-                callback_data=f"calendar_year_selected:{date_key}:{question_id}:{year}"
-            ))
-        keyboard_buttons.append(row)
-
-    # Кнопка "Другой год" для ввода вручную
-    keyboard_buttons.append([
-        InlineKeyboardButton(
-            text="✍️ Ввести другой год",
-            callback_data=f"calendar_custom_year:{date_key}:{question_id}"
-        )
-    ])
+    # Годы с 2019 по текущий (сначала текущий) и ввод вручную
+    keyboard = calendar_year_keyboard(i18n, date_key, question_id)
 
-    keyboard = InlineKeyboardMarkup(inline_keyboard=keyboard_buttons)
-
-    await callback.message.answer(
-        f"За какой год хочешь записать ответ для даты {date_label}?\n\n"
-        f"Выбери год из списка или напиши год вручную:",
-        reply_markup=keyboard
-    )
+    await callback.message.answer(i18n("date.choose_year", date=date_label), reply_markup=keyboard)
 
 
-@router.callback_query(F.data.startswith("calendar_year_selected:"))
-async def calendar_year_selected(callback: CallbackQuery, state: FSMContext):
+@router.callback_query(CalendarYearPicked.filter())
+async def calendar_year_selected(
+    callback: CallbackQuery, callback_data: CalendarYearPicked, state: FSMContext, flow: FlowContext, i18n: Catalog
+):
     """Обработка выбранного года из кнопок."""
     await callback.answer()
 
-    parts = callback.data.split(":")
-    date_key = parts[1]
-    question_id = int(parts[2])
-    year = int(parts[3])
+    date_key = callback_data.date_key
+    question_id = callback_data.question_id
+    year = callback_data.year
     date_label = _format_date_label(date_key)
 
     # Получаем данные пользователя
@@ -359,56 +440,48 @@ async def calendar_year_selected(callback: CallbackQuery, state: FSMContext):
     # Проверяем, есть ли уже ответ за этот год
     existing_answer = await get_answer_for_year(user.id, question_id, year)
     if existing_answer:
-        await callback.message.answer(
-            f"У тебя уже есть ответ за {year} для даты {date_label}.\n"
-            f"Выбери другой год или используй кнопку редактирования."
-        )
+        await callback.message.answer(i18n("date.answer_exists", year=year, date=date_label))
         return
 
-    # Сохраняем данные в state
-    await state.update_data(
-        calendar_date_key=date_key,
-        calendar_year=year,
-        calendar_date_label=date_label,
+    # Сохраняем данные в контексте сценария
+    flow.update(
+        date_key=date_key,
+        year=year,
         question_id=question_id,
         user_db_id=user.id
     )
 
-    await callback.message.answer(
-        f"Отлично! Теперь напиши свой ответ за {date_label}.{year} 👇"
-    )
+    await callback.message.answer(i18n("date.write_answer_after_year", date=date_label, year=year))
 
     await state.set_state(CalendarAnswerStates.waiting_for_answer)
 
 
-@router.callback_query(F.data.startswith("calendar_custom_year:"))
-async def calendar_custom_year(callback: CallbackQuery, state: FSMContext):
+@router.callback_query(CalendarCustomYear.filter())
+async def calendar_custom_year(
+    callback: CallbackQuery, callback_data: CalendarCustomYear, state: FSMContext, flow: FlowContext, i18n: Catalog
+):
     """Ввод года вручную."""
     await callback.answer()
 
-    parts = callback.data.split(":")
-    date_key = parts[1]
-    question_id = int(parts[2])
+    date_key = callback_data.date_key
+    question_id = callback_data.question_id
     date_label = _format_date_label(date_key)
 
-    # Сохраняем информацию в state
+    # Сохраняем информацию в контексте сценария
     user = await get_or_create_user(callback.from_user.id)
-    await state.update_data(
-        calendar_date_key=date_key,
-        calendar_date_label=date_label,
+    flow.update(
+        date_key=date_key,
         question_id=question_id,
         user_db_id=user.id
     )
 
-    await callback.message.answer(
-        f"Напиши год для даты {date_label} (например: 2018, 2017, 2010):"
-    )
+    await callback.message.answer(i18n("date.enter_year", date=date_label))
 
     await state.set_state(CalendarYearSelectionStates.waiting_for_year)
 
 
 @router.message(CalendarYearSelectionStates.waiting_for_year)
-async def process_year_selection(message: Message, state: FSMContext):
+async def process_year_selection(message: Message, state: FSMContext, flow: FlowContext, i18n: Catalog):
     """Обработка выбранного года для добавления ответа."""
     year_text = message.text.strip()
 
@@ -416,252 +489,192 @@ async def process_year_selection(message: Message, state: FSMContext):
     try:
         year = int(year_text)
         if year < 1900 or year > datetime.now().year:
-            await message.answer(
-                f"Год должен быть в диапазоне от 1900 до {datetime.now().year}. Попробуй ещё раз."
-            )
+            await message.answer(i18n("date.year_out_of_range", current_year=datetime.now().year))
             return
     except ValueError:
-        await message.answer("Пожалуйста, введи корректный год (например: 2023)")
+        await message.answer(i18n("date.invalid_year"))
         return
 
-    data = await state.get_data()
-    user_db_id = data.get("user_db_id")
-    question_id = data.get("question_id")
-    date_key = data.get("calendar_date_key")
-    date_label = data.get("calendar_date_label")
+    date_label = flow.date_label
 
     # Проверяем, есть ли уже ответ за этот год
-    existing_answer = await get_answer_for_year(user_db_id, question_id, year)
+    existing_answer = await get_answer_for_year(flow.user_db_id, flow.question_id, year)
     if existing_answer:
-        await message.answer(
-            f"У тебя уже есть ответ за {year} для даты {date_label}.\n"
-            f"Выбери другой год или используй кнопку редактирования."
-        )
+        await message.answer(i18n("date.answer_exists", year=year, date=date_label))
         return
 
-    # Сохраняем год в state
-    await state.update_data(calendar_year=year)
+    # Сохраняем год в контексте
+    flow.update(year=year)
 
-    await message.answer(
-        f"Отлично! Теперь напиши свой ответ за {date_label}.{year} 👇"
-    )
+    await message.answer(i18n("date.write_answer_after_year", date=date_label, year=year))
 
     await state.set_state(CalendarAnswerStates.waiting_for_answer)
 
 
-@router.callback_query(F.data.startswith("calendar_create_question:"))
-async def calendar_create_question(callback: CallbackQuery, state: FSMContext):
+@router.callback_query(CalendarCreateQuestion.filter())
+async def calendar_create_question(
+    callback: CallbackQuery, callback_data: CalendarCreateQuestion, state: FSMContext, flow: FlowContext, i18n: Catalog
+):
     """Начать создание вопроса через календарь."""
     await callback.answer()
 
-    parts = callback.data.split(":")
-    date_key = parts[1]
-    year = int(parts[2])
+    date_key = callback_data.date_key
+    year = callback_data.year
     date_label = _format_date_label(date_key)
 
-    # Сохраняем информацию в state
+    # Сохраняем информацию в контексте сценария
     user = await get_or_create_user(callback.from_user.id)
-    await state.update_data(
-        calendar_date_key=date_key,
-        calendar_year=year,
-        calendar_date_label=date_label,
+    flow.update(
+        date_key=date_key,
+        year=year,
         user_db_id=user.id
     )
 
-    await callback.message.answer(
-        f"Напиши, пожалуйста, вопрос, который хочешь задавать себе каждый год в дату {date_label}."
-    )
+    await callback.message.answer(i18n("date.ask_question", date=date_label))
 
     await state.set_state(CalendarQuestionStates.waiting_for_question)
 
 
 @router.message(CalendarQuestionStates.waiting_for_question)
-async def process_calendar_question(message: Message, state: FSMContext):
+async def process_calendar_question(message: Message, state: FSMContext, flow: FlowContext, i18n: Catalog):
     """Обработка вопроса, созданного через календарь."""
     question_text = message.text.strip()
 
     if not question_text:
-        await message.answer("Вопрос не может быть пустым. Попробуй ещё раз.")
+        await message.answer(i18n("common.empty_question"))
         return
 
-    data = await state.get_data()
-    date_key = data.get("calendar_date_key")
-    year = data.get("calendar_year")
-    date_label = data.get("calendar_date_label")
-    user_db_id = data.get("user_db_id")
-
     # Создаём вопрос
-    question = await create_question(user_db_id, date_key, question_text)
+    question = await create_question(flow.user_db_id, flow.date_key, question_text)
 
-    # Сохраняем ID вопроса в state
-    await state.update_data(question_id=question.id)
+    # Сохраняем ID вопроса в контексте
+    flow.update(question_id=question.id)
 
-    await message.answer(
-        f"Отлично, вопрос сохранён ✅\n\n"
-        f"Теперь напиши свой ответ за {date_label}.{year} 👇"
-    )
+    await message.answer(i18n("date.question_saved", date=flow.date_label, year=flow.year))
 
     await state.set_state(CalendarQuestionStates.waiting_for_answer_after_question)
 
 
 @router.message(CalendarQuestionStates.waiting_for_answer_after_question)
-async def process_calendar_answer_after_question(message: Message, state: FSMContext):
+async def process_calendar_answer_after_question(message: Message, flow: FlowContext, i18n: Catalog):
     """Обработка ответа после создания вопроса через календарь."""
     answer_text = message.text.strip()
 
     if not answer_text:
-        await message.answer("Ответ не может быть пустым. Попробуй ещё раз.")
+        await message.answer(i18n("common.empty_answer"))
         return
 
-    data = await state.get_data()
-    user_db_id = data.get("user_db_id")
-    question_id = data.get("question_id")
-    date_key = data.get("calendar_date_key")
-    year = data.get("calendar_year")
-    date_label = data.get("calendar_date_label")
-
-    # Формируем полную дату
-    full_date = f"{year}-{date_key}"
-
     # Создаём ответ
-    await create_answer(user_db_id, question_id, answer_text, full_date, year)
+    await create_answer(flow.user_db_id, flow.question_id, answer_text, flow.full_date, flow.year)
 
-    await message.answer(
-        f"Супер! Вопрос и ответ за {date_label}.{year} сохранены ✅"
-    )
+    await message.answer(i18n("date.question_and_answer_saved", date=flow.date_label, year=flow.year))
 
-    await state.clear()
+    await flow.clear()
 
 
-@router.callback_query(F.data.startswith("calendar_add_answer:"))
-async def calendar_add_answer(callback: CallbackQuery, state: FSMContext):
+@router.callback_query(CalendarAddAnswer.filter())
+async def calendar_add_answer(
+    callback: CallbackQuery, callback_data: CalendarAddAnswer, state: FSMContext, flow: FlowContext, i18n: Catalog
+):
     """Начать добавление ответа через календарь."""
     await callback.answer()
 
-    parts = callback.data.split(":")
-    date_key = parts[1]
-    year = int(parts[2])
-    question_id = int(parts[3])
+    date_key = callback_data.date_key
+    year = callback_data.year
+    question_id = callback_data.question_id
     date_label = _format_date_label(date_key)
 
-    # Сохраняем информацию в state
+    # Сохраняем информацию в контексте сценария
     user = await get_or_create_user(callback.from_user.id)
-    await state.update_data(
-        calendar_date_key=date_key,
-        calendar_year=year,
-        calendar_date_label=date_label,
+    flow.update(
+        date_key=date_key,
+        year=year,
         question_id=question_id,
         user_db_id=user.id
     )
 
-    await callback.message.answer(
-        f"Напиши свой ответ за {date_label}.{year} 👇"
-    )
+    await callback.message.answer(i18n("date.write_answer", date=date_label, year=year))
 
     await state.set_state(CalendarAnswerStates.waiting_for_answer)
 
 
 @router.message(CalendarAnswerStates.waiting_for_answer)
-async def process_calendar_answer(message: Message, state: FSMContext):
+async def process_calendar_answer(message: Message, flow: FlowContext, i18n: Catalog):
     """Обработка ответа, добавленного через календарь."""
     answer_text = message.text.strip()
 
     if not answer_text:
-        await message.answer("Ответ не может быть пустым. Попробуй ещё раз.")
+        await message.answer(i18n("common.empty_answer"))
         return
 
-    data = await state.get_data()
-    user_db_id = data.get("user_db_id")
-    question_id = data.get("question_id")
-    date_key = data.get("calendar_date_key")
-    year = data.get("calendar_year")
-    date_label = data.get("calendar_date_label")
-
-    # Формируем полную дату
-    full_date = f"{year}-{date_key}"
-
     # Создаём ответ
-    await create_answer(user_db_id, question_id, answer_text, full_date, year)
+    await create_answer(flow.user_db_id, flow.question_id, answer_text, flow.full_date, flow.year)
 
-    await message.answer(
-        f"Ответ за {date_label}.{year} сохранён ✅"
-    )
+    await message.answer(i18n("date.answer_saved", date=flow.date_label, year=flow.year))
 
-    await state.clear()
+    await flow.clear()
 
 
-@router.callback_query(F.data.startswith("calendar_edit_answer:"))
-async def calendar_edit_answer(callback: CallbackQuery, state: FSMContext):
+@router.callback_query(CalendarEditAnswer.filter())
+async def calendar_edit_answer(
+    callback: CallbackQuery, callback_data: CalendarEditAnswer, state: FSMContext, flow: FlowContext, i18n: Catalog
+):
     """Начать редактирование ответа через календарь."""
     await callback.answer()
 
-    parts = callback.data.split(":")
-    date_key = parts[1]
-    year = int(parts[2])
-    answer_id = int(parts[3])
+    date_key = callback_data.date_key
+    year = callback_data.year
+    answer_id = callback_data.answer_id
     date_label = _format_date_label(date_key)
 
-    # Сохраняем информацию в state
-    await state.update_data(
-        calendar_date_key=date_key,
-        calendar_year=year,
-        calendar_date_label=date_label,
+    # Сохраняем информацию в контексте сценария
+    flow.update(
+        date_key=date_key,
+        year=year,
         answer_id=answer_id
     )
 
-    await callback.message.answer(
-        f"Напиши новый ответ за {date_label}.{year} 👇"
-    )
+    await callback.message.answer(i18n("date.write_new_answer", date=date_label, year=year))
 
     await state.set_state(CalendarEditStates.waiting_for_edited_answer)
 
 
 @router.message(CalendarEditStates.waiting_for_edited_answer)
-async def process_calendar_edited_answer(message: Message, state: FSMContext):
+async def process_calendar_edited_answer(message: Message, flow: FlowContext, i18n: Catalog):
     """Обработка отредактированного ответа через календарь."""
     from database import update_answer_text
 
     answer_text = message.text.strip()
 
     if not answer_text:
-        await message.answer("Ответ не может быть пустым. Попробуй ещё раз.")
+        await message.answer(i18n("common.empty_answer"))
         return
 
-    data = await state.get_data()
-    answer_id = data.get("answer_id")
-    date_label = data.get("calendar_date_label")
-    year = data.get("calendar_year")
-
     # Обновляем текст ответа
-    await update_answer_text(answer_id, answer_text)
+    await update_answer_text(flow.answer_id, answer_text)
 
-    await message.answer(
-        f"Ответ за {date_label}.{year} обновлён ✅"
-    )
+    await message.answer(i18n("date.answer_updated", date=flow.date_label, year=flow.year))
 
-    await state.clear()
+    await flow.clear()
 
 
-@router.callback_query(F.data.startswith("calendar_delete_answer:"))
-async def calendar_delete_answer(callback: CallbackQuery):
+@router.callback_query(CalendarDeleteAnswer.filter())
+async def calendar_delete_answer(callback: CallbackQuery, callback_data: CalendarDeleteAnswer, i18n: Catalog):
     """Удалить ответ через календарь."""
     from database import delete_answer
 
     await callback.answer()
 
-    parts = callback.data.split(":")
-    date_key = parts[1]
-    year = int(parts[2])
-    answer_id = int(parts[3])
+    date_key = callback_data.date_key
+    year = callback_data.year
+    answer_id = callback_data.answer_id
     date_label = _format_date_label(date_key)
 
     # Удаляем ответ
     await delete_answer(answer_id)
 
-    await callback.message.answer(
-        f"Ответ за {date_label}.{year} удалён ✅"
-    )
+    await callback.message.answer(i18n("date.answer_deleted", date=date_label, year=year))
 
     # Возвращаемся к просмотру даты
-    await _render_date_view(callback, date_key, year)
+    await _render_date_view(callback, date_key, i18n, year)
 
@@ -1,9 +1,10 @@
 from datetime import datetime
 
-from aiogram import Router, F
+from aiogram import Router
 from aiogram.fsm.context import FSMContext
 from aiogram.types import CallbackQuery, Message
 
+from callbacks import ButtonFilter, YesterdayAnswer, YesterdayQuestion
 from database import (
     get_or_create_user,
     get_question_for_date,
@@ -12,12 +13,14 @@ from database import (
     get_answer_for_year
 )
 from states import EveningReminderStates, MorningYesterdayStates
+from flow import FlowContext
+from i18n import Catalog
 
-router = Router()
+router = Router(name=__name__)
 
 
-@router.callback_query(F.data == "evening_answer_today")
-async def evening_answer_today(callback: CallbackQuery, state: FSMContext):
+@router.callback_query(ButtonFilter("evening_answer_today"))
+async def evening_answer_today(callback: CallbackQuery, state: FSMContext, flow: FlowContext, i18n: Catalog):
     """Обработка кнопки 'Ответить за сегодня' в вечернем напоминании."""
     await callback.answer()
 
@@ -31,30 +34,25 @@ async def evening_answer_today(callback: CallbackQuery, state: FSMContext):
     question = await get_question_for_date(user.id, date_key)
 
     if not question:
-        await callback.message.answer(
-            "⚠️ Произошла ошибка. Вопрос для сегодня не найден."
-        )
-        await state.clear()
+        await callback.message.answer(i18n("evening.no_question"))
+        await flow.clear()
         return
 
-    # Сохраняем данные в state
-    await state.update_data(
+    # Сохраняем данные в контексте сценария
+    flow.update(
         question_id=question.id,
         user_db_id=user.id,
-        current_year=current_year,
-        date_key=date_key,
-        full_date=now.strftime("%Y-%m-%d")
+        year=current_year,
+        date_key=date_key
     )
 
-    await callback.message.answer(
-        f"Отлично! Напиши свой ответ за сегодня 👇"
-    )
+    await callback.message.answer(i18n("evening.write_answer"))
 
     await state.set_state(EveningReminderStates.waiting_for_evening_answer)
 
 
-@router.callback_query(F.data == "evening_add_question")
-async def evening_add_question(callback: CallbackQuery, state: FSMContext):
+@router.callback_query(ButtonFilter("evening_add_question"))
+async def evening_add_question(callback: CallbackQuery, state: FSMContext, flow: FlowContext, i18n: Catalog):
     """Обработка кнопки 'Добавить вопрос и ответ' в вечернем напоминании."""
     await callback.answer()
 
@@ -64,118 +62,93 @@ async def evening_add_question(callback: CallbackQuery, state: FSMContext):
     date_key = now.strftime("%m-%d")
     current_year = now.year
 
-    # Сохраняем данные в state
-    await state.update_data(
+    # Сохраняем данные в контексте сценария
+    flow.update(
         user_db_id=user.id,
-        current_year=current_year,
-        date_key=date_key,
-        full_date=now.strftime("%Y-%m-%d")
+        year=current_year,
+        date_key=date_key
     )
 
-    await callback.message.answer(
-        "Напиши, пожалуйста, вопрос дня, который хочешь задавать себе каждый год в сегодняшнюю дату."
-    )
+    await callback.message.answer(i18n("evening.ask_question"))
 
     await state.set_state(EveningReminderStates.waiting_for_evening_question)
 
 
-@router.callback_query(F.data == "evening_skip")
-async def evening_skip(callback: CallbackQuery, state: FSMContext):
+@router.callback_query(ButtonFilter("evening_skip"))
+async def evening_skip(callback: CallbackQuery, flow: FlowContext, i18n: Catalog):
     """Обработка кнопки 'Пропустить' в вечернем напоминании."""
     await callback.answer()
 
-    await callback.message.answer(
-        "Ок, пропускаем этот день. Вернусь завтра 💚"
-    )
+    await callback.message.answer(i18n("evening.skipped"))
 
-    await state.clear()
+    await flow.clear()
 
 
 @router.message(EveningReminderStates.waiting_for_evening_answer)
-async def process_evening_answer(message: Message, state: FSMContext):
+async def process_evening_answer(message: Message, flow: FlowContext, i18n: Catalog):
     """Обработка ответа в вечернем режиме (когда вопрос уже есть)."""
     answer_text = message.text.strip()
 
     if not answer_text:
-        await message.answer("Ответ не может быть пустым. Попробуй ещё раз.")
+        await message.answer(i18n("common.empty_answer"))
         return
 
-    data = await state.get_data()
-    user_db_id = data.get("user_db_id")
-    question_id = data.get("question_id")
-    current_year = data.get("current_year")
-    full_date = data.get("full_date")
+    user_db_id = flow.user_db_id
+    question_id = flow.question_id
+    current_year = flow.year
+    full_date = flow.full_date
 
     # Проверяем, нет ли уже ответа за этот год (на случай race condition)
     existing_answer = await get_answer_for_year(user_db_id, question_id, current_year)
 
     if existing_answer:
-        await message.answer(
-            "На этот год ответ уже сохранён ✅"
-        )
-        await state.clear()
+        await message.answer(i18n("evening.already_answered"))
+        await flow.clear()
         return
 
     # Создаём ответ
     await create_answer(user_db_id, question_id, answer_text, full_date, current_year)
 
-    await message.answer(
-        f"Супер, ответ за сегодня сохранён ✅"
-    )
+    await message.answer(i18n("evening.answer_saved"))
 
-    await state.clear()
+    await flow.clear()
 
 
 @router.message(EveningReminderStates.waiting_for_evening_question)
-async def process_evening_question(message: Message, state: FSMContext):
+async def process_evening_question(message: Message, state: FSMContext, flow: FlowContext, i18n: Catalog):
     """Обработка вопроса в вечернем режиме (когда вопроса ещё нет)."""
     question_text = message.text.strip()
 
     if not question_text:
-        await message.answer("Вопрос не может быть пустым. Попробуй ещё раз.")
+        await message.answer(i18n("common.empty_question"))
         return
 
-    data = await state.get_data()
-    user_db_id = data.get("user_db_id")
-    date_key = data.get("date_key")
-
     # Создаём вопрос
-    question = await create_question(user_db_id, date_key, question_text)
+    question = await create_question(flow.user_db_id, flow.date_key, question_text)
 
-    # Сохраняем ID вопроса в state
-    await state.update_data(question_id=question.id)
+    # Сохраняем ID вопроса в контексте
+    flow.update(question_id=question.id)
 
-    await message.answer(
-        "Отлично, вопрос сохранён ✅\n\n"
-        "Теперь напиши свой ответ за сегодня 👇"
-    )
+    await message.answer(i18n("evening.question_saved"))
 
     await state.set_state(EveningReminderStates.waiting_for_evening_answer_after_question)
 
 
 @router.message(EveningReminderStates.waiting_for_evening_answer_after_question)
-async def process_evening_answer_after_question(message: Message, state: FSMContext):
+async def process_evening_answer_after_question(message: Message, flow: FlowContext, i18n: Catalog):
     """Обработка ответа после создания вопроса в вечернем режиме."""
     answer_text = message.text.strip()
 
     if not answer_text:
-        await message.answer("Ответ не может быть пустым. Попробуй ещё раз.")
+        await message.answer(i18n("common.empty_answer"))
         return
 
-    data = await state.get_data()
-    user_db_id = data.get("user_db_id")
-    question_id = data.get("question_id")
-    current_year = data.get("current_year")
-    full_date = data.get("full_date")
-
     # Создаём ответ
-    await create_answer(user_db_id, question_id, answer_text, full_date, current_year)
+    await create_answer(flow.user_db_id, flow.question_id, answer_text, flow.full_date, flow.year)
 
-    await message.answer(
-        f"Супер, ответ за сегодня сохранён ✅"
-    )
+    await message.answer(i18n("evening.answer_saved"))
 
-    await state.clear()
+    await flow.clear()
 
 
 # ============================================================================
@@ -183,15 +156,15 @@ async def process_evening_answer_after_question(message: Message, state: FSMCont
 # ============================================================================
 
 
-@router.callback_query(F.data.startswith("morning_yesterday_answer:"))
-async def morning_yesterday_answer(callback: CallbackQuery, state: FSMContext):
+@router.callback_query(YesterdayAnswer.filter())
+async def morning_yesterday_answer(
+    callback: CallbackQuery, callback_data: YesterdayAnswer, state: FSMContext, flow: FlowContext, i18n: Catalog
+):
     """Обработка кнопки 'Записать ответ за вчера' в утреннем напоминании."""
     await callback.answer()
 
-    # Извлекаем date_key из callback_data (формат: morning_yesterday_answer:MM-DD:YYYY)
-    parts = callback.data.split(":")
-    date_key = parts[1]
-    year = int(parts[2])
+    date_key = callback_data.date_key
+    year = callback_data.year
 
     # Получаем данные пользователя
     user = await get_or_create_user(callback.from_user.id)
@@ -200,150 +173,120 @@ async def morning_yesterday_answer(callback: CallbackQuery, state: FSMContext):
     question = await get_question_for_date(user.id, date_key)
 
     if not question:
-        await callback.message.answer(
-            "⚠️ Произошла ошибка. Вопрос для вчерашнего дня не найден."
-        )
-        await state.clear()
+        await callback.message.answer(i18n("yesterday.no_question"))
+        await flow.clear()
         return
 
-    # Сохраняем данные в state
-    await state.update_data(
+    # Сохраняем данные в контексте сценария
+    flow.update(
         question_id=question.id,
         user_db_id=user.id,
-        yesterday_year=year,
-        date_key=date_key,
-        full_date=f"{year}-{date_key}"
+        year=year,
+        date_key=date_key
     )
 
-    await callback.message.answer(
-        f"Отлично! Напиши свой ответ за вчера 👇"
-    )
+    await callback.message.answer(i18n("yesterday.write_answer"))
 
     await state.set_state(MorningYesterdayStates.waiting_for_yesterday_answer)
 
 
-@router.callback_query(F.data.startswith("morning_yesterday_add:"))
-async def morning_yesterday_add_question(callback: CallbackQuery, state: FSMContext):
+@router.callback_query(YesterdayQuestion.filter())
+async def morning_yesterday_add_question(
+    callback: CallbackQuery, callback_data: YesterdayQuestion, state: FSMContext, flow: FlowContext, i18n: Catalog
+):
     """Обработка кнопки 'Добавить вопрос и ответ за вчера' в утреннем напоминании."""
     await callback.answer()
 
-    # Извлекаем date_key из callback_data (формат: morning_yesterday_add:MM-DD:YYYY)
-    parts = callback.data.split(":")
-    date_key = parts[1]
-    year = int(parts[2])
+    date_key = callback_data.date_key
+    year = callback_data.year
 
     # Получаем данные пользователя
     user = await get_or_create_user(callback.from_user.id)
 
-    # Сохраняем данные в state
-    await state.update_data(
+    # Сохраняем данные в контексте сценария
+    flow.update(
         user_db_id=user.id,
-        yesterday_year=year,
-        date_key=date_key,
-        full_date=f"{year}-{date_key}"
+        year=year,
+        date_key=date_key
     )
 
-    await callback.message.answer(
-        "Напиши, пожалуйста, вопрос, который хочешь задавать себе каждый год во вчерашнюю дату."
-    )
+    await callback.message.answer(i18n("yesterday.ask_question"))
 
     await state.set_state(MorningYesterdayStates.waiting_for_yesterday_question)
 
 
-@router.callback_query(F.data == "morning_yesterday_skip")
-async def morning_yesterday_skip(callback: CallbackQuery, state: FSMContext):
+@router.callback_query(ButtonFilter("morning_yesterday_skip"))
+async def morning_yesterday_skip(callback: CallbackQuery, flow: FlowContext, i18n: Catalog):
     """Обработка кнопки 'Пропустить вчера' в утреннем напоминании."""
     await callback.answer()
 
-    await callback.message.answer(
-        "Ок, пропускаем вчерашний день. Продолжим с сегодняшнего 💚"
-    )
+    await callback.message.answer(i18n("yesterday.skipped"))
 
-    await state.clear()
+    await flow.clear()
 
 
 @router.message(MorningYesterdayStates.waiting_for_yesterday_answer)
-async def process_yesterday_answer(message: Message, state: FSMContext):
+async def process_yesterday_answer(message: Message, flow: FlowContext, i18n: Catalog):
     """Обработка ответа за вчерашний день в утреннем режиме."""
     answer_text = message.text.strip()
 
     if not answer_text:
-        await message.answer("Ответ не может быть пустым. Попробуй ещё раз.")
+        await message.answer(i18n("common.empty_answer"))
         return
 
-    data = await state.get_data()
-    user_db_id = data.get("user_db_id")
-    question_id = data.get("question_id")
-    yesterday_year = data.get("yesterday_year")
-    full_date = data.get("full_date")
+    user_db_id = flow.user_db_id
+    question_id = flow.question_id
+    yesterday_year = flow.year
+    full_date = flow.full_date
 
     # Проверяем, нет ли уже ответа за этот год
     existing_answer = await get_answer_for_year(user_db_id, question_id, yesterday_year)
 
     if existing_answer:
-        await message.answer(
-            "На вчерашний день ответ уже сохранён ✅"
-        )
-        await state.clear()
+        await message.answer(i18n("yesterday.already_answered"))
+        await flow.clear()
         return
 
     # Создаём ответ
     await create_answer(user_db_id, question_id, answer_text, full_date, yesterday_year)
 
-    await message.answer(
-        f"Супер, ответ за вчера сохранён ✅"
-    )
+    await message.answer(i18n("yesterday.answer_saved"))
 
-    await state.clear()
+    await flow.clear()
 
 
 @router.message(MorningYesterdayStates.waiting_for_yesterday_question)
-async def process_yesterday_question(message: Message, state: FSMContext):
+async def process_yesterday_question(message: Message, state: FSMContext, flow: FlowContext, i18n: Catalog):
     """Обработка вопроса за вчерашний день в утреннем режиме."""
     question_text = message.text.strip()
 
     if not question_text:
-        await message.answer("Вопрос не может быть пустым. Попробуй ещё раз.")
+        await message.answer(i18n("common.empty_question"))
         return
 
-    data = await state.get_data()
-    user_db_id = data.get("user_db_id")
-    date_key = data.get("date_key")
-
     # Создаём вопрос
-    question = await create_question(user_db_id, date_key, question_text)
+    question = await create_question(flow.user_db_id, flow.date_key, question_text)
 
-    # Сохраняем ID вопроса в state
-    await state.update_data(question_id=question.id)
+    # Сохраняем ID вопроса в контексте
+    flow.update(question_id=question.id)
 
-    await message.answer(
-        "Отлично, вопрос сохранён ✅\n\n"
-        "Теперь напиши свой ответ за вчера 👇"
-    )
+    await message.answer(i18n("yesterday.question_saved"))
 
     await state.set_state(MorningYesterdayStates.waiting_for_yesterday_answer_after_question)
 
 
 @router.message(MorningYesterdayStates.waiting_for_yesterday_answer_after_question)
-async def process_yesterday_answer_after_question(message: Message, state: FSMContext):
+async def process_yesterday_answer_after_question(message: Message, flow: FlowContext, i18n: Catalog):
     """Обработка ответа после создания вопроса за вчерашний день."""
     answer_text = message.text.strip()
 
     if not answer_text:
-        await message.answer("Ответ не может быть пустым. Попробуй ещё раз.")
+        await message.answer(i18n("common.empty_answer"))
         return
 
-    data = await state.get_data()
-    user_db_id = data.get("user_db_id")
-    question_id = data.get("question_id")
-    yesterday_year = data.get("yesterday_year")
-    full_date = data.get("full_date")
-
     # Создаём ответ
-    await create_answer(user_db_id, question_id, answer_text, full_date, yesterday_year)
+    await create_answer(flow.user_db_id, flow.question_id, answer_text, flow.full_date, flow.year)
 
-    await message.answer(
-        f"Супер, ответ за вчера сохранён ✅"
-    )
+    await message.answer(i18n("yesterday.answer_saved"))
 
-    await state.clear()
+    await flow.clear()
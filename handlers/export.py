@@ -0,0 +1,49 @@
+import os
+from datetime import datetime
+
+from aiogram import Router
+from aiogram.filters import Command, CommandObject
+from aiogram.types import Message
+
+import config
+from database import get_or_create_user
+from i18n import Catalog
+from journal_io import EXPORT_FORMATS, EXPORT_FORMAT_ALIASES, export_journal, SpooledInputFile
+
+router = Router(name=__name__)
+
+_DEFAULT_FORMAT = "md"
+# Telegram не принимает от ботов файлы больше 50 МБ
+_MAX_DOCUMENT_BYTES = 50 * 1024 * 1024
+
+
+@router.message(Command("export"))
+async def cmd_export(message: Message, command: CommandObject, i18n: Catalog):
+    """Команда /export [md|csv|jsonl] - выгрузить все вопросы и ответы файлом"""
+    fmt = (command.args or _DEFAULT_FORMAT).strip().lower()
+    fmt = EXPORT_FORMAT_ALIASES.get(fmt, fmt)
+    if fmt not in EXPORT_FORMATS:
+        formats = ", ".join(f"{ext} ({name})" for ext, name in EXPORT_FORMATS.items())
+        await message.answer(i18n("export.usage", formats=formats))
+        return
+
+    user = await get_or_create_user(message.from_user.id)
+    file, rows = await export_journal(
+        user.id, fmt, spool_size=config.EXPORT_SPOOL_BYTES, title=i18n("export.title")
+    )
+
+    with file:
+        if not rows:
+            await message.answer(i18n("export.empty"))
+            return
+
+        size = file.seek(0, os.SEEK_END)
+        if size > _MAX_DOCUMENT_BYTES:
+            await message.answer(i18n("export.too_large"))
+            return
+
+        filename = f"fivebook_{datetime.now().strftime('%Y%m%d')}.{fmt}"
+        await message.answer_document(
+            SpooledInputFile(file, filename=filename),
+            caption=i18n("export.caption", format=EXPORT_FORMATS[fmt])
+        )
@@ -0,0 +1,108 @@
+import asyncio
+import csv
+import logging
+import os
+from tempfile import SpooledTemporaryFile
+
+from aiogram import Bot, Router, F
+from aiogram.filters import Command
+from aiogram.types import Message
+
+import config
+from database import get_or_create_user, import_journal_rows
+from i18n import Catalog
+from journal_io import IMPORT_FORMATS, JournalRowError, parse_import_record, read_import_records
+
+router = Router(name=__name__)
+logger = logging.getLogger(__name__)
+
+# Строк на одну транзакцию
+_IMPORT_BATCH_SIZE = 500
+# Bot API отдаёт ботам файлы не больше 20 МБ
+_MAX_DOWNLOAD_BYTES = 20 * 1024 * 1024
+# Через сколько записей разбор файла отдаёт управление event loop
+_IMPORT_YIELD_EVERY = 200
+# Сколько номеров ошибочных записей показать в отчёте
+_MAX_REPORTED_ERRORS = 5
+
+
+@router.message(Command("import"))
+async def cmd_import(message: Message, i18n: Catalog):
+    """Команда /import - как загрузить ответы из файла"""
+    await message.answer(i18n("import.help"), parse_mode="HTML")
+
+
+@router.message(F.document)
+async def import_file(message: Message, bot: Bot, i18n: Catalog):
+    """Импорт вопросов и ответов из присланного файла"""
+    document = message.document
+    fmt = os.path.splitext(document.file_name or "")[1].lstrip(".").lower()
+    if fmt not in IMPORT_FORMATS:
+        await message.answer(i18n("import.unsupported"))
+        return
+
+    if document.file_size and document.file_size > _MAX_DOWNLOAD_BYTES:
+        await message.answer(i18n("import.too_large"))
+        return
+
+    user = await get_or_create_user(message.from_user.id)
+
+    records = 0
+    answer_rows = 0
+    new_questions = 0
+    new_answers = 0
+    errors: list[int] = []
+
+    async def flush(batch):
+        nonlocal new_questions, new_answers
+        questions, answers = await import_journal_rows(user.id, batch)
+        new_questions += questions
+        new_answers += answers
+
+    with SpooledTemporaryFile(max_size=config.EXPORT_SPOOL_BYTES, mode="w+b") as file:
+        await bot.download(document, destination=file)
+        file.seek(0)
+
+        batch = []
+        try:
+            for number, record in read_import_records(file, fmt):
+                records += 1
+                # Разбор синхронный: без паузы большой файл держал бы event loop до конца
+                if records % _IMPORT_YIELD_EVERY == 0:
+                    await asyncio.sleep(0)
+                try:
+                    if record is None:
+                        raise JournalRowError("не разобрать запись")
+                    row = parse_import_record(record)
+                except JournalRowError:
+                    errors.append(number)
+                    continue
+
+                batch.append(row)
+                if row[2] is not None:
+                    answer_rows += 1
+                if len(batch) >= _IMPORT_BATCH_SIZE:
+                    await flush(batch)
+                    batch = []
+            if batch:
+                await flush(batch)
+        except (UnicodeDecodeError, ValueError, csv.Error) as e:
+            logger.warning(f"Import of {document.file_name} failed: {e}")
+            await message.answer(i18n("import.unreadable", questions=new_questions, answers=new_answers))
+            return
+
+    lines = [
+        i18n("import.done"),
+        i18n("import.records", count=records),
+        i18n("import.new_questions", count=new_questions),
+        i18n("import.new_answers", count=new_answers),
+    ]
+    if answer_rows > new_answers:
+        lines.append(i18n("import.existing_answers", count=answer_rows - new_answers))
+    if errors:
+        shown = ", ".join(str(number) for number in errors[:_MAX_REPORTED_ERRORS])
+        if len(errors) > _MAX_REPORTED_ERRORS:
+            shown += ", …"
+        lines.append(i18n("import.errors", count=len(errors), numbers=shown))
+
+    await message.answer("\n".join(lines))
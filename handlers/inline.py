@@ -0,0 +1,81 @@
+import html
+
+from aiogram import Router
+from aiogram.types import InlineQuery, InlineQueryResultArticle, InputTextMessageContent
+
+import config
+from database import get_or_create_user, search_answers_cached, SearchHit
+
+router = Router(name=__name__)
+
+INLINE_PAGE_SIZE = 10
+# Столько лучших совпадений ищется и кэшируется за раз; дальше Telegram не листает
+INLINE_MAX_RESULTS = 50
+DESCRIPTION_CHARS = 100
+MESSAGE_CHARS = 4096
+# Вопрос занимает не больше половины сообщения, остальное - ответу
+QUESTION_CHARS = MESSAGE_CHARS // 2
+
+
+def _escape_truncated(text: str, limit: int) -> str:
+    """html.escape(text) не длиннее limit символов; обрезанный текст заканчивается на «…»."""
+    escaped = html.escape(text)
+    if len(escaped) <= limit:
+        return escaped
+    # Обрезаем исходный текст, а не экранированный, чтобы не разрезать &amp; пополам.
+    # Каждый шаг убирает не меньше символов, чем лишних, так что цикл конечен
+    text = text[:limit - 1]
+    escaped = html.escape(text)
+    while len(escaped) > limit - 1:
+        text = text[:len(text) - (len(escaped) - (limit - 1))]
+        escaped = html.escape(text)
+    return escaped + "…"
+
+
+def _build_article(hit: SearchHit) -> InlineQueryResultArticle:
+    """Карточка результата: по нажатию в чат отправляется вопрос и ответ."""
+    month, day = hit.date_key.split("-")
+    date_label = f"{day}.{month}.{hit.year}"
+    question = _escape_truncated(hit.question_text, QUESTION_CHARS)
+    header = f"📅 <b>{date_label}</b> - <i>{question}</i>\n\n"
+    body = _escape_truncated(hit.answer_text, MESSAGE_CHARS - len(header))
+
+    description = " ".join(hit.answer_text.split())
+    if len(description) > DESCRIPTION_CHARS:
+        description = description[:DESCRIPTION_CHARS - 1] + "…"
+
+    return InlineQueryResultArticle(
+        id=str(hit.answer_id),
+        title=f"{date_label} · {hit.question_text}",
+        description=description,
+        input_message_content=InputTextMessageContent(
+            message_text=header + body,
+            parse_mode="HTML"
+        )
+    )
+
+
+@router.inline_query()
+async def inline_search(inline_query: InlineQuery):
+    """@бот слова - найти свои записи прямо из поля ввода любого чата"""
+    query = inline_query.query.strip()
+    if not query:
+        await inline_query.answer([], cache_time=config.INLINE_CACHE_TIME, is_personal=True)
+        return
+
+    try:
+        offset = int(inline_query.offset or 0)
+    except ValueError:
+        offset = 0
+
+    user = await get_or_create_user(inline_query.from_user.id)
+    # Пока пользователь допечатывает запрос, ответы берутся из кэша результатов
+    hits = await search_answers_cached(user.id, query, limit=INLINE_MAX_RESULTS)
+    page = hits[offset:offset + INLINE_PAGE_SIZE]
+    next_offset = offset + INLINE_PAGE_SIZE
+    await inline_query.answer(
+        [_build_article(hit) for hit in page],
+        cache_time=config.INLINE_CACHE_TIME,
+        is_personal=True,
+        next_offset=str(next_offset) if next_offset < len(hits) else ""
+    )
@@ -0,0 +1,90 @@
+import html
+
+from aiogram import Router
+from aiogram.filters import Command, CommandObject
+from aiogram.types import Message, CallbackQuery, InlineKeyboardMarkup, InlineKeyboardButton
+
+from callbacks import SearchPage
+from database import get_or_create_user, search_answers, SearchHit
+from database.search import MATCH_START, MATCH_END
+from flow import FlowContext
+from i18n import Catalog
+from utils import edit_text_if_changed, remember_rendered
+
+router = Router(name=__name__)
+
+SEARCH_PAGE_SIZE = 5
+
+
+def _format_hit(hit: SearchHit) -> str:
+    """Одна найденная запись: дата, вопрос и фрагмент с подсвеченными словами."""
+    month, day = hit.date_key.split("-")
+    # Сначала экранируем текст пользователя, потом превращаем маркеры в теги
+    snippet = (
+        html.escape(hit.snippet)
+        .replace(MATCH_START, "<b>")
+        .replace(MATCH_END, "</b>")
+    )
+    return (
+        f"📅 <b>{day}.{month}.{hit.year}</b> - <i>{html.escape(hit.question_text)}</i>\n"
+        f"{snippet}"
+    )
+
+
+async def _build_results(
+    telegram_id: int, query: str, offset: int, i18n: Catalog
+) -> tuple[str, InlineKeyboardMarkup | None]:
+    """Страница результатов поиска с кнопками перелистывания."""
+    user = await get_or_create_user(telegram_id)
+    # Лишняя запись показывает, есть ли следующая страница
+    hits = await search_answers(user.id, query, limit=SEARCH_PAGE_SIZE + 1, offset=offset)
+    has_next = len(hits) > SEARCH_PAGE_SIZE
+    hits = hits[:SEARCH_PAGE_SIZE]
+
+    if not hits:
+        if offset:
+            return i18n("search.nothing_more"), None
+        return i18n("search.nothing_found", query=html.escape(query)), None
+
+    lines = [f"🔎 <b>{html.escape(query)}</b>"]
+    lines.extend(_format_hit(hit) for hit in hits)
+
+    navigation = []
+    if offset:
+        navigation.append(InlineKeyboardButton(
+            text=i18n("button.search_back"),
+            callback_data=SearchPage(max(offset - SEARCH_PAGE_SIZE, 0)).pack()
+        ))
+    if has_next:
+        navigation.append(InlineKeyboardButton(
+            text=i18n("button.search_more"),
+            callback_data=SearchPage(offset + SEARCH_PAGE_SIZE).pack()
+        ))
+    keyboard = InlineKeyboardMarkup(inline_keyboard=[navigation]) if navigation else None
+    return "\n\n".join(lines), keyboard
+
+
+@router.message(Command("search"))
+async def cmd_search(message: Message, command: CommandObject, flow: FlowContext, i18n: Catalog):
+    """Команда /search <слова> - найти записи по тексту ответов и вопросов"""
+    query = (command.args or "").strip()
+    if not query:
+        await message.answer(i18n("search.usage"), parse_mode="HTML")
+        return
+
+    flow.update(search_query=query)
+    text, keyboard = await _build_results(message.from_user.id, query, 0, i18n)
+    sent = await message.answer(text, parse_mode="HTML", reply_markup=keyboard)
+    remember_rendered(sent, text, reply_markup=keyboard, parse_mode="HTML")
+
+
+@router.callback_query(SearchPage.filter())
+async def search_page(callback: CallbackQuery, callback_data: SearchPage, flow: FlowContext, i18n: Catalog):
+    """Перелистнуть результаты поиска"""
+    await callback.answer()
+    if not flow.search_query:
+        await callback.message.answer(i18n("search.expired"))
+        return
+
+    text, keyboard = await _build_results(callback.from_user.id, flow.search_query, callback_data.offset, i18n)
+    await edit_text_if_changed(callback.message, text, reply_markup=keyboard, parse_mode="HTML")
@@ -2,28 +2,27 @@ import sys
 from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
 
-from aiogram import Router, F
+from aiogram import Router
 from aiogram.filters import Command
-from aiogram.types import Message
+from aiogram.types import Message, CallbackQuery
 from aiogram.fsm.context import FSMContext
+from callbacks import SetLanguage
 from states import SettingsStates
-from database import get_or_create_user, update_user_reminder_time
+from database import get_or_create_user, update_user_reminder_time, update_user_language
+from i18n import Catalog, SUPPORTED_LANGUAGES, get_catalog
+from keyboards import language_keyboard
 import re
 
-router = Router()
+router = Router(name=__name__)
 
 
 @router.message(Command("settings"))
-async def cmd_settings(message: Message, state: FSMContext):
+async def cmd_settings(message: Message, state: FSMContext, i18n: Catalog):
     """Команда /settings - изменить настройки"""
     user = await get_or_create_user(message.from_user.id)
     
     await message.answer(
-        f"⚙️ <b>Настройки</b>\n\n"
-        f"Текущее время напоминаний: <b>{user.reminder_time}</b>\n\n"
-        f"Чтобы изменить время, отправь новое время в формате <b>ЧЧ:ММ</b>\n"
-        f"Например: 09:00 или 21:30\n\n"
-        f"Или отправь /cancel для отмены",
+        i18n("settings.prompt", reminder_time=user.reminder_time),
         parse_mode="HTML"
     )
     
@@ -31,14 +30,14 @@ async def cmd_settings(message: Message, state: FSMContext):
 
 
 @router.message(SettingsStates.waiting_for_new_time, Command("cancel"))
-async def cancel_settings(message: Message, state: FSMContext):
+async def cancel_settings(message: Message, state: FSMContext, i18n: Catalog):
     """Отмена изменения настроек"""
-    await message.answer("Изменение настроек отменено.")
+    await message.answer(i18n("settings.cancelled"))
     await state.clear()
 
 
 @router.message(SettingsStates.waiting_for_new_time)
-async def process_new_time(message: Message, state: FSMContext):
+async def process_new_time(message: Message, state: FSMContext, i18n: Catalog):
     """Обработка нового времени напоминания"""
     time_text = message.text.strip()
     
@@ -47,13 +46,7 @@ async def process_new_time(message: Message, state: FSMContext):
     match = time_pattern.match(time_text)
     
     if not match:
-        await message.answer(
-            "Неправильный формат времени ❌\n\n"
-            "Пожалуйста, введи время в формате <b>ЧЧ:ММ</b>\n"
-            "Например: 09:00 или 21:30\n\n"
-            "Или отправь /cancel для отмены",
-            parse_mode="HTML"
-        )
+        await message.answer(i18n("time.invalid_format_cancel"), parse_mode="HTML")
         return
     
     # Нормализуем формат (добавляем ведущий ноль если нужно)
@@ -64,14 +57,28 @@ async def process_new_time(message: Message, state: FSMContext):
     success = await update_user_reminder_time(message.from_user.id, normalized_time)
     
     if success:
-        await message.answer(
-            f"✅ Время напоминаний изменено!\n\n"
-            f"Новое время: <b>{normalized_time}</b>\n\n"
-            f"Со следующего дня буду присылать напоминания в это время.",
-            parse_mode="HTML"
-        )
+        await message.answer(i18n("settings.time_changed", time=normalized_time), parse_mode="HTML")
         await state.clear()
     else:
-        await message.answer(
-            "Произошла ошибка при сохранении времени. Попробуй ещё раз."
-        )
\ No newline at end of file
+        await message.answer(i18n("settings.time_save_error"))
+
+
+@router.message(Command("language"))
+async def cmd_language(message: Message, i18n: Catalog):
+    """Команда /language - выбрать язык интерфейса"""
+    await message.answer(i18n("language.prompt"), reply_markup=language_keyboard(i18n))
+
+
+@router.callback_query(SetLanguage.filter())
+async def set_language(callback: CallbackQuery, callback_data: SetLanguage):
+    """Сохранить выбранный язык"""
+    await callback.answer()
+    language = callback_data.language
+    if language not in SUPPORTED_LANGUAGES:
+        return
+
+    await get_or_create_user(callback.from_user.id)
+    await update_user_language(callback.from_user.id, language)
+    # Ответ уже на новом языке
+    i18n = get_catalog(language)
+    await callback.message.edit_text(i18n("language.changed"))
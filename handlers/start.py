@@ -4,13 +4,14 @@ from aiogram.types import Message
 from aiogram.fsm.context import FSMContext
 from states import OnboardingStates
 from database import get_or_create_user, update_user_reminder_time
+from i18n import Catalog
 import re
 
-router = Router()
+router = Router(name=__name__)
 
 
 @router.message(CommandStart())
-async def cmd_start(message: Message, state: FSMContext):
+async def cmd_start(message: Message, state: FSMContext, i18n: Catalog):
     """Обработчик команды /start"""
     user = await get_or_create_user(message.from_user.id)
     
@@ -19,31 +20,18 @@ async def cmd_start(message: Message, state: FSMContext):
     
     if is_new_user:
         # Онбординг для нового пользователя
-        await message.answer(
-            "Привет! Я бот-пятибук 🌿\n\n"
-            "Каждый день буду задавать тебе один и тот же вопрос в одну и ту же дату, "
-            "чтобы ты могла смотреть, как меняешься из года в год.\n\n"
-            "Для начала, давай настроим время ежедневного напоминания.\n"
-            "В какое время тебе удобно отвечать на вопросы?\n\n"
-            "Отправь время в формате <b>ЧЧ:ММ</b> (например, 09:00 или 21:30)",
-            parse_mode="HTML"
-        )
+        await message.answer(i18n("start.welcome_new"), parse_mode="HTML")
         await state.set_state(OnboardingStates.waiting_for_time)
     else:
         # Пользователь уже зарегистрирован
         await message.answer(
-            f"С возвращением! 💚\n\n"
-            f"Твоё текущее время напоминаний: <b>{user.reminder_time}</b>\n\n"
-            f"Доступные команды:\n"
-            f"/today - сегодняшняя запись\n"
-            f"/settings - изменить время напоминаний\n"
-            f"/help - помощь",
+            i18n("start.welcome_back", reminder_time=user.reminder_time),
             parse_mode="HTML"
         )
 
 
 @router.message(OnboardingStates.waiting_for_time)
-async def process_reminder_time(message: Message, state: FSMContext):
+async def process_reminder_time(message: Message, state: FSMContext, i18n: Catalog):
     """Обработка времени напоминания при онбординге"""
     time_text = message.text.strip()
     
@@ -52,12 +40,7 @@ async def process_reminder_time(message: Message, state: FSMContext):
     match = time_pattern.match(time_text)
     
     if not match:
-        await message.answer(
-            "Неправильный формат времени ❌\n\n"
-            "Пожалуйста, введи время в формате <b>ЧЧ:ММ</b>\n"
-            "Например: 09:00 или 21:30",
-            parse_mode="HTML"
-        )
+        await message.answer(i18n("time.invalid_format"), parse_mode="HTML")
         return
     
     # Нормализуем формат (добавляем ведущий ноль если нужно)
@@ -68,19 +51,7 @@ async def process_reminder_time(message: Message, state: FSMContext):
     success = await update_user_reminder_time(message.from_user.id, normalized_time)
     
     if success:
-        await message.answer(
-            f"Отлично! ✅\n\n"
-            f"Время напоминаний установлено: <b>{normalized_time}</b>\n\n"
-            f"Каждый день в это время я буду присылать тебе вопрос дня.\n\n"
-            f"<b>Полезные команды:</b>\n"
-            f"/today - сегодняшняя запись\n"
-            f"/settings - изменить время напоминаний\n"
-            f"/help - помощь\n\n"
-            f"Можешь попробовать команду /today прямо сейчас! 🌟",
-            parse_mode="HTML"
-        )
+        await message.answer(i18n("start.time_saved", time=normalized_time), parse_mode="HTML")
         await state.clear()
     else:
-        await message.answer(
-            "Произошла ошибка при сохранении времени. Попробуй ещё раз или напиши /start"
-        )
\ No newline at end of file
+        await message.answer(i18n("start.time_save_error"))
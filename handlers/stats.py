@@ -0,0 +1,43 @@
+from datetime import datetime
+
+from aiogram import Router
+from aiogram.filters import Command
+from aiogram.types import Message
+
+from database import get_or_create_user, get_user_stats
+from database.stats import current_streak
+from i18n import Catalog
+from utils import is_leap_year
+
+router = Router(name=__name__)
+
+
+@router.message(Command("stats"))
+async def cmd_stats(message: Message, i18n: Catalog):
+    """Команда /stats - серии, записи за год и заполненность дат"""
+    user = await get_or_create_user(message.from_user.id)
+    # Статистика ведётся при каждом изменении ответов, здесь только чтение одной строки
+    stats = await get_user_stats(user.id)
+
+    today = datetime.now().date()
+    days_in_year = 366 if is_leap_year(today.year) else 365
+    answered_this_year = stats.answers_by_year.get(str(today.year), 0)
+    dated = sum(stats.dates_by_years.values())
+
+    lines = [i18n(
+        "stats.summary",
+        current=current_streak(stats, today),
+        longest=stats.longest_run,
+        year=today.year,
+        this_year=answered_this_year,
+        day_of_year=today.timetuple().tm_yday,
+        days_in_year=days_in_year,
+        total=stats.total_answers,
+        dated=dated
+    )]
+    if stats.dates_by_years:
+        lines.append(i18n("stats.coverage_title"))
+        for years, dates in sorted(stats.dates_by_years.items(), key=lambda item: int(item[0])):
+            lines.append(i18n("stats.coverage_line", years=years, dates=dates))
+
+    await message.answer("\n".join(lines), parse_mode="HTML")
@@ -0,0 +1,86 @@
+import importlib
+import keyword
+import string
+from typing import Optional
+
+import config
+
+SUPPORTED_LANGUAGES = ("ru", "en")
+
+_formatter = string.Formatter()
+
+
+class Template:
+    """
+    Шаблон сообщения, скомпилированный один раз при загрузке каталога
+
+    Синтаксис как у str.format, но только с простыми именами полей: "{year}",
+    "{count:>3}". Шаблон превращается в функцию с f-строкой (render(**values)),
+    так что при отправке сообщения разбора строки нет.
+    """
+
+    __slots__ = ("source", "render")
+
+    def __init__(self, source: str):
+        self.source = source
+        fields = []
+        body = []
+        for literal, field, spec, conversion in _formatter.parse(source):
+            body.append(literal.replace("{", "{{").replace("}", "}}"))
+            if field is None:
+                continue
+            if not field.isidentifier() or keyword.iskeyword(field) or "{" in spec:
+                raise ValueError(f"Unsupported template field {field!r} in {source!r}")
+            if field not in fields:
+                fields.append(field)
+            body.append(
+                "{" + field + (f"!{conversion}" if conversion else "") + (f":{spec}" if spec else "") + "}"
+            )
+
+        if fields:
+            code = f"lambda *, {', '.join(fields)}, **_: f{''.join(body)!r}"
+            self.render = eval(compile(code, f"<template {source[:30]!r}>", "eval"), {})
+        else:
+            self.render = lambda **_: source
+
+
+class Catalog:
+    """
+    Скомпилированные сообщения одного языка
+
+    Вызывается как функция: i18n("settings.prompt", reminder_time="09:00").
+    Ключи, которых нет в каталоге, берутся из каталога языка по умолчанию.
+    """
+
+    def __init__(self, language: str, messages: dict[str, str], fallback: Optional["Catalog"] = None):
+        self.language = language
+        # Ключи без перевода сразу указывают на шаблоны каталога по умолчанию
+        self._templates = dict(fallback._templates) if fallback is not None else {}
+        self._templates.update((key, Template(source)) for key, source in messages.items())
+
+    def __call__(self, key: str, **values) -> str:
+        template = self._templates.get(key)
+        if template is None:
+            raise KeyError(f"Unknown message key {key!r}")
+        return template.render(**values)
+
+    def __repr__(self):
+        return f"<Catalog(language={self.language}, messages={len(self._templates)})>"
+
+
+_catalogs: dict[str, Catalog] = {}
+
+
+def get_catalog(language: Optional[str]) -> Catalog:
+    """Каталог языка; загружается и компилируется при первом обращении"""
+    if language not in SUPPORTED_LANGUAGES:
+        language = config.DEFAULT_LANGUAGE
+    catalog = _catalogs.get(language)
+    if catalog is None:
+        module = importlib.import_module(f"i18n.locales.{language}")
+        fallback = None if language == config.DEFAULT_LANGUAGE else get_catalog(config.DEFAULT_LANGUAGE)
+        catalog = _catalogs[language] = Catalog(language, module.MESSAGES, fallback)
+    return catalog
+
+
+__all__ = ["SUPPORTED_LANGUAGES", "Template", "Catalog", "get_catalog"]
@@ -0,0 +1,406 @@
+MESSAGES = {
+    "language.name": "🇬🇧 English",
+
+    "start.welcome_new": (
+        "Hi! I'm a five-year journal bot 🌿\n\n"
+        "Every day I'll ask you the same question on the same date, "
+        "so you can see how you change from year to year.\n\n"
+        "First, let's set up the time of the daily reminder.\n"
+        "When is it convenient for you to answer?\n\n"
+        "Send the time as <b>HH:MM</b> (for example, 09:00 or 21:30)"
+    ),
+    "start.welcome_back": (
+        "Welcome back! 💚\n\n"
+        "Your reminder time: <b>{reminder_time}</b>\n\n"
+        "Commands:\n"
+        "/today - today's entry\n"
+        "/settings - change the reminder time\n"
+        "/help - help"
+    ),
+    "start.time_saved": (
+        "Great! ✅\n\n"
+        "Reminder time is set to <b>{time}</b>\n\n"
+        "Every day at this time I'll send you the question of the day.\n\n"
+        "<b>Useful commands:</b>\n"
+        "/today - today's entry\n"
+        "/settings - change the reminder time\n"
+        "/help - help\n\n"
+        "You can try /today right now! 🌟"
+    ),
+    "start.time_save_error": "Could not save the time. Try again or send /start",
+
+    "time.invalid_format": (
+        "Wrong time format ❌\n\n"
+        "Please send the time as <b>HH:MM</b>\n"
+        "For example: 09:00 or 21:30"
+    ),
+    "time.invalid_format_cancel": (
+        "Wrong time format ❌\n\n"
+        "Please send the time as <b>HH:MM</b>\n"
+        "For example: 09:00 or 21:30\n\n"
+        "Or send /cancel to cancel"
+    ),
+
+    "settings.prompt": (
+        "⚙️ <b>Settings</b>\n\n"
+        "Reminder time: <b>{reminder_time}</b>\n\n"
+        "To change it, send the new time as <b>HH:MM</b>\n"
+        "For example: 09:00 or 21:30\n\n"
+        "Or send /cancel to cancel"
+    ),
+    "settings.cancelled": "Settings change cancelled.",
+    "settings.time_changed": (
+        "✅ Reminder time changed!\n\n"
+        "New time: <b>{time}</b>\n\n"
+        "Starting tomorrow, reminders will come at this time."
+    ),
+    "settings.time_save_error": "Could not save the time. Please try again.",
+
+    "language.prompt": "Choose the interface language:",
+    "language.changed": "Done, I speak English now 🇬🇧",
+
+    "throttle.too_fast": "Too many messages in a row ⏳ Wait a couple of seconds and send it again.",
+
+    "help.text": (
+        "<b>Five-year journal bot 🌿</b>\n\n"
+        "I help you answer the same question on the same date every year "
+        "to see how you change over time.\n\n"
+        "<b>How it works:</b>\n"
+        "• Every day at the chosen time I send a reminder\n"
+        "• The first time you create a question for the day\n"
+        "• Then you answer it\n"
+        "• In the following years on this date I'll show your past answers\n\n"
+        "<b>Commands:</b>\n"
+        "/today - see/answer today's question\n"
+        "/date - see entries for a chosen date\n"
+        "/import - upload answers from a file (CSV or JSON)\n"
+        "/search - find entries by words\n"
+        "/export - download all entries as a file (md, csv or jsonl)\n"
+        "/stats - streaks and entry statistics\n"
+        "/settings - change the reminder time\n"
+        "/language - change the language\n"
+        "/help - show this help"
+    ),
+
+    "stats.summary": (
+        "📊 <b>Your statistics</b>\n\n"
+        "🔥 Current streak: {current} d.\n"
+        "🏆 Longest streak: {longest} d.\n"
+        "📝 Entries in {year}: {this_year} (days passed: {day_of_year} of {days_in_year})\n"
+        "📚 Total answers: {total}\n"
+        "🗓 Dates with answers: {dated} of 366"
+    ),
+    "stats.coverage_title": "\n<b>Years filled per date:</b>",
+    "stats.coverage_line": "• {years} y. - dates: {dates}",
+
+    "reminder.daily_no_question": (
+        "Hi! Time for a journal entry 🌿\n\n"
+        "You don't have a question for this day yet.\n\n"
+        "Use /today to create a question and answer it."
+    ),
+    "reminder.daily_answered": (
+        "Good morning! ☀️\n\n"
+        "Today's question:\n"
+        "<b>{question}</b>\n\n"
+        "You have already answered it in {year} ✅"
+    ),
+    "reminder.daily_question": (
+        "Good morning! ☀️\n\n"
+        "Today's question for you:\n\n"
+        "<b>{question}</b>\n\n"
+        "Use /today to answer it."
+    ),
+    "reminder.evening_question": (
+        "🌙 It's 23:00 and there is no answer for today yet.\n\n"
+        "Today's question:\n"
+        "<b>{question}</b>\n\n"
+        "Do you want to write the answer now?"
+    ),
+    "reminder.evening_no_question": (
+        "🌙 It's 23:00 and there is no entry for today yet.\n\n"
+        "Do you want to add a question and an answer for today?"
+    ),
+    "reminder.yesterday_question": (
+        "Good morning! ☀️\n\n"
+        "Looks like you didn't make an entry yesterday ({date}).\n\n"
+        "Question of the day:\n"
+        "<b>{question}</b>\n\n"
+        "Do you want to write yesterday's answer now?"
+    ),
+    "reminder.yesterday_no_question": (
+        "Good morning! ☀️\n\n"
+        "Looks like you didn't make an entry yesterday ({date}).\n\n"
+        "Do you want to add a question and an answer for yesterday now?"
+    ),
+
+    "common.empty_question": "The question can't be empty. Please try again.",
+    "common.empty_answer": "The answer can't be empty. Please try again.",
+    "common.empty_text": "The text can't be empty. Please try again.",
+    "common.error_try_today": "Something went wrong. Try the /today command",
+    "common.update_error": "Something went wrong while updating. Please try again.",
+    "common.delete_error": "Something went wrong while deleting. Please try again.",
+
+    "today.no_question": (
+        "Hi! Time for a journal entry 🌿\n\n"
+        "You don't have a question for this day yet.\n"
+        "Please write the question of the day you want to ask yourself on this date every year."
+    ),
+    "today.answered": (
+        "Today's question:\n\n"
+        "<b>{question}</b>\n\n"
+        "You have already answered it in {year} ✅\n\n"
+        "Your answer:\n{answer}"
+    ),
+    "today.question": (
+        "Today's question for you:\n\n"
+        "<b>{question}</b>\n\n"
+        "Do you want to see your past answers first or write a new one right away?"
+    ),
+    "today.question_saved": (
+        "Great, the question is saved ✅\n\n"
+        "Now write your answer for this year."
+    ),
+    "today.already_answered": (
+        "The answer for this year is already saved ✅\n\n"
+        "Editing will be added later."
+    ),
+    "today.first_answer_saved": (
+        "Saved 💚\n\n"
+        "Do you want to add your answers for past years from a paper journal, "
+        "so I can show you the full history?"
+    ),
+    "today.answer_saved": "Great, the answer for {year} is saved ✅",
+    "today.write_answer": "Great! Write your answer for {year} 👇",
+
+    "past.title": "Your answers on this day:",
+    "past.has_current_year": "You already have an answer for this year ✅",
+    "past.write_current_year": "Now write your answer for this year 👇",
+    "past.none": (
+        "You don't have any answers to this question yet.\n"
+        "Write your first answer! ✍️"
+    ),
+
+    "past_years.choose_year": (
+        "Which year do you want to add an answer for?\n\n"
+        "Pick a year from the list or type it in:"
+    ),
+    "past_years.skipped": "All right! You can always add past answers later with the /today command 💚",
+    "past_years.write_answer": "Write your answer for {year} 👇",
+    "past_years.answer_saved": (
+        "The answer for {year} is saved ✅\n\n"
+        "Do you want to add another year?"
+    ),
+    "past_years.finished": (
+        "Done 💚\n\n"
+        "Now on this date I'll show you all saved answers from past years."
+    ),
+
+    "year.too_early": "The year can't be earlier than {first_year}. Pick another year.",
+    "year.too_late": "The year can't be later than the current one ({current_year}). Pick another year.",
+    "year.import_not_past": "To add a past answer, the year must be earlier than the current one ({current_year}). Pick another year.",
+    "year.not_leap": "{year} is not a leap year, so you can't add an answer for February 29 in that year.",
+    "year.answer_exists": "An answer for {year} already exists. Pick another year.",
+    "year.choose_another": "{error}\n\nPick another year:",
+    "year.choose_from_list": "{error}\n\nPick a year from the list or try another one:",
+    "year.not_a_number": "Please pick a year from the list or type the year as a number ({first_year}-current):",
+    "year.enter_number": "Please type the year as a number, for example: <b>2021</b>",
+
+    "edit.choose_year": (
+        "Which year's answer do you want to change or delete?\n\n"
+        "Pick a year from the list or type it in:"
+    ),
+    "edit.no_answer": (
+        "There is no answer for {year}.\n\n"
+        "Try another year or go back."
+    ),
+    "edit.current_answer": (
+        "Your saved answer for {year}:\n\n"
+        "<i>{answer}</i>\n\n"
+        "⏰ Time left to edit: {time_left}\n\n"
+        "What do you want to do?"
+    ),
+    "edit.locked": (
+        "The answer for {year} can't be changed or deleted — "
+        "it was saved more than 24 hours ago.\n\n"
+        "In a five-year journal, answers stay as part of your history 💛"
+    ),
+    "edit.expired": "⚠️ The time for editing has run out (more than 24 hours have passed).",
+    "edit.write_new_text": "Write the new text of your answer for {year} 👇",
+    "edit.text_updated": "The answer for {year} is updated ✅",
+    "edit.choose_new_year": (
+        "Which year should it be moved to?\n\n"
+        "Pick a year from the list or type it in:"
+    ),
+    "edit.year_changed": "The year of this answer is changed from {old_year} to {year} ✅",
+    "delete.expired": "⚠️ The time for deleting has run out (more than 24 hours have passed).",
+    "delete.confirm": (
+        "Delete the answer for {year}?\n\n"
+        "<i>{answer}</i>"
+    ),
+    "delete.done": "The answer for {year} is deleted ❌",
+
+    "time_left.unknown": "unknown",
+    "time_left.expired": "time is up",
+    "time_left.hours": "{hours} h",
+    "time_left.minutes": "{minutes} min",
+
+    "month.1": "January",
+    "month.2": "February",
+    "month.3": "March",
+    "month.4": "April",
+    "month.5": "May",
+    "month.6": "June",
+    "month.7": "July",
+    "month.8": "August",
+    "month.9": "September",
+    "month.10": "October",
+    "month.11": "November",
+    "month.12": "December",
+    "date.month_grid": (
+        "🗓 <b>{month}</b>\n\n"
+        "Pick a day or send a date as <b>DD.MM</b>, for example: <b>05.03</b>\n\n"
+        "• - has a question, number - years with answers"
+    ),
+    "date.invalid": "I don't understand this date. Please send it as <b>DD.MM</b>, for example 05.03",
+    "date.title": "📅 Date: <b>{date}</b>",
+    "date.no_question": (
+        "You don't have a question for {date} yet.\n"
+        "Do you want to create a question for this date?"
+    ),
+    "date.question": "<b>Question:</b>\n{question}",
+    "date.answers_title": "<b>Answers by year:</b>",
+    "date.no_answers": "No answers yet. ✍️",
+
+    "date.future": (
+        "⚠️ You can't make entries for future dates.\n\n"
+        "Pick a date no later than today."
+    ),
+    "date.ask_question": "Please write the question you want to ask yourself every year on {date}.",
+    "date.backdated_question_saved": (
+        "Great, the question is saved ✅\n\n"
+        "And now write your answer for {date}.{year} 👇"
+    ),
+    "date.question_saved": (
+        "Great, the question is saved ✅\n\n"
+        "Now write your answer for {date}.{year} 👇"
+    ),
+    "date.choose_year": (
+        "Which year do you want to write an answer for on {date}?\n\n"
+        "Pick a year from the list or type it in:"
+    ),
+    "date.answer_exists": (
+        "You already have an answer for {year} on {date}.\n"
+        "Pick another year or use the edit button."
+    ),
+    "date.enter_year": "Type the year for {date} (for example: 2018, 2017, 2010):",
+    "date.year_out_of_range": "The year must be between 1900 and {current_year}. Please try again.",
+    "date.invalid_year": "Please type a valid year (for example: 2023)",
+    "date.write_answer_after_year": "Great! Now write your answer for {date}.{year} 👇",
+    "date.write_answer": "Write your answer for {date}.{year} 👇",
+    "date.write_new_answer": "Write the new answer for {date}.{year} 👇",
+    "date.answer_saved": "The answer for {date}.{year} is saved ✅",
+    "date.question_and_answer_saved": "Great! The question and the answer for {date}.{year} are saved ✅",
+    "date.answer_updated": "The answer for {date}.{year} is updated ✅",
+    "date.answer_deleted": "The answer for {date}.{year} is deleted ✅",
+
+    "evening.no_question": "⚠️ Something went wrong. The question for today was not found.",
+    "evening.write_answer": "Great! Write your answer for today 👇",
+    "evening.ask_question": "Please write the question of the day you want to ask yourself on today's date every year.",
+    "evening.skipped": "OK, skipping this day. I'll be back tomorrow 💚",
+    "evening.already_answered": "The answer for this year is already saved ✅",
+    "evening.question_saved": (
+        "Great, the question is saved ✅\n\n"
+        "Now write your answer for today 👇"
+    ),
+    "evening.answer_saved": "Great, today's answer is saved ✅",
+
+    "yesterday.no_question": "⚠️ Something went wrong. The question for yesterday was not found.",
+    "yesterday.write_answer": "Great! Write your answer for yesterday 👇",
+    "yesterday.ask_question": "Please write the question you want to ask yourself on yesterday's date every year.",
+    "yesterday.skipped": "OK, skipping yesterday. Let's go on with today 💚",
+    "yesterday.already_answered": "The answer for yesterday is already saved ✅",
+    "yesterday.question_saved": (
+        "Great, the question is saved ✅\n\n"
+        "Now write your answer for yesterday 👇"
+    ),
+    "yesterday.answer_saved": "Great, yesterday's answer is saved ✅",
+
+    "search.usage": (
+        "Tell me what to look for, for example: <code>/search sea</code>\n\n"
+        "I'll find answers that contain all the words (and their forms with the same beginning)."
+    ),
+    "search.nothing_found": "Nothing found for «{query}» 🤷",
+    "search.nothing_more": "Nothing else was found.",
+    "search.expired": "The search has expired, send /search again",
+
+    "export.usage": (
+        "Usage: /export [format]\n\n"
+        "Formats: {formats}"
+    ),
+    "export.empty": "Nothing to export yet: you don't have any questions ✍️",
+    "export.too_large": "The journal is too large for one file. Try another format.",
+    "export.caption": "Your five-year journal ({format}) 📦",
+    "export.title": "Five-year journal",
+
+    "import.help": (
+        "Send me a file with entries and I'll add them to your journal 📥\n\n"
+        "<b>Formats:</b> CSV, JSON Lines or a JSON array\n"
+        "<b>Columns:</b> date, question, year, answer\n"
+        "• <b>date</b> - 05.03, 03-05 or a full date 05.03.2019\n"
+        "• <b>year</b> - can be omitted if the date has the year\n"
+        "• without <b>answer</b> only the question is added\n\n"
+        "A file from /export works too. If a date already has a question "
+        "or a year already has an answer, they stay as they were.\n\n"
+        "You can add answers for past years one by one with /today"
+    ),
+    "import.unsupported": "I can only import .csv, .jsonl and .json files. More: /import",
+    "import.too_large": "The file is too large: Telegram lets bots download files up to 20 MB.",
+    "import.unreadable": (
+        "Could not read the file. Check that it is CSV or JSON in UTF-8.\n\n"
+        "Added so far: questions {questions}, answers {answers}."
+    ),
+    "import.done": "Import finished ✅\n",
+    "import.records": "Entries in the file: {count}",
+    "import.new_questions": "New questions: {count}",
+    "import.new_answers": "New answers: {count}",
+    "import.existing_answers": "Answers that already existed: {count}",
+    "import.errors": "Skipped with errors: {count} (entries {numbers})",
+
+    "admin.profile_usage": "Usage: /profile [seconds]",
+    "admin.profile_bad_duration": "The duration must be from 1 to {max_seconds} seconds.",
+    "admin.profile_busy": "Profiling is already running, wait for the report.",
+    "admin.profile_started": "Profiling for {seconds} s, I'll send the report afterwards 📊",
+    "admin.profile_failed": "Profiling failed: {error}",
+    "admin.profile_caption": "Profile for {seconds} s, sorted by cumulative time",
+
+    "button.back": "⬅️ Back",
+    "button.cancel": "⬅️ Cancel",
+    "button.edit_text": "✏️ Edit text",
+    "button.edit_year": "📅 Change year",
+    "button.delete_answer": "🗑 Delete answer",
+    "button.confirm_delete": "🗑 Yes, delete",
+    "button.add_another_year": "➕ Add another year",
+    "button.finish": "✅ Finish",
+    "button.evening_answer_today": "✍️ Answer for today",
+    "button.evening_add_question": "✍️ Add a question and answer",
+    "button.skip": "🙈 Skip",
+    "button.yesterday_answer": "✍️ Write the answer for {date}",
+    "button.yesterday_add_question": "✍️ Add a question and answer for {date}",
+    "button.skip_yesterday": "🙈 Skip yesterday",
+    "button.show_past_answers": "📖 See past answers",
+    "button.write_answer": "✍️ Write the answer for {year}",
+    "button.add_past_years": "➕ Add answers for past years",
+    "button.enter_past_years": "➕ Add past years",
+    "button.enough_for_today": "⏭ No, that's enough for today",
+    "button.earlier": "◀ Earlier",
+    "button.later": "Later ▶",
+    "button.edit_or_delete_answer": "✏️ Edit/delete the answer",
+    "button.other_year": "✍️ Type another year",
+    "button.create_question": "➕ Create a question",
+    "button.edit_answer_for_year": "✏️ Edit the answer for {year}",
+    "button.delete_answer_for_year": "🗑 Delete {year}",
+    "button.add_past_answer": "➕ Add an answer for a past year",
+    "button.calendar": "🗓 Calendar",
+    "button.search_back": "◀ Back",
+    "button.search_more": "More ▶",
+}
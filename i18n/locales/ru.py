@@ -0,0 +1,432 @@
+# Русский - основной язык бота; в остальных каталогах можно переводить не все ключи
+MESSAGES = {
+    "language.name": "🇷🇺 Русский",
+
+    # /start и онбординг
+    "start.welcome_new": (
+        "Привет! Я бот-пятибук 🌿\n\n"
+        "Каждый день буду задавать тебе один и тот же вопрос в одну и ту же дату, "
+        "чтобы ты могла смотреть, как меняешься из года в год.\n\n"
+        "Для начала, давай настроим время ежедневного напоминания.\n"
+        "В какое время тебе удобно отвечать на вопросы?\n\n"
+        "Отправь время в формате <b>ЧЧ:ММ</b> (например, 09:00 или 21:30)"
+    ),
+    "start.welcome_back": (
+        "С возвращением! 💚\n\n"
+        "Твоё текущее время напоминаний: <b>{reminder_time}</b>\n\n"
+        "Доступные команды:\n"
+        "/today - сегодняшняя запись\n"
+        "/settings - изменить время напоминаний\n"
+        "/help - помощь"
+    ),
+    "start.time_saved": (
+        "Отлично! ✅\n\n"
+        "Время напоминаний установлено: <b>{time}</b>\n\n"
+        "Каждый день в это время я буду присылать тебе вопрос дня.\n\n"
+        "<b>Полезные команды:</b>\n"
+        "/today - сегодняшняя запись\n"
+        "/settings - изменить время напоминаний\n"
+        "/help - помощь\n\n"
+        "Можешь попробовать команду /today прямо сейчас! 🌟"
+    ),
+    "start.time_save_error": "Произошла ошибка при сохранении времени. Попробуй ещё раз или напиши /start",
+
+    # Ввод времени напоминаний
+    "time.invalid_format": (
+        "Неправильный формат времени ❌\n\n"
+        "Пожалуйста, введи время в формате <b>ЧЧ:ММ</b>\n"
+        "Например: 09:00 или 21:30"
+    ),
+    "time.invalid_format_cancel": (
+        "Неправильный формат времени ❌\n\n"
+        "Пожалуйста, введи время в формате <b>ЧЧ:ММ</b>\n"
+        "Например: 09:00 или 21:30\n\n"
+        "Или отправь /cancel для отмены"
+    ),
+
+    # /settings
+    "settings.prompt": (
+        "⚙️ <b>Настройки</b>\n\n"
+        "Текущее время напоминаний: <b>{reminder_time}</b>\n\n"
+        "Чтобы изменить время, отправь новое время в формате <b>ЧЧ:ММ</b>\n"
+        "Например: 09:00 или 21:30\n\n"
+        "Или отправь /cancel для отмены"
+    ),
+    "settings.cancelled": "Изменение настроек отменено.",
+    "settings.time_changed": (
+        "✅ Время напоминаний изменено!\n\n"
+        "Новое время: <b>{time}</b>\n\n"
+        "Со следующего дня буду присылать напоминания в это время."
+    ),
+    "settings.time_save_error": "Произошла ошибка при сохранении времени. Попробуй ещё раз.",
+
+    # /language
+    "language.prompt": "Выбери язык интерфейса:",
+    "language.changed": "Готово, теперь я говорю по-русски 🇷🇺",
+
+    # Защита от флуда
+    "throttle.too_fast": "Слишком много сообщений подряд ⏳ Подожди пару секунд и отправь ещё раз.",
+
+    # /help
+    "help.text": (
+        "<b>Бот-пятибук 🌿</b>\n\n"
+        "Я помогаю тебе отвечать на один и тот же вопрос каждый год в одну и ту же дату, "
+        "чтобы наблюдать, как ты меняешься со временем.\n\n"
+        "<b>Как это работает:</b>\n"
+        "• Каждый день в установленное время я присылаю напоминание\n"
+        "• В первый раз ты создаёшь вопрос для этого дня\n"
+        "• Затем отвечаешь на него\n"
+        "• В следующие годы в эту же дату я покажу твои прошлые ответы\n\n"
+        "<b>Доступные команды:</b>\n"
+        "/today - посмотреть/ответить на сегодняшний вопрос\n"
+        "/date - посмотреть записи за выбранную дату\n"
+        "/import - загрузить ответы из файла (CSV или JSON)\n"
+        "/search - найти записи по словам\n"
+        "/export - выгрузить все записи файлом (md, csv или jsonl)\n"
+        "/stats - серии и статистика записей\n"
+        "/settings - изменить время напоминаний\n"
+        "/language - сменить язык\n"
+        "/help - показать эту справку\n\n"
+        "Если есть вопросы или пожелания, напиши @твой_username 💚"
+    ),
+
+    # /stats
+    "stats.summary": (
+        "📊 <b>Твоя статистика</b>\n\n"
+        "🔥 Текущая серия: {current} дн.\n"
+        "🏆 Самая длинная серия: {longest} дн.\n"
+        "📝 Записей в {year} году: {this_year} (прошло дней: {day_of_year} из {days_in_year})\n"
+        "📚 Всего ответов: {total}\n"
+        "🗓 Дат с ответами: {dated} из 366"
+    ),
+    "stats.coverage_title": "\n<b>Сколько лет заполнено у даты:</b>",
+    "stats.coverage_line": "• {years} г. - дат: {dates}",
+
+    # Напоминания (scheduler/messages.py): {question} подставляется для каждого пользователя
+    "reminder.daily_no_question": (
+        "Привет! Время для записи в пятибук 🌿\n\n"
+        "Сегодня у тебя ещё нет вопроса для этого дня.\n\n"
+        "Используй команду /today чтобы создать вопрос и ответить на него."
+    ),
+    "reminder.daily_answered": (
+        "Доброе утро! ☀️\n\n"
+        "Сегодняшний вопрос:\n"
+        "<b>{question}</b>\n\n"
+        "Ты уже ответила на этот вопрос в {year} году ✅"
+    ),
+    "reminder.daily_question": (
+        "Доброе утро! ☀️\n\n"
+        "Сегодняшний вопрос для тебя:\n\n"
+        "<b>{question}</b>\n\n"
+        "Используй команду /today чтобы ответить на вопрос."
+    ),
+    "reminder.evening_question": (
+        "🌙 Уже 23:00, а ответа за сегодня ещё нет.\n\n"
+        "Сегодняшний вопрос:\n"
+        "<b>{question}</b>\n\n"
+        "Хочешь записать ответ сейчас?"
+    ),
+    "reminder.evening_no_question": (
+        "🌙 Уже 23:00, а записи за сегодня ещё нет.\n\n"
+        "Хочешь добавить вопрос и ответ за сегодняшний день?"
+    ),
+    "reminder.yesterday_question": (
+        "Доброе утро! ☀️\n\n"
+        "Похоже, вчера ({date}) ты не успела сделать запись.\n\n"
+        "Вопрос дня:\n"
+        "<b>{question}</b>\n\n"
+        "Хочешь записать ответ за вчера сейчас?"
+    ),
+    "reminder.yesterday_no_question": (
+        "Доброе утро! ☀️\n\n"
+        "Похоже, вчера ({date}) ты не успела сделать запись.\n\n"
+        "Хочешь добавить вопрос и ответ за вчера сейчас?"
+    ),
+
+    # Общие ответы на пустой ввод и ошибки
+    "common.empty_question": "Вопрос не может быть пустым. Попробуй ещё раз.",
+    "common.empty_answer": "Ответ не может быть пустым. Попробуй ещё раз.",
+    "common.empty_text": "Текст не может быть пустым. Попробуй ещё раз.",
+    "common.error_try_today": "Произошла ошибка. Попробуй команду /today",
+    "common.update_error": "Произошла ошибка при обновлении. Попробуй ещё раз.",
+    "common.delete_error": "Произошла ошибка при удалении. Попробуй ещё раз.",
+
+    # /today
+    "today.no_question": (
+        "Привет! Время для записи в пятибук 🌿\n\n"
+        "Сегодня у тебя ещё нет вопроса для этого дня.\n"
+        "Напиши, пожалуйста, вопрос дня, который хочешь задавать себе каждый год в эту дату."
+    ),
+    "today.answered": (
+        "Сегодняшний вопрос:\n\n"
+        "<b>{question}</b>\n\n"
+        "Ты уже ответила на этот вопрос в {year} году ✅\n\n"
+        "Твой ответ:\n{answer}"
+    ),
+    "today.question": (
+        "Сегодняшний вопрос для тебя:\n\n"
+        "<b>{question}</b>\n\n"
+        "Хочешь сначала посмотреть прошлые ответы или сразу написать новый?"
+    ),
+    "today.question_saved": (
+        "Отлично, вопрос сохранён ✅\n\n"
+        "Теперь напиши свой ответ за этот год."
+    ),
+    "today.already_answered": (
+        "На этот год ответ уже сохранён ✅\n\n"
+        "Функцию редактирования добавим позже."
+    ),
+    "today.first_answer_saved": (
+        "Записано 💚\n\n"
+        "Хочешь добавить свои ответы за прошлые годы из бумажного пятибука, "
+        "чтобы я показывал тебе полную историю?"
+    ),
+    "today.answer_saved": "Супер, ответ за {year} сохранён ✅",
+    "today.write_answer": "Отлично! Напиши свой ответ за {year} год 👇",
+
+    # Прошлые ответы (/today)
+    "past.title": "Твои ответы в этот день:",
+    "past.has_current_year": "На этот год ответ уже есть ✅",
+    "past.write_current_year": "Теперь напиши свой ответ за этот год 👇",
+    "past.none": (
+        "У тебя пока нет ответов на этот вопрос.\n"
+        "Напиши свой первый ответ! ✍️"
+    ),
+
+    # Ответы за прошлые годы (/today)
+    "past_years.choose_year": (
+        "За какой год хочешь внести ответ?\n\n"
+        "Выбери год из списка или напиши год вручную:"
+    ),
+    "past_years.skipped": "Хорошо! Ты всегда можешь добавить прошлые ответы позже через команду /today 💚",
+    "past_years.write_answer": "Напиши свой ответ за {year} год 👇",
+    "past_years.answer_saved": (
+        "Ответ за {year} сохранён ✅\n\n"
+        "Хочешь добавить ещё один год?"
+    ),
+    "past_years.finished": (
+        "Готово 💚\n\n"
+        "Теперь в эту дату я буду показывать тебе все сохранённые ответы за прошлые годы."
+    ),
+
+    # Выбор года и его проверка
+    "year.too_early": "Год должен быть не меньше {first_year}. Выбери другой год.",
+    "year.too_late": "Год должен быть не больше текущего ({current_year}). Выбери другой год.",
+    "year.import_not_past": "Для импорта год должен быть меньше текущего ({current_year}). Выбери другой год.",
+    "year.not_leap": "Год {year} не является високосным, поэтому ответ за 29 февраля в этот год внести нельзя.",
+    "year.answer_exists": "Ответ за {year} год уже существует. Выбери другой год.",
+    "year.choose_another": "{error}\n\nВыбери другой год:",
+    "year.choose_from_list": "{error}\n\nВыбери год из списка или попробуй другой:",
+    "year.not_a_number": "Пожалуйста, выбери год из списка или введи год числом ({first_year}-текущий):",
+    "year.enter_number": "Пожалуйста, введи год числом, например: <b>2021</b>",
+
+    # Изменение и удаление ответа (/today)
+    "edit.choose_year": (
+        "За какой год хочешь изменить или удалить ответ?\n\n"
+        "Выбери год из списка или напиши год вручную:"
+    ),
+    "edit.no_answer": (
+        "Ответа за {year} год нет.\n\n"
+        "Попробуй другой год или вернись назад."
+    ),
+    "edit.current_answer": (
+        "Сейчас у тебя сохранён ответ за {year} год:\n\n"
+        "<i>{answer}</i>\n\n"
+        "⏰ На редактирование {time_left}\n\n"
+        "Что хочешь сделать?"
+    ),
+    "edit.locked": (
+        "Ответ за {year} год нельзя изменить или удалить — "
+        "он был сохранён более 24 часов назад.\n\n"
+        "В пятибуке ответы фиксируются как часть истории 💛"
+    ),
+    "edit.expired": "⚠️ Время на редактирование истекло (прошло больше 24 часов).",
+    "edit.write_new_text": "Напиши новый текст ответа за {year} год 👇",
+    "edit.text_updated": "Ответ за {year} год обновлён ✅",
+    "edit.choose_new_year": (
+        "На какой год нужно заменить?\n\n"
+        "Выбери год из списка или напиши год вручную:"
+    ),
+    "edit.year_changed": "Год для этого ответа изменён с {old_year} на {year} ✅",
+    "delete.expired": "⚠️ Время на удаление истекло (прошло больше 24 часов).",
+    "delete.confirm": (
+        "Точно удалить ответ за {year} год?\n\n"
+        "<i>{answer}</i>"
+    ),
+    "delete.done": "Ответ за {year} год удалён ❌",
+
+    # Сколько осталось на редактирование (подставляется в edit.current_answer)
+    "time_left.unknown": "неизвестно",
+    "time_left.expired": "время истекло",
+    "time_left.hours": "осталось {hours} ч.",
+    "time_left.minutes": "осталось {minutes} мин.",
+
+    # /date: сетка месяца и просмотр даты
+    "month.1": "Январь",
+    "month.2": "Февраль",
+    "month.3": "Март",
+    "month.4": "Апрель",
+    "month.5": "Май",
+    "month.6": "Июнь",
+    "month.7": "Июль",
+    "month.8": "Август",
+    "month.9": "Сентябрь",
+    "month.10": "Октябрь",
+    "month.11": "Ноябрь",
+    "month.12": "Декабрь",
+    "date.month_grid": (
+        "🗓 <b>{month}</b>\n\n"
+        "Выбери день или введи дату в формате <b>ДД.ММ</b>, например: <b>05.03</b>\n\n"
+        "• - есть вопрос, число - сколько лет с ответами"
+    ),
+    "date.invalid": "Не понимаю эту дату. Пожалуйста, введи в формате <b>ДД.ММ</b>, например 05.03",
+    "date.title": "📅 Дата: <b>{date}</b>",
+    "date.no_question": (
+        "Для даты {date} у тебя пока нет вопроса.\n"
+        "Хочешь создать вопрос для этой даты?"
+    ),
+    "date.question": "<b>Вопрос:</b>\n{question}",
+    "date.answers_title": "<b>Ответы по годам:</b>",
+    "date.no_answers": "Ответов пока нет. ✍️",
+
+    # /date: записи за выбранную дату
+    "date.future": (
+        "⚠️ Нельзя создавать записи для будущих дат.\n\n"
+        "Выбери дату не позже сегодняшней."
+    ),
+    "date.ask_question": "Напиши, пожалуйста, вопрос, который хочешь задавать себе каждый год в дату {date}.",
+    "date.backdated_question_saved": (
+        "Отлично, вопрос сохранён ✅\n\n"
+        "А теперь напиши свой ответ за {date}.{year} 👇"
+    ),
+    "date.question_saved": (
+        "Отлично, вопрос сохранён ✅\n\n"
+        "Теперь напиши свой ответ за {date}.{year} 👇"
+    ),
+    "date.choose_year": (
+        "За какой год хочешь записать ответ для даты {date}?\n\n"
+        "Выбери год из списка или напиши год вручную:"
+    ),
+    "date.answer_exists": (
+        "У тебя уже есть ответ за {year} для даты {date}.\n"
+        "Выбери другой год или используй кнопку редактирования."
+    ),
+    "date.enter_year": "Напиши год для даты {date} (например: 2018, 2017, 2010):",
+    "date.year_out_of_range": "Год должен быть в диапазоне от 1900 до {current_year}. Попробуй ещё раз.",
+    "date.invalid_year": "Пожалуйста, введи корректный год (например: 2023)",
+    "date.write_answer_after_year": "Отлично! Теперь напиши свой ответ за {date}.{year} 👇",
+    "date.write_answer": "Напиши свой ответ за {date}.{year} 👇",
+    "date.write_new_answer": "Напиши новый ответ за {date}.{year} 👇",
+    "date.answer_saved": "Ответ за {date}.{year} сохранён ✅",
+    "date.question_and_answer_saved": "Супер! Вопрос и ответ за {date}.{year} сохранены ✅",
+    "date.answer_updated": "Ответ за {date}.{year} обновлён ✅",
+    "date.answer_deleted": "Ответ за {date}.{year} удалён ✅",
+
+    # Кнопки вечернего напоминания
+    "evening.no_question": "⚠️ Произошла ошибка. Вопрос для сегодня не найден.",
+    "evening.write_answer": "Отлично! Напиши свой ответ за сегодня 👇",
+    "evening.ask_question": "Напиши, пожалуйста, вопрос дня, который хочешь задавать себе каждый год в сегодняшнюю дату.",
+    "evening.skipped": "Ок, пропускаем этот день. Вернусь завтра 💚",
+    "evening.already_answered": "На этот год ответ уже сохранён ✅",
+    "evening.question_saved": (
+        "Отлично, вопрос сохранён ✅\n\n"
+        "Теперь напиши свой ответ за сегодня 👇"
+    ),
+    "evening.answer_saved": "Супер, ответ за сегодня сохранён ✅",
+
+    # Кнопки утреннего напоминания про вчерашний день
+    "yesterday.no_question": "⚠️ Произошла ошибка. Вопрос для вчерашнего дня не найден.",
+    "yesterday.write_answer": "Отлично! Напиши свой ответ за вчера 👇",
+    "yesterday.ask_question": "Напиши, пожалуйста, вопрос, который хочешь задавать себе каждый год во вчерашнюю дату.",
+    "yesterday.skipped": "Ок, пропускаем вчерашний день. Продолжим с сегодняшнего 💚",
+    "yesterday.already_answered": "На вчерашний день ответ уже сохранён ✅",
+    "yesterday.question_saved": (
+        "Отлично, вопрос сохранён ✅\n\n"
+        "Теперь напиши свой ответ за вчера 👇"
+    ),
+    "yesterday.answer_saved": "Супер, ответ за вчера сохранён ✅",
+
+    # /search
+    "search.usage": (
+        "Напиши, что искать, например: <code>/search море</code>\n\n"
+        "Найду ответы, где встречаются все слова (и их формы с тем же началом)."
+    ),
+    "search.nothing_found": "По запросу «{query}» ничего не нашлось 🤷",
+    "search.nothing_more": "Больше ничего не нашлось.",
+    "search.expired": "Поиск устарел, повтори команду /search",
+
+    # /export
+    "export.usage": (
+        "Использование: /export [формат]\n\n"
+        "Форматы: {formats}"
+    ),
+    "export.empty": "Пока нечего выгружать: у тебя ещё нет вопросов ✍️",
+    "export.too_large": "Дневник слишком большой для одного файла. Попробуй другой формат.",
+    "export.caption": "Твой пятибук ({format}) 📦",
+    "export.title": "Пятибук",
+
+    # /import
+    "import.help": (
+        "Пришли файл с записями, и я добавлю их в пятибук 📥\n\n"
+        "<b>Форматы:</b> CSV, JSON Lines или JSON-массив\n"
+        "<b>Колонки:</b> date, question, year, answer (или дата, вопрос, год, ответ)\n"
+        "• <b>date</b> - 05.03, 03-05 или полная дата 05.03.2019\n"
+        "• <b>year</b> - можно не указывать, если год есть в дате\n"
+        "• без <b>answer</b> добавится только вопрос\n\n"
+        "Файл из /export тоже подходит. Если на дату уже есть вопрос "
+        "или на год уже есть ответ, они останутся как были.\n\n"
+        "Добавить ответы за прошлые годы по одному можно через /today"
+    ),
+    "import.unsupported": "Я умею импортировать только .csv, .jsonl и .json файлы. Подробнее: /import",
+    "import.too_large": "Файл слишком большой: Telegram даёт ботам скачивать файлы до 20 МБ.",
+    "import.unreadable": (
+        "Не получилось прочитать файл. Проверь, что это CSV или JSON в кодировке UTF-8.\n\n"
+        "Успели добавить: вопросов {questions}, ответов {answers}."
+    ),
+    "import.done": "Импорт завершён ✅\n",
+    "import.records": "Записей в файле: {count}",
+    "import.new_questions": "Новых вопросов: {count}",
+    "import.new_answers": "Новых ответов: {count}",
+    "import.existing_answers": "Ответов, которые уже были: {count}",
+    "import.errors": "Пропущено с ошибками: {count} (записи {numbers})",
+
+    # /profile (только для администраторов)
+    "admin.profile_usage": "Использование: /profile [секунды]",
+    "admin.profile_bad_duration": "Длительность должна быть от 1 до {max_seconds} секунд.",
+    "admin.profile_busy": "Профилирование уже идёт, дождись отчёта.",
+    "admin.profile_started": "Профилирую {seconds} с, потом пришлю отчёт 📊",
+    "admin.profile_failed": "Профилирование не удалось: {error}",
+    "admin.profile_caption": "Профиль за {seconds} с, сортировка по cumulative time",
+
+    # Кнопки
+    "button.back": "⬅️ Назад",
+    "button.cancel": "⬅️ Отмена",
+    "button.edit_text": "✏️ Изменить текст",
+    "button.edit_year": "📅 Изменить год",
+    "button.delete_answer": "🗑 Удалить ответ",
+    "button.confirm_delete": "🗑 Да, удалить",
+    "button.add_another_year": "➕ Добавить ещё год",
+    "button.finish": "✅ Закончить",
+    "button.evening_answer_today": "✍️ Ответить за сегодня",
+    "button.evening_add_question": "✍️ Добавить вопрос и ответ",
+    "button.skip": "🙈 Пропустить",
+    "button.yesterday_answer": "✍️ Записать ответ за {date}",
+    "button.yesterday_add_question": "✍️ Добавить вопрос и ответ за {date}",
+    "button.skip_yesterday": "🙈 Пропустить вчера",
+    "button.show_past_answers": "📖 Посмотреть прошлые ответы",
+    "button.write_answer": "✍️ Написать ответ за {year}",
+    "button.add_past_years": "➕ Добавить ответы за прошлые годы",
+    "button.enter_past_years": "➕ Внести прошлые годы",
+    "button.enough_for_today": "⏭ Нет, на сегодня хватит",
+    "button.earlier": "◀ Раньше",
+    "button.later": "Позже ▶",
+    "button.edit_or_delete_answer": "✏️ Изменить/удалить ответ",
+    "button.other_year": "✍️ Ввести другой год",
+    "button.create_question": "➕ Создать вопрос",
+    "button.edit_answer_for_year": "✏️ Изменить ответ за {year}",
+    "button.delete_answer_for_year": "🗑 Удалить за {year}",
+    "button.add_past_answer": "➕ Добавить ответ за прошлый год",
+    "button.calendar": "🗓 Календарь",
+    "button.search_back": "◀ Назад",
+    "button.search_more": "Ещё ▶",
+}
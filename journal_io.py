@@ -0,0 +1,275 @@
+import csv
+import io
+import json
+from datetime import datetime
+from tempfile import SpooledTemporaryFile
+from typing import Any, AsyncGenerator, BinaryIO, Iterator, Optional
+
+from aiogram import Bot
+from aiogram.types import InputFile
+from sqlalchemy import Row
+
+from database import iter_journal
+
+# Форматы выгрузки дневника: расширение файла -> описание
+EXPORT_FORMATS = {
+    "md": "Markdown",
+    "csv": "CSV",
+    "jsonl": "JSON Lines",
+}
+EXPORT_FORMAT_ALIASES = {"markdown": "md", "json": "jsonl"}
+
+_CSV_COLUMNS = ("date", "question", "year", "answer")
+
+# Форматы импорта: те же колонки, что и в выгрузке (можно по-русски)
+IMPORT_FORMATS = ("csv", "jsonl", "json")
+_IMPORT_COLUMN_ALIASES = {"дата": "date", "вопрос": "question", "год": "year", "ответ": "answer"}
+_BASE_YEAR = 2024  # високосный год, чтобы принимать 29 февраля
+_JSON_CHUNK_SIZE = 64 * 1024
+
+_json_decoder = json.JSONDecoder()
+
+
+def _date_label(date_key: str) -> str:
+    month, day = date_key.split("-")
+    return f"{day}.{month}"
+
+
+class JournalWriter:
+    """
+    Превращает строки дневника (date_key, вопрос, год, ответ) в текст выбранного формата
+
+    Строки приходят порциями, упорядоченными по дате и году; writer помнит последнюю
+    дату, поэтому Markdown-заголовок даты пишется один раз даже на стыке порций.
+    title - заголовок Markdown-файла на языке пользователя.
+    """
+
+    def __init__(self, fmt: str, title: str = "Пятибук"):
+        self.fmt = fmt
+        self.title = title
+        self._last_date_key: Optional[str] = None
+
+    def header(self) -> str:
+        if self.fmt == "csv":
+            buffer = io.StringIO()
+            csv.writer(buffer).writerow(_CSV_COLUMNS)
+            return buffer.getvalue()
+        if self.fmt == "md":
+            return f"# {self.title}\n"
+        return ""
+
+    def write(self, rows: list[Row]) -> str:
+        if self.fmt == "csv":
+            buffer = io.StringIO()
+            csv.writer(buffer).writerows(rows)
+            return buffer.getvalue()
+
+        if self.fmt == "jsonl":
+            return "".join(
+                json.dumps(dict(zip(_CSV_COLUMNS, row)), ensure_ascii=False) + "\n"
+                for row in rows
+            )
+
+        parts = []
+        for date_key, question_text, year, answer_text in rows:
+            if date_key != self._last_date_key:
+                parts.append(f"\n## {_date_label(date_key)}\n\n**{question_text}**\n\n")
+                self._last_date_key = date_key
+            if year is not None:
+                # Многострочный ответ остаётся внутри пункта списка
+                answer_text = answer_text.replace("\n", "\n  ")
+                parts.append(f"- **{year}**: {answer_text}\n")
+        return "".join(parts)
+
+
+async def export_journal(
+    user_id: int, fmt: str, spool_size: int, title: str = "Пятибук"
+) -> tuple[SpooledTemporaryFile, int]:
+    """
+    Выгрузить дневник пользователя в файл, не загружая его целиком в память
+
+    Строки читаются из БД порциями и сразу дописываются в SpooledTemporaryFile: пока файл
+    меньше spool_size, он живёт в памяти, дальше - на диске. Возвращает файл, перемотанный
+    в начало, и количество строк дневника (0 - выгружать нечего).
+    """
+    writer = JournalWriter(fmt, title)
+    file = SpooledTemporaryFile(max_size=spool_size, mode="w+b")
+    file.write(writer.header().encode("utf-8"))
+
+    rows_written = 0
+    async for rows in iter_journal(user_id):
+        file.write(writer.write(rows).encode("utf-8"))
+        rows_written += len(rows)
+
+    file.seek(0)
+    return file, rows_written
+
+
+class SpooledInputFile(InputFile):
+    """Файл для отправки в Telegram, читаемый порциями из уже открытого файлового объекта"""
+
+    def __init__(self, file, filename: str, chunk_size: int = 64 * 1024):
+        super().__init__(filename=filename, chunk_size=chunk_size)
+        self.file = file
+
+    async def read(self, bot: Bot) -> AsyncGenerator[bytes, None]:
+        self.file.seek(0)
+        while chunk := self.file.read(self.chunk_size):
+            yield chunk
+
+
+class JournalRowError(ValueError):
+    """Строку файла импорта нельзя превратить в вопрос/ответ"""
+
+
+def _parse_import_date(value: str) -> tuple[str, Optional[int]]:
+    """Дата из файла импорта -> (date_key, год из даты или None)"""
+    for fmt in ("%Y-%m-%d", "%d.%m.%Y"):
+        try:
+            date = datetime.strptime(value, fmt)
+            return date.strftime("%m-%d"), date.year
+        except ValueError:
+            pass
+    for fmt in ("%m-%d", "%d.%m"):
+        try:
+            date = datetime.strptime(f"{_BASE_YEAR} {value}", f"%Y {fmt}")
+            return date.strftime("%m-%d"), None
+        except ValueError:
+            pass
+    raise JournalRowError(f"не понимаю дату {value!r}")
+
+
+def parse_import_record(record: dict) -> tuple[str, str, Optional[int], Optional[str]]:
+    """
+    Проверить запись файла импорта и привести её к (date_key, вопрос, год, ответ)
+
+    Дата - MM-DD (как в выгрузке), ДД.ММ, ГГГГ-ММ-ДД или ДД.ММ.ГГГГ; год можно не указывать,
+    если он есть в дате. Запись без ответа добавляет только вопрос.
+    """
+    fields = {
+        _IMPORT_COLUMN_ALIASES.get(str(key).strip().lower(), str(key).strip().lower()): value
+        for key, value in record.items()
+    }
+
+    date_key, date_year = _parse_import_date(str(fields.get("date") or "").strip())
+    question_text = str(fields.get("question") or "").strip()
+    if not question_text:
+        raise JournalRowError("нет вопроса")
+
+    answer_text = str(fields.get("answer") or "").strip() or None
+    if answer_text is None:
+        return date_key, question_text, None, None
+
+    raw_year = str(fields.get("year") or "").strip()
+    try:
+        year = int(raw_year) if raw_year else date_year
+    except ValueError:
+        raise JournalRowError(f"не понимаю год {raw_year!r}")
+    if year is None:
+        raise JournalRowError("нет года ответа")
+    if not 1900 <= year <= datetime.now().year:
+        raise JournalRowError(f"год {year} вне допустимого диапазона")
+    if date_key == "02-29" and not (year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)):
+        raise JournalRowError(f"в {year} году не было 29 февраля")
+
+    return date_key, question_text, year, answer_text
+
+
+def read_import_records(file: BinaryIO, fmt: str) -> Iterator[tuple[int, Optional[dict]]]:
+    """
+    Читать записи из файла импорта по одной: (номер записи, dict или None, если не разобрать)
+
+    Все форматы читаются потоково; .json может быть массивом объектов (разбирается по одному
+    элементу, см. _iter_json_array) или тем же JSON Lines.
+    """
+    text = io.TextIOWrapper(file, encoding="utf-8-sig", newline="")
+    try:
+        if fmt == "csv":
+            yield from enumerate(csv.DictReader(text), start=1)
+            return
+
+        if fmt == "json":
+            head = text.read(1)
+            while head.isspace():
+                head = text.read(1)
+            if head == "[":
+                for number, record in enumerate(_iter_json_array(text), start=1):
+                    yield number, record if isinstance(record, dict) else None
+                return
+            lines = _prepend(head, text)
+        else:
+            lines = text
+
+        number = 0
+        for line in lines:
+            if not line.strip():
+                continue
+            number += 1
+            try:
+                record = json.loads(line)
+            except ValueError:
+                record = None
+            yield number, record if isinstance(record, dict) else None
+    finally:
+        # Файл закрывает вызывающий код
+        text.detach()
+
+
+def _iter_json_array(text: io.TextIOWrapper) -> Iterator[Any]:
+    """
+    Элементы JSON-массива по одному; открывающая '[' уже прочитана
+
+    Файл читается кусками по _JSON_CHUNK_SIZE, в памяти только текущий элемент (json.loads
+    держал бы весь массив). Генератор синхронный: отдавать управление event loop между
+    записями должен тот, кто его читает. Ошибка в синтаксисе массива - ValueError, как у json.loads.
+    """
+    buffer, position, eof = "", 0, False
+
+    def read_more() -> None:
+        nonlocal buffer, position, eof
+        chunk = text.read(_JSON_CHUNK_SIZE)
+        buffer, position, eof = buffer[position:] + chunk, 0, not chunk
+
+    def next_char() -> str:
+        nonlocal position
+        while True:
+            while position < len(buffer) and buffer[position].isspace():
+                position += 1
+            if position < len(buffer):
+                return buffer[position]
+            if eof:
+                raise ValueError("Unexpected end of JSON array")
+            read_more()
+
+    if next_char() == "]":
+        return
+    while True:
+        next_char()
+        while True:
+            try:
+                value, end = _json_decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                read_more()
+                continue
+            # Значение у конца буфера может быть обрезано (число, продолжение в следующем куске)
+            if end < len(buffer) or eof:
+                break
+            read_more()
+        position = end
+        yield value
+
+        separator = next_char()
+        position += 1
+        if separator == "]":
+            return
+        if separator != ",":
+            raise ValueError(f"Expected ',' or ']' in JSON array, got {separator!r}")
+
+
+def _prepend(first: str, text: io.TextIOWrapper) -> Iterator[str]:
+    """Строки файла, у которого уже прочитан первый символ first"""
+    lines = iter(text)
+    yield first + next(lines, "")
+    yield from lines
@@ -0,0 +1,197 @@
+from collections import OrderedDict
+from datetime import datetime
+from functools import wraps
+from typing import Callable
+
+from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
+
+from callbacks import PastYear, CalendarYearPicked, CalendarCustomYear, SetLanguage, YesterdayAnswer, YesterdayQuestion
+from i18n import Catalog, SUPPORTED_LANGUAGES, get_catalog
+from monitoring.metrics import CACHE_REQUESTS
+
+# Первый год, который можно выбрать для ответа
+FIRST_YEAR = 2019
+
+_MISSING = object()
+
+
+def cached_keyboard(maxsize: int = 256) -> Callable:
+    """
+    Запоминает клавиатуры, построенные по одним и тем же аргументам
+
+    Аргументы - ключ кэша (каталог i18n тоже подходит: он один на язык). Списки лет
+    зависят от текущего года, поэтому при смене года кэш сбрасывается целиком.
+    Возвращается общий объект, поэтому менять клавиатуру после получения нельзя.
+    """
+
+    def decorator(builder: Callable[..., InlineKeyboardMarkup]) -> Callable[..., InlineKeyboardMarkup]:
+        keyboards: OrderedDict[tuple, InlineKeyboardMarkup] = OrderedDict()
+        built_in_year = None
+
+        @wraps(builder)
+        def get_keyboard(*args) -> InlineKeyboardMarkup:
+            nonlocal built_in_year
+            year = datetime.now().year
+            if year != built_in_year:
+                keyboards.clear()
+                built_in_year = year
+
+            keyboard = keyboards.get(args, _MISSING)
+            if keyboard is not _MISSING:
+                keyboards.move_to_end(args)
+                CACHE_REQUESTS.inc(cache="keyboard", result="hit")
+                return keyboard
+
+            CACHE_REQUESTS.inc(cache="keyboard", result="miss")
+            keyboard = keyboards[args] = builder(*args)
+            if len(keyboards) > maxsize:
+                keyboards.popitem(last=False)
+            return keyboard
+
+        get_keyboard.cache_clear = keyboards.clear
+        return get_keyboard
+
+    return decorator
+
+
+def _year_rows(years: list[int], buttons_per_row: int, callback_data: Callable[[int], str]) -> list[list[InlineKeyboardButton]]:
+    return [
+        [InlineKeyboardButton(text=str(year), callback_data=callback_data(year)) for year in years[i:i + buttons_per_row]]
+        for i in range(0, len(years), buttons_per_row)
+    ]
+
+
+@cached_keyboard()
+def get_year_keyboard(start_year: int = FIRST_YEAR, buttons_per_row: int = 3) -> InlineKeyboardMarkup:
+    """
+    Inline-клавиатура с кнопками годов от start_year до текущего года
+
+    Args:
+        start_year: Начальный год (по умолчанию 2019)
+        buttons_per_row: Количество кнопок в ряду (по умолчанию 3)
+
+    Returns:
+        InlineKeyboardMarkup с кнопками годов
+    """
+    years = list(range(start_year, datetime.now().year + 1))
+    return InlineKeyboardMarkup(
+        inline_keyboard=_year_rows(years, buttons_per_row, lambda year: PastYear(year).pack())
+    )
+
+
+@cached_keyboard(maxsize=1024)
+def calendar_year_keyboard(i18n: Catalog, date_key: str, question_id: int) -> InlineKeyboardMarkup:
+    """Выбор года для ответа из /date: сначала текущий год, в конце - ввод вручную"""
+    years = list(range(datetime.now().year, FIRST_YEAR - 1, -1))
+    rows = _year_rows(
+        years, 3, lambda year: CalendarYearPicked(date_key, question_id, year).pack()
+    )
+    rows.append([InlineKeyboardButton(
+        text=i18n("button.other_year"),
+        callback_data=CalendarCustomYear(date_key, question_id).pack()
+    )])
+    return InlineKeyboardMarkup(inline_keyboard=rows)
+
+
+@cached_keyboard()
+def daily_question_keyboard(i18n: Catalog, current_year: int, has_answer: bool) -> InlineKeyboardMarkup:
+    """Кнопки под вопросом дня: прошлые ответы, ответ за текущий год (если его нет), прошлые годы"""
+    rows = [[InlineKeyboardButton(text=i18n("button.show_past_answers"), callback_data="show_past_answers")]]
+    if not has_answer:
+        rows.append([InlineKeyboardButton(
+            text=i18n("button.write_answer", year=current_year),
+            callback_data="write_answer"
+        )])
+    rows.append([InlineKeyboardButton(text=i18n("button.add_past_years"), callback_data="add_past_years")])
+    return InlineKeyboardMarkup(inline_keyboard=rows)
+
+
+@cached_keyboard()
+def first_answer_keyboard(i18n: Catalog) -> InlineKeyboardMarkup:
+    """После первого ответа на вопрос: внести прошлые годы или закончить"""
+    return InlineKeyboardMarkup(inline_keyboard=[
+        [InlineKeyboardButton(text=i18n("button.enter_past_years"), callback_data="add_past_years")],
+        [InlineKeyboardButton(text=i18n("button.enough_for_today"), callback_data="skip_past_years")]
+    ])
+
+
+@cached_keyboard()
+def back_keyboard(i18n: Catalog) -> InlineKeyboardMarkup:
+    """Одна кнопка возврата к сегодняшнему вопросу"""
+    return InlineKeyboardMarkup(inline_keyboard=[
+        [InlineKeyboardButton(text=i18n("button.back"), callback_data="back_to_today")]
+    ])
+
+
+@cached_keyboard()
+def answer_actions_keyboard(i18n: Catalog) -> InlineKeyboardMarkup:
+    """Действия с ответом, который ещё можно редактировать"""
+    return InlineKeyboardMarkup(inline_keyboard=[
+        [InlineKeyboardButton(text=i18n("button.edit_text"), callback_data="edit_text")],
+        [InlineKeyboardButton(text=i18n("button.edit_year"), callback_data="edit_year")],
+        [InlineKeyboardButton(text=i18n("button.delete_answer"), callback_data="delete_answer")],
+        [InlineKeyboardButton(text=i18n("button.back"), callback_data="back_to_today")]
+    ])
+
+
+@cached_keyboard()
+def more_past_years_keyboard(i18n: Catalog) -> InlineKeyboardMarkup:
+    """Добавить ещё один прошлый год или закончить"""
+    return InlineKeyboardMarkup(inline_keyboard=[
+        [InlineKeyboardButton(text=i18n("button.add_another_year"), callback_data="add_past_years")],
+        [InlineKeyboardButton(text=i18n("button.finish"), callback_data="finish_past_years")]
+    ])
+
+
+@cached_keyboard()
+def delete_confirm_keyboard(i18n: Catalog) -> InlineKeyboardMarkup:
+    """Подтверждение удаления ответа"""
+    return InlineKeyboardMarkup(inline_keyboard=[
+        [InlineKeyboardButton(text=i18n("button.confirm_delete"), callback_data="confirm_delete")],
+        [InlineKeyboardButton(text=i18n("button.cancel"), callback_data="back_to_today")]
+    ])
+
+
+@cached_keyboard()
+def language_keyboard(i18n: Catalog) -> InlineKeyboardMarkup:
+    """Кнопки языков, текущий язык отмечен галочкой"""
+    buttons = []
+    for language in SUPPORTED_LANGUAGES:
+        name = get_catalog(language)("language.name")
+        if language == i18n.language:
+            name = f"✅ {name}"
+        buttons.append([InlineKeyboardButton(text=name, callback_data=SetLanguage(language).pack())])
+    return InlineKeyboardMarkup(inline_keyboard=buttons)
+
+
+@cached_keyboard()
+def reminder_keyboard(i18n: Catalog, scenario: str, date_key: str, year: int) -> InlineKeyboardMarkup | None:
+    """Кнопки под напоминанием; у ежедневного напоминания (daily_*) кнопок нет"""
+    month, day = date_key.split("-")
+    date_label = f"{day}.{month}"
+    if scenario == "evening_question":
+        rows = [
+            (i18n("button.evening_answer_today"), "evening_answer_today"),
+            (i18n("button.skip"), "evening_skip"),
+        ]
+    elif scenario == "evening_no_question":
+        rows = [
+            (i18n("button.evening_add_question"), "evening_add_question"),
+            (i18n("button.skip"), "evening_skip"),
+        ]
+    elif scenario == "yesterday_question":
+        rows = [
+            (i18n("button.yesterday_answer", date=date_label), YesterdayAnswer(date_key, year).pack()),
+            (i18n("button.skip_yesterday"), "morning_yesterday_skip"),
+        ]
+    elif scenario == "yesterday_no_question":
+        rows = [
+            (i18n("button.yesterday_add_question", date=date_label), YesterdayQuestion(date_key, year).pack()),
+            (i18n("button.skip_yesterday"), "morning_yesterday_skip"),
+        ]
+    else:
+        return None
+    return InlineKeyboardMarkup(inline_keyboard=[
+        [InlineKeyboardButton(text=text, callback_data=callback_data)]
+        for text, callback_data in rows
+    ])
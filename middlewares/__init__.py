@@ -0,0 +1,16 @@
+from middlewares.tracing import UpdateTraceMiddleware, HandlerNameMiddleware
+from middlewares.latency import LatencyMiddleware
+from middlewares.flow import FlowContextMiddleware
+from middlewares.throttling import ThrottlingMiddleware
+from middlewares.i18n import I18nMiddleware
+from middlewares.callbacks import CallbackDataMiddleware
+
+__all__ = [
+    "UpdateTraceMiddleware",
+    "HandlerNameMiddleware",
+    "LatencyMiddleware",
+    "FlowContextMiddleware",
+    "ThrottlingMiddleware",
+    "I18nMiddleware",
+    "CallbackDataMiddleware",
+]
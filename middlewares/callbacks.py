@@ -0,0 +1,25 @@
+from typing import Any, Awaitable, Callable, Dict
+
+from aiogram import BaseMiddleware
+from aiogram.types import CallbackQuery
+
+from callbacks import decode
+
+
+class CallbackDataMiddleware(BaseMiddleware):
+    """
+    Разбирает callback_data один раз до фильтров (аргумент callback_data)
+
+    Тип определяется по префиксу одним поиском в таблице callbacks, фильтры хендлеров
+    (SomeCallback.filter()) только проверяют тип готового объекта. Для кнопок без
+    параметров callback_data - None, они по-прежнему ловятся через F.data == ...
+    """
+
+    async def __call__(
+        self,
+        handler: Callable[[CallbackQuery, Dict[str, Any]], Awaitable[Any]],
+        event: CallbackQuery,
+        data: Dict[str, Any]
+    ) -> Any:
+        data["callback_data"] = decode(event.data)
+        return await handler(event, data)
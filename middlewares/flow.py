@@ -0,0 +1,30 @@
+from typing import Any, Awaitable, Callable, Dict
+
+from aiogram import BaseMiddleware
+from aiogram.types import TelegramObject
+
+from flow import FlowContext
+
+
+class FlowContextMiddleware(BaseMiddleware):
+    """
+    Outer-middleware для dp.update: один раз загружает FlowContext пользователя,
+    передаёт его хендлерам как аргумент flow и один раз сохраняет в конце обработки
+    """
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: Dict[str, Any]
+    ) -> Any:
+        state = data.get("state")
+        if state is None:
+            return await handler(event, data)
+
+        flow = await FlowContext.load(state)
+        data["flow"] = flow
+        try:
+            return await handler(event, data)
+        finally:
+            await flow.flush()
@@ -0,0 +1,27 @@
+from typing import Any, Awaitable, Callable, Dict
+
+from aiogram import BaseMiddleware
+from aiogram.types import TelegramObject
+
+from database import get_user_language
+from i18n import get_catalog
+
+
+class I18nMiddleware(BaseMiddleware):
+    """
+    Передаёт хендлерам каталог сообщений на языке пользователя (аргумент i18n)
+
+    Язык берётся из User.language (с кэшем в памяти), сами каталоги компилируются
+    один раз на язык при первом обращении.
+    """
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: Dict[str, Any]
+    ) -> Any:
+        user = data.get("event_from_user")
+        language = await get_user_language(user.id) if user is not None else None
+        data["i18n"] = get_catalog(language)
+        return await handler(event, data)
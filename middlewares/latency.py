@@ -0,0 +1,62 @@
+import json
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict
+
+from aiogram import BaseMiddleware
+from aiogram.types import TelegramObject, Update
+
+import config
+from monitoring import current_trace, LATENCY
+from monitoring.metrics import registry
+
+logger = logging.getLogger(__name__)
+
+HANDLER_LATENCY = registry.histogram(
+    "fivebook_handler_duration_seconds",
+    "End-to-end update processing time by handler",
+    ("handler",)
+)
+
+
+class LatencyMiddleware(BaseMiddleware):
+    """
+    Outer-middleware для dp.update: измеряет полное время обработки апдейта,
+    копит перцентили по хендлерам и пишет структурированную запись о медленных апдейтах
+
+    Регистрируется после UpdateTraceMiddleware, чтобы видеть хендлер и FSM-состояние из трейса.
+    """
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+        event: Update,
+        data: Dict[str, Any]
+    ) -> Any:
+        started = time.perf_counter()
+        try:
+            return await handler(event, data)
+        finally:
+            duration = time.perf_counter() - started
+            trace = current_trace.get()
+            handler_name = trace.handler if trace is not None else "unhandled"
+            LATENCY.record(handler_name, duration)
+            HANDLER_LATENCY.observe(duration, handler=handler_name)
+
+            duration_ms = duration * 1000
+            if duration_ms > config.SLOW_UPDATE_MS:
+                record = {
+                    "event": "slow_update",
+                    "update_id": event.update_id,
+                    "update_type": event.event_type,
+                    "handler": handler_name,
+                    "duration_ms": round(duration_ms, 1),
+                }
+                if trace is not None:
+                    record.update(
+                        router=trace.router,
+                        state=trace.state,
+                        db_queries=trace.db_queries,
+                        db_ms=round(trace.db_time * 1000, 1)
+                    )
+                logger.warning(json.dumps(record, ensure_ascii=False))
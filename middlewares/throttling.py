@@ -0,0 +1,103 @@
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Tuple
+
+from aiogram import BaseMiddleware
+from aiogram.dispatcher.flags import get_flag
+from aiogram.types import CallbackQuery, Message, TelegramObject, User
+
+from monitoring.metrics import registry
+
+THROTTLED = registry.counter(
+    "fivebook_throttled_updates_total",
+    "Updates dropped by per-user throttling",
+    ("key",)
+)
+
+
+@dataclass(slots=True)
+class _Bucket:
+    tokens: float
+    updated: float
+    # Пользователю уже сказали, что он пишет слишком часто; сбрасывается, когда бакет наполнится
+    notified: bool = False
+
+
+class ThrottlingMiddleware(BaseMiddleware):
+    """
+    Inner-middleware для dp.message и dp.callback_query: token bucket на пользователя
+    и класс хендлера
+
+    Класс берётся из флага хендлера throttling_key (например, flags={"throttling_key": "date_nav"}),
+    у хендлеров без флага - "default". limits задаёт для класса (токенов в секунду, размер пачки).
+    Апдейт сверх лимита не доходит до хендлера: у callback сразу гасится «часики», на
+    сообщение один раз за серию отброшенных приходит ответ throttle.too_fast (каталог берётся
+    из I18nMiddleware, поэтому он регистрируется раньше). Сообщения пользователя с активным
+    FSM-состоянием не ограничиваются: это ответ на вопрос бота, терять его нельзя.
+    Полные (простаивающие) бакеты периодически удаляются.
+    """
+
+    def __init__(self, limits: Dict[str, Tuple[float, int]], cleanup_interval: float = 60.0):
+        self.limits = limits
+        self.cleanup_interval = cleanup_interval
+        self._buckets: Dict[Tuple[int, str], _Bucket] = {}
+        self._last_cleanup = time.monotonic()
+
+    def _allow(self, user_id: int, key: str, now: float) -> bool:
+        rate, burst = self.limits.get(key, self.limits["default"])
+        bucket = self._buckets.get((user_id, key))
+        if bucket is None:
+            bucket = self._buckets[(user_id, key)] = _Bucket(tokens=burst, updated=now)
+        else:
+            bucket.tokens = min(burst, bucket.tokens + (now - bucket.updated) * rate)
+            bucket.updated = now
+
+        if bucket.tokens < 1:
+            return False
+        if bucket.tokens >= burst:
+            # Бакет успел наполниться: следующая серия отброшенных апдейтов - новая
+            bucket.notified = False
+        bucket.tokens -= 1
+        return True
+
+    def _should_notify(self, user_id: int, key: str) -> bool:
+        bucket = self._buckets[(user_id, key)]
+        if bucket.notified:
+            return False
+        bucket.notified = True
+        return True
+
+    def _cleanup(self, now: float) -> None:
+        # Бакет, который успел бы наполниться до конца, ничем не отличается от нового
+        for (user_id, key), bucket in list(self._buckets.items()):
+            rate, burst = self.limits.get(key, self.limits["default"])
+            if (now - bucket.updated) * rate + bucket.tokens >= burst:
+                del self._buckets[(user_id, key)]
+        self._last_cleanup = now
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: Dict[str, Any]
+    ) -> Any:
+        user: User = data.get("event_from_user")
+        if user is None:
+            return await handler(event, data)
+        if isinstance(event, Message) and data.get("raw_state") is not None:
+            return await handler(event, data)
+
+        now = time.monotonic()
+        if now - self._last_cleanup > self.cleanup_interval:
+            self._cleanup(now)
+
+        key = get_flag(data, "throttling_key", default="default")
+        if self._allow(user.id, key, now):
+            return await handler(event, data)
+
+        THROTTLED.inc(key=key)
+        if isinstance(event, CallbackQuery):
+            await event.answer()
+        elif isinstance(event, Message) and self._should_notify(user.id, key):
+            await event.answer(data["i18n"]("throttle.too_fast"))
+        return None
@@ -0,0 +1,72 @@
+import logging
+from typing import Any, Awaitable, Callable, Dict
+
+from aiogram import BaseMiddleware
+from aiogram.types import TelegramObject, Update
+
+import config
+from monitoring import UpdateTrace, current_trace, db_cost
+from monitoring.metrics import registry
+
+logger = logging.getLogger(__name__)
+
+UPDATES = registry.counter("fivebook_updates_total", "Processed updates by type", ("type",))
+DB_QUERIES = registry.counter("fivebook_db_queries_total", "SQL statements executed by handler", ("handler",))
+DB_TIME = registry.counter("fivebook_db_time_seconds_total", "Time spent in SQL statements by handler", ("handler",))
+
+
+class UpdateTraceMiddleware(BaseMiddleware):
+    """
+    Outer-middleware для dp.update: заводит трейс апдейта и после обработки
+    учитывает стоимость БД и пишет в лог апдейты, превысившие бюджет
+    """
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+        event: Update,
+        data: Dict[str, Any]
+    ) -> Any:
+        trace = UpdateTrace(
+            update_id=event.update_id,
+            update_type=event.event_type,
+            state=data.get("raw_state")
+        )
+        token = current_trace.set(trace)
+        try:
+            return await handler(event, data)
+        finally:
+            current_trace.reset(token)
+            db_cost.record(trace)
+            UPDATES.inc(type=trace.update_type)
+            DB_QUERIES.inc(trace.db_queries, handler=trace.handler)
+            DB_TIME.inc(trace.db_time, handler=trace.handler)
+
+            db_time_ms = trace.db_time * 1000
+            if trace.db_queries > config.DB_QUERY_BUDGET or db_time_ms > config.DB_TIME_BUDGET_MS:
+                slowest = " ".join((trace.slowest_statement or "").split())
+                logger.warning(
+                    f"Update {trace.update_id} ({trace.handler}) exceeded DB budget: "
+                    f"{trace.db_queries} queries, {db_time_ms:.1f} ms, "
+                    f"slowest {trace.slowest_time * 1000:.1f} ms: {slowest}"
+                )
+
+
+class HandlerNameMiddleware(BaseMiddleware):
+    """Inner-middleware: записывает в трейс хендлер и роутер, которые обработали апдейт"""
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: Dict[str, Any]
+    ) -> Any:
+        trace = current_trace.get()
+        handler_object = data.get("handler")
+        if trace is not None and handler_object is not None:
+            callback = handler_object.callback
+            trace.handler = f"{callback.__module__}.{callback.__qualname__}"
+            event_router = data.get("event_router")
+            if event_router is not None:
+                trace.router = event_router.name
+        return await handler(event, data)
@@ -0,0 +1,14 @@
+from monitoring.trace import UpdateTrace, current_trace
+from monitoring.db_stats import install_query_hooks, db_cost
+from monitoring.latency import LatencyStats, LATENCY
+from monitoring.loop_lag import LoopLagMonitor
+
+__all__ = [
+    "UpdateTrace",
+    "current_trace",
+    "install_query_hooks",
+    "db_cost",
+    "LatencyStats",
+    "LATENCY",
+    "LoopLagMonitor",
+]
@@ -0,0 +1,86 @@
+import time
+from dataclasses import dataclass
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from monitoring.trace import UpdateTrace, current_trace
+
+
+def install_query_hooks(engine: AsyncEngine) -> None:
+    """
+    Подключает хуки SQLAlchemy, которые приписывают каждый запрос текущему апдейту
+
+    Запросы вне апдейта (например, из планировщика) не учитываются.
+    """
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["query_start_time"].pop()
+        trace = current_trace.get()
+        if trace is not None:
+            trace.record_query(statement, elapsed)
+
+
+@dataclass(slots=True)
+class HandlerDbCost:
+    """Накопленная стоимость БД для одного хендлера"""
+    updates: int = 0
+    queries: int = 0
+    db_time: float = 0.0
+    max_queries: int = 0
+
+    @property
+    def avg_queries(self) -> float:
+        return self.queries / self.updates if self.updates else 0.0
+
+    @property
+    def avg_db_time(self) -> float:
+        return self.db_time / self.updates if self.updates else 0.0
+
+
+class DbCostStats:
+    """Агрегирует количество запросов и время БД по хендлерам"""
+
+    def __init__(self):
+        self._by_handler: dict[str, HandlerDbCost] = {}
+
+    def record(self, trace: UpdateTrace) -> None:
+        """Добавить завершённый апдейт в статистику его хендлера"""
+        cost = self._by_handler.get(trace.handler)
+        if cost is None:
+            cost = self._by_handler[trace.handler] = HandlerDbCost()
+        cost.updates += 1
+        cost.queries += trace.db_queries
+        cost.db_time += trace.db_time
+        cost.max_queries = max(cost.max_queries, trace.db_queries)
+
+    def snapshot(self) -> dict[str, HandlerDbCost]:
+        """Копия текущей статистики по хендлерам"""
+        return {
+            name: HandlerDbCost(cost.updates, cost.queries, cost.db_time, cost.max_queries)
+            for name, cost in self._by_handler.items()
+        }
+
+    def format_report(self) -> str:
+        """Текстовый отчёт, отсортированный по среднему числу запросов"""
+        rows = sorted(
+            self.snapshot().items(),
+            key=lambda item: item[1].avg_queries,
+            reverse=True
+        )
+        lines = ["handler | updates | avg queries | max queries | avg db ms"]
+        for name, cost in rows:
+            lines.append(
+                f"{name} | {cost.updates} | {cost.avg_queries:.1f} | "
+                f"{cost.max_queries} | {cost.avg_db_time * 1000:.1f}"
+            )
+        return "\n".join(lines)
+
+
+db_cost = DbCostStats()
@@ -0,0 +1,33 @@
+import logging
+
+from aiohttp import web
+
+from monitoring.metrics import registry
+
+logger = logging.getLogger(__name__)
+
+
+async def _handle_metrics(request: web.Request) -> web.Response:
+    return web.Response(
+        text=registry.render(),
+        content_type="text/plain",
+        charset="utf-8",
+        headers={"X-Content-Type-Options": "nosniff"}
+    )
+
+
+def create_metrics_app() -> web.Application:
+    """aiohttp-приложение с единственным маршрутом GET /metrics"""
+    app = web.Application()
+    app.router.add_get("/metrics", _handle_metrics)
+    return app
+
+
+async def start_metrics_server(host: str, port: int) -> web.AppRunner:
+    """Запустить HTTP-сервер метрик; вернуть runner для последующего cleanup()"""
+    runner = web.AppRunner(create_metrics_app(), access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, host, port)
+    await site.start()
+    logger.info(f"Metrics endpoint listening on http://{host}:{port}/metrics")
+    return runner
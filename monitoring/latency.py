@@ -0,0 +1,47 @@
+from collections import deque
+from typing import Optional
+
+import config
+
+
+class LatencyStats:
+    """Скользящее окно длительностей обработки апдейтов по хендлерам"""
+
+    def __init__(self, window: int = 500):
+        self.window = window
+        self._samples: dict[str, deque[float]] = {}
+
+    def record(self, handler: str, duration: float) -> None:
+        """Добавить длительность обработки (в секундах)"""
+        samples = self._samples.get(handler)
+        if samples is None:
+            samples = self._samples[handler] = deque(maxlen=self.window)
+        samples.append(duration)
+
+    def percentiles(self, handler: str, points: tuple[float, ...] = (50, 95, 99)) -> Optional[dict[float, float]]:
+        """Перцентили длительности хендлера по последним window апдейтам"""
+        samples = self._samples.get(handler)
+        if not samples:
+            return None
+        ordered = sorted(samples)
+        last = len(ordered) - 1
+        return {point: ordered[round(last * point / 100)] for point in points}
+
+    def format_report(self) -> str:
+        """Текстовый отчёт, отсортированный по p95"""
+        rows = []
+        for handler in self._samples:
+            p = self.percentiles(handler)
+            rows.append((handler, len(self._samples[handler]), p))
+        rows.sort(key=lambda row: row[2][95], reverse=True)
+
+        lines = ["handler | samples | p50 ms | p95 ms | p99 ms"]
+        for handler, count, p in rows:
+            lines.append(
+                f"{handler} | {count} | {p[50] * 1000:.1f} | "
+                f"{p[95] * 1000:.1f} | {p[99] * 1000:.1f}"
+            )
+        return "\n".join(lines)
+
+
+LATENCY = LatencyStats(window=config.LATENCY_WINDOW)
@@ -0,0 +1,101 @@
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from typing import Optional
+
+from monitoring.metrics import registry
+
+logger = logging.getLogger(__name__)
+
+LOOP_LAG = registry.histogram(
+    "fivebook_event_loop_lag_seconds",
+    "Event loop scheduling delay",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+)
+LOOP_LAG_LAST = registry.gauge(
+    "fivebook_event_loop_lag_last_seconds",
+    "Last measured event loop scheduling delay"
+)
+
+
+class LoopLagMonitor:
+    """
+    Измеряет задержку планирования event loop и ищет блокирующий код
+
+    Корутина-пробник засыпает на interval и замеряет, насколько позже она проснулась.
+    Параллельно сторожевой поток следит за пульсом пробника: если loop не отвечает
+    дольше threshold, он пишет в лог стек потока loop и имя выполняющейся задачи —
+    то есть код, который блокирует loop прямо сейчас.
+    """
+
+    def __init__(self, interval: float = 0.5, threshold: float = 0.25):
+        self.interval = interval
+        self.threshold = threshold
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+        self._heartbeat = time.monotonic()
+
+    def start(self) -> None:
+        """Запустить пробник и сторожевой поток (вызывать из работающего loop)"""
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._stopped.clear()
+        self._task = asyncio.create_task(self._probe(), name="loop-lag-probe")
+        self._watchdog = threading.Thread(target=self._watch, name="loop-lag-watchdog", daemon=True)
+        self._watchdog.start()
+        logger.info("Event loop lag monitor started")
+
+    async def stop(self) -> None:
+        """Остановить мониторинг"""
+        self._stopped.set()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        if self._watchdog is not None:
+            self._watchdog.join(timeout=self.interval * 2)
+
+    async def _probe(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, loop.time() - started - self.interval)
+            self._heartbeat = time.monotonic()
+            LOOP_LAG.observe(lag)
+            LOOP_LAG_LAST.set(lag)
+            if lag > self.threshold:
+                logger.warning(f"Event loop lag {lag * 1000:.0f} ms")
+
+    def _watch(self) -> None:
+        dumped = False
+        while not self._stopped.wait(self.interval / 2):
+            stalled = time.monotonic() - self._heartbeat - self.interval
+            if stalled > self.threshold:
+                # Один дамп на каждую блокировку, а не на каждый тик сторожа
+                if not dumped:
+                    self._dump_running_stack(stalled)
+                    dumped = True
+            else:
+                dumped = False
+
+    def _dump_running_stack(self, stalled: float) -> None:
+        frame = sys._current_frames().get(self._loop_thread_id)
+        if frame is None:
+            return
+        task = asyncio.current_task(self._loop)
+        task_name = task.get_name() if task is not None else "<no task>"
+        stack = "".join(traceback.format_stack(frame))
+        logger.warning(
+            f"Event loop blocked for at least {stalled * 1000:.0f} ms "
+            f"in task {task_name}, stack:\n{stack}"
+        )
@@ -0,0 +1,42 @@
+import asyncio
+import cProfile
+import io
+import pstats
+
+
+class ProfilerBusyError(Exception):
+    """Профилирование уже запущено"""
+
+
+_profile_lock = asyncio.Lock()
+
+
+def is_profiling() -> bool:
+    return _profile_lock.locked()
+
+
+async def profile_for(seconds: float, top: int = 50) -> str:
+    """
+    Профилирует весь процесс бота в течение seconds секунд
+
+    cProfile включается для потока event loop, поэтому в профиль попадают все хендлеры,
+    задачи планировщика и колбэки драйвера БД, выполнявшиеся за это время.
+
+    Returns:
+        Отчёт pstats: top функций, отсортированных по cumulative time
+    """
+    if _profile_lock.locked():
+        raise ProfilerBusyError("Profiling is already running")
+
+    async with _profile_lock:
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            profiler.disable()
+
+    stream = io.StringIO()
+    stats = pstats.Stats(profiler, stream=stream)
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top)
+    return stream.getvalue()
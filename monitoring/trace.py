@@ -0,0 +1,29 @@
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(slots=True)
+class UpdateTrace:
+    """Сводка по обработке одного апдейта: кто его обработал и сколько стоила БД"""
+    update_id: int
+    update_type: str
+    handler: str = "unhandled"
+    router: Optional[str] = None
+    state: Optional[str] = None
+    db_queries: int = 0
+    db_time: float = 0.0
+    slowest_statement: Optional[str] = None
+    slowest_time: float = 0.0
+
+    def record_query(self, statement: str, elapsed: float) -> None:
+        """Учесть один выполненный SQL-запрос"""
+        self.db_queries += 1
+        self.db_time += elapsed
+        if elapsed > self.slowest_time:
+            self.slowest_time = elapsed
+            self.slowest_statement = statement
+
+
+# Трейс апдейта, который обрабатывается в текущей задаче asyncio
+current_trace: ContextVar[Optional[UpdateTrace]] = ContextVar("current_trace", default=None)
@@ -0,0 +1,49 @@
+import html
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
+
+from aiogram.types import InlineKeyboardMarkup
+
+from i18n import get_catalog
+from keyboards import reminder_keyboard
+
+# На месте вопроса при рендере статичной части; в каталогах такого символа нет
+_QUESTION_SLOT = "\x00"
+
+
+@dataclass(frozen=True, slots=True)
+class ReminderParts:
+    """
+    Готовое напоминание одного сценария для одного языка и одной даты
+
+    Всё, кроме текста вопроса, одинаково для всей волны рассылки: текст до и после
+    вопроса и клавиатура собираются один раз, для пользователя остаётся склейка строк.
+    Клавиатура общая для всех сообщений, менять её нельзя.
+    """
+
+    prefix: str
+    suffix: Optional[str]
+    keyboard: Optional[InlineKeyboardMarkup]
+
+    def render(self, question_text: Optional[str] = None) -> str:
+        if self.suffix is None:
+            return self.prefix
+        return self.prefix + html.escape(question_text) + self.suffix
+
+
+@lru_cache(maxsize=256)
+def reminder_parts(language: str, scenario: str, date_key: str, year: int) -> ReminderParts:
+    """
+    Статичные части напоминания: сценарий (ключ reminder.<scenario> в каталоге)
+    × язык × дата, о которой напоминаем (MM-DD и год)
+    """
+    i18n = get_catalog(language)
+    month, day = date_key.split("-")
+    date_label = f"{day}.{month}"
+
+    # Лишние поля шаблоны игнорируют, поэтому подставляем всё, что может понадобиться
+    text = i18n(f"reminder.{scenario}", question=_QUESTION_SLOT, year=year, date=date_label)
+    prefix, slot, suffix = text.partition(_QUESTION_SLOT)
+    keyboard = reminder_keyboard(i18n, scenario, date_key, year)
+    return ReminderParts(prefix, suffix if slot else None, keyboard)
@@ -1,33 +1,47 @@
 import asyncio
+import time
 from datetime import datetime, timedelta
+from typing import Optional
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 import pytz
-from database import get_all_users
+from database import get_all_users, rebuild_all_user_stats
 from aiogram import Bot
+from monitoring.metrics import registry
+from scheduler.messages import reminder_parts
 import logging
 
 logger = logging.getLogger(__name__)
 
+SCHEDULER_TICK = registry.histogram(
+    "fivebook_scheduler_tick_seconds",
+    "Duration of one scheduler check over all users",
+    ("job",)
+)
+REMINDER_SEND_LAG = registry.histogram(
+    "fivebook_reminder_send_lag_seconds",
+    "Delay between the scheduled minute and the actual reminder send",
+    ("kind",),
+    buckets=(0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+)
+
+
+def _observe_send_lag(kind: str, tick_time: Optional[datetime]) -> None:
+    """Записать задержку отправки относительно минуты, на которую было запланировано напоминание"""
+    if tick_time is not None:
+        REMINDER_SEND_LAG.observe((datetime.now() - tick_time).total_seconds(), kind=kind)
+
 
 class ReminderScheduler:
     def __init__(self, bot: Bot):
         self.bot = bot
         self.scheduler = AsyncIOScheduler(timezone=pytz.UTC)
         
-    async def send_daily_reminder(self, user_telegram_id: int):
+    async def send_daily_reminder(self, user_telegram_id: int, tick_time: Optional[datetime] = None):
         """Отправить ежедневное напоминание пользователю"""
         try:
             # Импортируем здесь чтобы избежать циклических импортов
-            from aiogram.fsm.context import FSMContext
-            from aiogram.fsm.storage.base import StorageKey
-            from handlers.daily import show_daily_question
-            
-            # Создаём "фейковое" сообщение для использования show_daily_question
-            # В реальности отправим просто текстовое сообщение
             from database import get_or_create_user, get_question_for_date, get_answer_for_year
-            from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
-
             from utils import is_leap_year
 
             now = datetime.now()
@@ -46,50 +60,22 @@ class ReminderScheduler:
             
             if question is None:
                 # Сценарий A: Первый год, вопрос не создан
-                await self.bot.send_message(
-                    user_telegram_id,
-                    "Привет! Время для записи в пятибук 🌿\n\n"
-                    "Сегодня у тебя ещё нет вопроса для этого дня.\n\n"
-                    "Используй команду /today чтобы создать вопрос и ответить на него."
-                )
+                parts = reminder_parts(user.language, "daily_no_question", date_key, current_year)
             else:
                 # Сценарий B: Вопрос уже существует
                 # Проверяем, есть ли уже ответ за текущий год
                 existing_answer = await get_answer_for_year(user.id, question.id, current_year)
-                
-                if existing_answer:
-                    # Ответ уже есть
-                    await self.bot.send_message(
-                        user_telegram_id,
-                        f"Доброе утро! ☀️\n\n"
-                        f"Сегодняшний вопрос:\n"
-                        f"<b>{question.question_text}</b>\n\n"
-                        f"Ты уже ответила на этот вопрос в {current_year} году ✅",
-                        parse_mode="HTML"
-                    )
-                else:
-                    # Показываем вопрос и кнопки
-                    keyboard = InlineKeyboardMarkup(inline_keyboard=[
-                        [InlineKeyboardButton(
-                            text="📖 Посмотреть прошлые ответы",
-                            callback_data="show_past_answers"
-                        )],
-                        [InlineKeyboardButton(
-                            text=f"✍️ Написать ответ за {current_year}",
-                            callback_data="write_answer"
-                        )]
-                    ])
-                    
-                    # Для удобства также предлагаем /today
-                    await self.bot.send_message(
-                        user_telegram_id,
-                        f"Доброе утро! ☀️\n\n"
-                        f"Сегодняшний вопрос для тебя:\n\n"
-                        f"<b>{question.question_text}</b>\n\n"
-                        f"Используй команду /today чтобы ответить на вопрос.",
-                        parse_mode="HTML"
-                    )
+                scenario = "daily_answered" if existing_answer else "daily_question"
+                parts = reminder_parts(user.language, scenario, date_key, current_year)
+
+            await self.bot.send_message(
+                user_telegram_id,
+                parts.render(question and question.question_text),
+                parse_mode="HTML",
+                reply_markup=parts.keyboard
+            )
             
+            _observe_send_lag("daily", tick_time)
             logger.info(f"Reminder sent to user {user_telegram_id}")
             
         except Exception as e:
@@ -97,6 +83,8 @@ class ReminderScheduler:
     
     async def check_reminders(self):
         """Проверить, кому нужно отправить напоминания"""
+        tick_started = time.perf_counter()
+        tick_time = datetime.now().replace(second=0, microsecond=0)
         try:
             users = await get_all_users()
             now = datetime.now()
@@ -112,19 +100,20 @@ class ReminderScheduler:
 
                     # Проверяем, совпадает ли время
                     if user_now.hour == reminder_hour and user_now.minute == reminder_minute:
-                        await self.send_daily_reminder(user.telegram_id)
+                        await self.send_daily_reminder(user.telegram_id, tick_time)
 
                 except Exception as e:
                     logger.error(f"Error processing user {user.telegram_id}: {e}")
 
         except Exception as e:
             logger.error(f"Error in check_reminders: {e}")
+        finally:
+            SCHEDULER_TICK.observe(time.perf_counter() - tick_started, job="check_reminders")
 
-    async def send_evening_reminder(self, user_telegram_id: int):
+    async def send_evening_reminder(self, user_telegram_id: int, tick_time: Optional[datetime] = None):
         """Отправить вечернее напоминание в 23:00, если за сегодня нет записи"""
         try:
             from database import get_or_create_user, get_question_for_date, get_answer_for_year
-            from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
 
             user = await get_or_create_user(user_telegram_id)
 
@@ -146,48 +135,17 @@ class ReminderScheduler:
                 logger.info(f"Skipping evening reminder for user {user_telegram_id} - answer already exists")
                 return
 
-            # Вариант 1: Вопрос есть, но нет ответа
-            if question:
-                keyboard = InlineKeyboardMarkup(inline_keyboard=[
-                    [InlineKeyboardButton(
-                        text="✍️ Ответить за сегодня",
-                        callback_data="evening_answer_today"
-                    )],
-                    [InlineKeyboardButton(
-                        text="🙈 Пропустить",
-                        callback_data="evening_skip"
-                    )]
-                ])
-
-                await self.bot.send_message(
-                    user_telegram_id,
-                    f"🌙 Уже 23:00, а ответа за сегодня ещё нет.\n\n"
-                    f"Сегодняшний вопрос:\n"
-                    f"<b>{question.question_text}</b>\n\n"
-                    f"Хочешь записать ответ сейчас?",
-                    parse_mode="HTML",
-                    reply_markup=keyboard
-                )
-            else:
-                # Вариант 2: Вопроса для этой даты ещё нет
-                keyboard = InlineKeyboardMarkup(inline_keyboard=[
-                    [InlineKeyboardButton(
-                        text="✍️ Добавить вопрос и ответ",
-                        callback_data="evening_add_question"
-                    )],
-                    [InlineKeyboardButton(
-                        text="🙈 Пропустить",
-                        callback_data="evening_skip"
-                    )]
-                ])
-
-                await self.bot.send_message(
-                    user_telegram_id,
-                    "🌙 Уже 23:00, а записи за сегодня ещё нет.\n\n"
-                    "Хочешь добавить вопрос и ответ за сегодняшний день?",
-                    reply_markup=keyboard
-                )
-
+            # Вариант 1: Вопрос есть, но нет ответа; вариант 2: вопроса для этой даты ещё нет
+            scenario = "evening_question" if question else "evening_no_question"
+            parts = reminder_parts(user.language, scenario, date_key, current_year)
+            await self.bot.send_message(
+                user_telegram_id,
+                parts.render(question and question.question_text),
+                parse_mode="HTML",
+                reply_markup=parts.keyboard
+            )
+
+            _observe_send_lag("evening", tick_time)
             logger.info(f"Evening reminder sent to user {user_telegram_id}")
 
         except Exception as e:
@@ -195,6 +153,8 @@ class ReminderScheduler:
 
     async def check_evening_reminders(self):
         """Проверить, кому нужно отправить вечерние напоминания в 23:00"""
+        tick_started = time.perf_counter()
+        tick_time = datetime.now().replace(second=0, microsecond=0)
         try:
             users = await get_all_users()
 
@@ -216,24 +176,25 @@ class ReminderScheduler:
                             logger.info(f"Skipping evening reminder for user {user.telegram_id} - main reminder is at 23:00")
                             continue
 
-                        await self.send_evening_reminder(user.telegram_id)
+                        await self.send_evening_reminder(user.telegram_id, tick_time)
 
                     # Альтернативный вариант: если основное напоминание на 23:00, отправляем вечернее в 22:30
                     elif user_now.hour == 22 and user_now.minute == 30:
                         if reminder_hour == 23 and reminder_minute == 0:
-                            await self.send_evening_reminder(user.telegram_id)
+                            await self.send_evening_reminder(user.telegram_id, tick_time)
 
                 except Exception as e:
                     logger.error(f"Error processing evening reminder for user {user.telegram_id}: {e}")
 
         except Exception as e:
             logger.error(f"Error in check_evening_reminders: {e}")
+        finally:
+            SCHEDULER_TICK.observe(time.perf_counter() - tick_started, job="check_evening_reminders")
 
-    async def send_morning_yesterday_reminder(self, user_telegram_id: int):
+    async def send_morning_yesterday_reminder(self, user_telegram_id: int, tick_time: Optional[datetime] = None):
         """Отправить утреннее напоминание в 09:00 про пропущенный вчерашний день"""
         try:
             from database import get_or_create_user, get_question_for_date, get_answer_for_year
-            from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
 
             user = await get_or_create_user(user_telegram_id)
 
@@ -257,53 +218,17 @@ class ReminderScheduler:
                 logger.info(f"Skipping morning yesterday reminder for user {user_telegram_id} - answer already exists")
                 return
 
-            # Форматируем вчерашнюю дату для отображения (ДД.ММ)
-            yesterday_label = yesterday.strftime("%d.%m")
-
-            # Вариант 1: Вопрос есть, но нет ответа
-            if question:
-                keyboard = InlineKeyboardMarkup(inline_keyboard=[
-                    [InlineKeyboardButton(
-                        text=f"✍️ Записать ответ за {yesterday_label}",
-                        callback_data=f"morning_yesterday_answer:{yesterday_date_key}:{yesterday_year}"
-                    )],
-                    [InlineKeyboardButton(
-                        text="🙈 Пропустить вчера",
-                        callback_data="morning_yesterday_skip"
-                    )]
-                ])
-
-                await self.bot.send_message(
-                    user_telegram_id,
-                    f"Доброе утро! ☀️\\n\\n"
-                    f"Похоже, вчера ({yesterday_label}) ты не успела сделать запись.\\n\\n"
-                    f"Вопрос дня:\\n"
-                    f"<b>{question.question_text}</b>\\n\\n"
-                    f"Хочешь записать ответ за вчера сейчас?",
-                    parse_mode="HTML",
-                    reply_markup=keyboard
-                )
-            else:
-                # Вариант 2: Вопроса для вчерашней даты ещё нет
-                keyboard = InlineKeyboardMarkup(inline_keyboard=[
-                    [InlineKeyboardButton(
-                        text=f"✍️ Добавить вопрос и ответ за {yesterday_label}",
-                        callback_data=f"morning_yesterday_add:{yesterday_date_key}:{yesterday_year}"
-                    )],
-                    [InlineKeyboardButton(
-                        text="🙈 Пропустить вчера",
-                        callback_data="morning_yesterday_skip"
-                    )]
-                ])
-
-                await self.bot.send_message(
-                    user_telegram_id,
-                    f"Доброе утро! ☀️\\n\\n"
-                    f"Похоже, вчера ({yesterday_label}) ты не успела сделать запись.\\n\\n"
-                    f"Хочешь добавить вопрос и ответ за вчера сейчас?",
-                    reply_markup=keyboard
-                )
-
+            # Вариант 1: Вопрос есть, но нет ответа; вариант 2: вопроса для вчерашней даты ещё нет
+            scenario = "yesterday_question" if question else "yesterday_no_question"
+            parts = reminder_parts(user.language, scenario, yesterday_date_key, yesterday_year)
+            await self.bot.send_message(
+                user_telegram_id,
+                parts.render(question and question.question_text),
+                parse_mode="HTML",
+                reply_markup=parts.keyboard
+            )
+
+            _observe_send_lag("morning_yesterday", tick_time)
             logger.info(f"Morning yesterday reminder sent to user {user_telegram_id}")
 
         except Exception as e:
@@ -311,6 +236,8 @@ class ReminderScheduler:
 
     async def check_morning_yesterday_reminders(self):
         """Проверить, кому нужно отправить утренние напоминания про вчерашний день в 09:00"""
+        tick_started = time.perf_counter()
+        tick_time = datetime.now().replace(second=0, microsecond=0)
         try:
             users = await get_all_users()
 
@@ -322,13 +249,29 @@ class ReminderScheduler:
 
                     # Проверяем, что сейчас 09:00 по локальному времени пользователя
                     if user_now.hour == 9 and user_now.minute == 0:
-                        await self.send_morning_yesterday_reminder(user.telegram_id)
+                        await self.send_morning_yesterday_reminder(user.telegram_id, tick_time)
 
                 except Exception as e:
                     logger.error(f"Error processing morning yesterday reminder for user {user.telegram_id}: {e}")
 
         except Exception as e:
             logger.error(f"Error in check_morning_yesterday_reminders: {e}")
+        finally:
+            SCHEDULER_TICK.observe(time.perf_counter() - tick_started, job="check_morning_yesterday_reminders")
+
+    async def rebuild_stats(self):
+        """Ночная сверка статистики: пересчитать её по ответам всех пользователей"""
+        tick_started = time.perf_counter()
+        try:
+            out_of_sync = await rebuild_all_user_stats()
+            if out_of_sync:
+                logger.warning(f"User stats rebuilt, {out_of_sync} users were out of sync")
+            else:
+                logger.info("User stats rebuilt, all consistent")
+        except Exception as e:
+            logger.error(f"Error in rebuild_stats: {e}")
+        finally:
+            SCHEDULER_TICK.observe(time.perf_counter() - tick_started, job="rebuild_stats")
 
     def start(self):
         """Запустить планировщик"""
@@ -356,6 +299,14 @@ class ReminderScheduler:
             replace_existing=True
         )
 
+        # Раз в сутки, в тихое время, сверяем инкрементальную статистику с ответами
+        self.scheduler.add_job(
+            self.rebuild_stats,
+            trigger=CronTrigger(hour=3, minute=30),
+            id='rebuild_stats',
+            replace_existing=True
+        )
+
         self.scheduler.start()
         logger.info("Reminder scheduler started (morning, evening, and morning yesterday)")
     
@@ -0,0 +1,94 @@
+"""
+Общие фикстуры тестов
+
+Апдейты идут через настоящий диспетчер из bot.create_dispatcher: их строит
+devtools.fake_telegram.FakeTelegram, вызовы Bot API записывает OfflineSession.
+База - SQLite из config во временном каталоге, одна на все тесты; у каждого теста
+свой пользователь (фикстура user_id), поэтому данные тестов не пересекаются.
+"""
+import asyncio
+import itertools
+import os
+import tempfile
+from typing import Callable, Optional
+
+import pytest
+from aiogram import Bot, Dispatcher
+from aiogram.fsm.storage.memory import MemoryStorage
+from aiogram.types import Update
+
+import config
+from devtools.fake_telegram import FakeTelegram, OfflineSession
+
+_user_ids = itertools.count(1000)
+_workdir = tempfile.TemporaryDirectory(prefix="fivebook-tests-")
+_cwd = os.getcwd()
+
+
+def pytest_configure(config):
+    # DATABASE_URL - относительный путь, и движок превращает его в абсолютный при импорте
+    # database: каталог нужно сменить до того, как тесты его импортируют
+    os.chdir(_workdir.name)
+
+
+def pytest_unconfigure(config):
+    os.chdir(_cwd)
+    _workdir.cleanup()
+
+
+@pytest.fixture(scope="session")
+def run() -> Callable:
+    """Выполнить корутину в общем event loop (соединения с БД живут в нём же)"""
+    from database import init_db
+    from database.db import engine
+
+    with asyncio.Runner() as runner:
+        runner.run(init_db())
+        yield runner.run
+        runner.run(engine.dispose())
+
+
+@pytest.fixture(scope="session")
+def dispatcher(run) -> Dispatcher:
+    """
+    Диспетчер бота; роутеры подключаются к диспетчеру один раз, поэтому он общий
+
+    Собирается без фильтров роутеров по callback_data: test_routing сравнивает выбор
+    хендлера до и после filter_routers_by_callback на этом же диспетчере.
+    """
+    # Троттлинг проверяется отдельно, здесь он не должен отбрасывать апдейты
+    config.THROTTLE_LIMITS = {"default": (1e9, 10 ** 9)}
+    from bot import create_dispatcher
+    return create_dispatcher(MemoryStorage(), router_filters=False)
+
+
+@pytest.fixture
+def session() -> OfflineSession:
+    return OfflineSession()
+
+
+@pytest.fixture
+def bot(session) -> Bot:
+    return Bot("42:TEST", session=session)
+
+
+@pytest.fixture
+def user_id() -> int:
+    """Telegram ID пользователя, которого нет ни в одном другом тесте"""
+    return next(_user_ids)
+
+
+@pytest.fixture
+def send(run, dispatcher, bot, user_id) -> Callable:
+    """Отправить боту текст или нажатие кнопки ('cb:<callback_data>') от пользователя теста"""
+    telegram = FakeTelegram()
+
+    def send(step: str, from_user: Optional[int] = None) -> None:
+        sender = from_user or user_id
+        if step.startswith("cb:"):
+            raw = telegram.callback_update(sender, step[3:])
+        else:
+            raw = telegram.text_update(sender, step)
+        run(dispatcher.feed_update(bot, Update.model_validate(raw, context={"bot": bot})))
+
+    return send
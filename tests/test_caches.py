@@ -0,0 +1,40 @@
+from database.date_cache import QuestionWindowCache
+from database.search_cache import SearchResultCache
+
+
+def test_window_read_before_invalidate_is_not_cached():
+    cache = QuestionWindowCache(ttl=60, max_users=10)
+    generation = cache.generation(1)
+    cache.invalidate(1)
+    cache.put(1, {"03-05": None}, generation)
+    assert cache.get(1, "03-05") == (False, None)
+
+    cache.put(1, {"03-05": None}, cache.generation(1))
+    assert cache.get(1, "03-05") == (True, None)
+
+
+def test_search_read_before_invalidate_is_not_cached():
+    cache = SearchResultCache(ttl=60, max_users=10)
+    generation = cache.generation(1)
+    cache.invalidate(1)
+    cache.put(1, ("море",), [], True, generation)
+    assert cache.get(1, ("море",)) is None
+
+
+def test_generations_are_bounded_like_entries():
+    windows = QuestionWindowCache(ttl=60, max_users=10)
+    searches = SearchResultCache(ttl=60, max_users=10)
+    for user_id in range(1000):
+        for cache in (windows, searches):
+            generation = cache.generation(user_id)
+            cache.invalidate(user_id)
+            cache.generation(user_id)
+    assert len(windows._generations) <= 10
+    assert len(searches._generations) <= 10
+
+    # Поколение вытеснено, пока шёл запрос: результат просто не кэшируется
+    generation = windows.generation(0)
+    for user_id in range(1, 11):
+        windows.generation(user_id)
+    windows.put(0, {"03-05": None}, generation)
+    assert windows.get(0, "03-05") == (False, None)
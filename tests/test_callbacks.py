@@ -0,0 +1,106 @@
+import pytest
+
+from callbacks import (
+    MAX_CALLBACK_DATA_LENGTH,
+    BackdatedEntry,
+    CalendarAddAnswer,
+    CalendarCreateQuestion,
+    CalendarCustomYear,
+    CalendarDay,
+    CalendarDeleteAnswer,
+    CalendarEditAnswer,
+    CalendarMonth,
+    CalendarSelectYear,
+    CalendarYearPicked,
+    DateShift,
+    PastAnswersPage,
+    PastYear,
+    SearchPage,
+    SetLanguage,
+    YesterdayAnswer,
+    YesterdayQuestion,
+    decode,
+)
+
+SAMPLES = [
+    PastAnswersPage(123, True, False, 2021),
+    PastAnswersPage(2 ** 31, False, True, 9999),
+    PastYear(2019),
+    CalendarMonth(12),
+    CalendarDay("01-01"),
+    CalendarDay("02-29"),
+    CalendarDay("12-31"),
+    DateShift("03-15", -1),
+    DateShift("12-31", 1),
+    BackdatedEntry("07-04"),
+    CalendarSelectYear("03-15", 42),
+    CalendarYearPicked("03-15", 42, 2020),
+    CalendarCustomYear("03-15", 42),
+    CalendarCreateQuestion("03-15", 2020),
+    CalendarAddAnswer("03-15", 2020, 42),
+    CalendarEditAnswer("12-31", 9999, 2 ** 31),
+    CalendarDeleteAnswer("12-31", 9999, 2 ** 31),
+    YesterdayAnswer("02-29", 2024),
+    YesterdayQuestion("02-28", 2023),
+    SearchPage(0),
+    SearchPage(1000),
+    SetLanguage("en"),
+]
+
+
+@pytest.mark.parametrize("callback", SAMPLES, ids=repr)
+def test_pack_round_trip(callback):
+    packed = callback.pack()
+    assert len(packed.encode()) <= MAX_CALLBACK_DATA_LENGTH
+    assert decode(packed) == callback
+
+
+def test_packed_format():
+    # Пример из комментария в callbacks.py
+    assert CalendarEditAnswer("03-15", 2024, 123456).pack() == "ce:22:1k8:2n9c"
+    assert SearchPage(5).pack() == "s:5"
+
+
+@pytest.mark.parametrize("data, expected", [
+    ("select_year:2020", PastYear(2020)),
+    ("date_prev:03-01", DateShift("03-01", -1)),
+    ("date_next:02-29", DateShift("02-29", 1)),
+    ("add_backdated:07-04", BackdatedEntry("07-04")),
+    ("calendar_select_year:03-15:42", CalendarSelectYear("03-15", 42)),
+    ("calendar_year_selected:03-15:42:2020", CalendarYearPicked("03-15", 42, 2020)),
+    ("calendar_custom_year:03-15:42", CalendarCustomYear("03-15", 42)),
+    ("calendar_create_question:03-15:2020", CalendarCreateQuestion("03-15", 2020)),
+    ("calendar_add_answer:03-15:2020:42", CalendarAddAnswer("03-15", 2020, 42)),
+    ("calendar_edit_answer:03-15:2024:123456", CalendarEditAnswer("03-15", 2024, 123456)),
+    ("calendar_delete_answer:03-15:2024:123456", CalendarDeleteAnswer("03-15", 2024, 123456)),
+    ("morning_yesterday_answer:02-29:2024", YesterdayAnswer("02-29", 2024)),
+    ("morning_yesterday_add:02-28:2023", YesterdayQuestion("02-28", 2023)),
+])
+def test_legacy_format(data, expected):
+    assert decode(data) == expected
+
+
+@pytest.mark.parametrize("data", [
+    None,
+    "",
+    "show_past_answers",
+    "unknown:1",
+    "cd:zz",
+    "cd:-1",
+    "ce:1",
+    "ce:22:1k8:2n9c:1",
+    "y:not a number",
+    "date_prev:13-01",
+    "calendar_edit_answer:03-15:2024",
+    # Форматы, которых не было в выпущенной версии
+    "past_page:1:1:prev:2020",
+    "cal_month:3",
+    "search:5",
+])
+def test_not_decoded(data):
+    assert decode(data) is None
+
+
+def test_pack_rejects_separator_in_value():
+    with pytest.raises(ValueError):
+        SetLanguage("a:b").pack()
@@ -0,0 +1,111 @@
+from datetime import datetime
+
+from aiogram import Dispatcher, Router
+from aiogram.fsm.context import FSMContext
+from aiogram.fsm.storage.base import StorageKey
+from aiogram.types import Message, Update
+
+from callbacks import PastAnswersPage, SetLanguage
+from database import get_or_create_user, get_question_for_date
+from devtools.fake_telegram import FakeTelegram
+from i18n import get_catalog
+from middlewares import I18nMiddleware, ThrottlingMiddleware
+
+ru = get_catalog("ru")
+en = get_catalog("en")
+
+
+def test_change_reminder_time(send, session):
+    send("/settings")
+    send("25:00")
+    send("7:45")
+    assert session.texts() == [
+        ru("settings.prompt", reminder_time="09:00"),
+        ru("time.invalid_format_cancel"),
+        ru("settings.time_changed", time="07:45"),
+    ]
+
+
+def test_first_answer_of_the_day(send, session):
+    send("/today")
+    send("Что сегодня было хорошего?")
+    send("Тесты прошли")
+
+    assert session.texts() == [
+        ru("today.no_question"),
+        ru("today.question_saved"),
+        ru("today.first_answer_saved"),
+    ]
+    assert session.calls[-1].reply_markup.inline_keyboard[0][0].text == ru("button.enter_past_years")
+
+
+def test_day_flow_follows_language(send, session):
+    send(f"cb:{SetLanguage('en').pack()}")
+    session.calls.clear()
+    send("/today")
+    send("What went well today?")
+    send("Tests passed")
+    send("/date")
+
+    month = datetime.now().month
+    assert session.texts() == [
+        en("today.no_question"),
+        en("today.question_saved"),
+        en("today.first_answer_saved"),
+        en("date.month_grid", month=en(f"month.{month}")),
+    ]
+    assert session.calls[2].reply_markup.inline_keyboard[0][0].text == en("button.enter_past_years")
+    assert session.calls[3].reply_markup.inline_keyboard[0][1].text == en(f"month.{month}")
+
+
+def test_past_answers_page_shows_only_own_answers(run, send, session, user_id):
+    send("/today")
+    send("Вопрос")
+    send("Секретный ответ")
+
+    async def question_id() -> int:
+        user = await get_or_create_user(user_id)
+        question = await get_question_for_date(user.id, datetime.now().strftime("%m-%d"))
+        return question.id
+
+    page = PastAnswersPage(run(question_id()), False, False, 2000).pack()
+    session.calls.clear()
+
+    # Тот же question_id от другого пользователя: чужие ответы не показываются
+    send(f"cb:{page}", from_user=user_id + 10 ** 6)
+    assert not any("Секретный ответ" in text for text in session.texts())
+
+    send(f"cb:{page}")
+    assert any("Секретный ответ" in text for text in session.texts())
+
+
+def test_throttled_messages_get_one_notice(run, bot, session, user_id):
+    dp = Dispatcher()
+    dp.message.middleware(I18nMiddleware())
+    dp.message.middleware(ThrottlingMiddleware({"default": (0.001, 2)}))
+    router = Router()
+    handled = []
+
+    @router.message()
+    async def echo(message: Message):
+        handled.append(message.text)
+
+    dp.include_router(router)
+    telegram = FakeTelegram()
+
+    def send(text: str) -> None:
+        update = Update.model_validate(telegram.text_update(user_id, text), context={"bot": bot})
+        run(dp.feed_update(bot, update))
+
+    for number in range(5):
+        send(str(number))
+    assert handled == ["0", "1"]
+    assert session.texts() == [ru("throttle.too_fast")]
+
+    # Ответ на вопрос бота (активное FSM-состояние) не ограничивается
+    state = FSMContext(dp.storage, StorageKey(bot_id=bot.id, chat_id=user_id, user_id=user_id))
+    run(state.set_state("waiting"))
+    send("5")
+    send("6")
+    assert handled == ["0", "1", "5", "6"]
+    assert len(session.texts()) == 1
@@ -0,0 +1,33 @@
+import html
+
+from database import SearchHit
+from handlers.inline import MESSAGE_CHARS, QUESTION_CHARS, _build_article
+
+
+def _message_text(hit: SearchHit) -> str:
+    return _build_article(hit).input_message_content.message_text
+
+
+def test_short_entry_is_not_truncated():
+    text = _message_text(SearchHit(1, 2024, "03-15", "Что & как?", "Всё <хорошо>", ""))
+    assert text == "📅 <b>15.03.2024</b> - <i>Что &amp; как?</i>\n\nВсё &lt;хорошо&gt;"
+
+
+def test_long_question_and_escaped_answer_fit_in_message():
+    # Раньше обрезался только ответ, и вопрос длиннее сообщения зацикливал обрезку
+    text = _message_text(SearchHit(1, 2024, "03-15", "q" * 4100, "&" * 5000, ""))
+    assert len(text) <= MESSAGE_CHARS
+    question = text[text.index("<i>") + 3:text.index("</i>")]
+    assert len(question) <= QUESTION_CHARS and question.endswith("…")
+
+    body = text.split("\n\n", 1)[1]
+    assert body.endswith("…")
+    # Сущности не разрезаны пополам
+    assert body[:-1] == html.escape("&" * (len(body[:-1]) // len("&amp;")))
+
+
+def test_escaped_question_fits_in_its_half():
+    text = _message_text(SearchHit(1, 2024, "03-15", '"' * 4000, "ответ", ""))
+    question = text[text.index("<i>") + 3:text.index("</i>")]
+    assert len(question) <= QUESTION_CHARS
+    assert text.endswith("ответ")
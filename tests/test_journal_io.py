@@ -0,0 +1,45 @@
+import io
+import json
+
+import pytest
+
+import journal_io
+from journal_io import read_import_records
+
+RECORDS = [
+    {"date": "03-15", "question": "Что радует?", "year": 2021, "answer": "Весна, «кавычки» и \"escape\""},
+    {"date": "29.02.2024", "question": "Високосный день", "answer": "Есть"},
+    [1, 2],
+    {"date": "12-31", "question": "Итоги", "year": 2022, "answer": "{[,]}"},
+]
+
+
+def _read(text: str, fmt: str = "json") -> list:
+    return list(read_import_records(io.BytesIO(text.encode()), fmt))
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+def test_json_array_is_read_by_element(monkeypatch, indent):
+    # Маленькие куски, чтобы элементы и числа разрезались на границах
+    monkeypatch.setattr(journal_io, "_JSON_CHUNK_SIZE", 5)
+    records = _read("\n  " + json.dumps(RECORDS, ensure_ascii=False, indent=indent))
+    assert records == [
+        (number, record if isinstance(record, dict) else None)
+        for number, record in enumerate(RECORDS, start=1)
+    ]
+
+
+def test_json_lines():
+    text = "\n".join(json.dumps(record, ensure_ascii=False) for record in RECORDS) + "\n\nnot json\n"
+    assert [record for _, record in _read(text)] == [RECORDS[0], RECORDS[1], None, RECORDS[3], None]
+
+
+@pytest.mark.parametrize("text", ["[]", " [ ] "])
+def test_empty_json_array(text):
+    assert _read(text) == []
+
+
+@pytest.mark.parametrize("text", ['[{"a": 1}', '[{"a": 1} {"b": 2}]', "[1,", '[{"a": '])
+def test_broken_json_array(text):
+    with pytest.raises(ValueError):
+        _read(text)
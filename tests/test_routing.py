@@ -0,0 +1,51 @@
+from dataclasses import fields
+
+from callbacks import ButtonFilter, CallbackDataFilter, DateKey, filter_routers_by_callback
+
+_SAMPLE_VALUES = {int: 7, bool: True, str: "en", DateKey: "03-05"}
+
+
+def _callback_strings(dispatcher) -> list[str]:
+    """По строке на каждую кнопку и каждый тип callback_data хендлеров бота и старые форматы"""
+    strings = []
+    for router in dispatcher.chain_tail:
+        for handler in router.callback_query.handlers:
+            for filter_ in handler.filters or ():
+                if isinstance(filter_.callback, ButtonFilter):
+                    strings.append(filter_.callback.data)
+                elif isinstance(filter_.callback, CallbackDataFilter):
+                    callback_type = filter_.callback.callback_type
+                    values = [_SAMPLE_VALUES[field.type] for field in fields(callback_type)]
+                    strings.append(callback_type(*values).pack())
+    return strings + ["date_prev:03-05", "calendar_edit_answer:03-05:2020:1"]
+
+
+# Строки, для которых хендлера нет
+_UNHANDLED = ["unknown", "cd:zz", "ce:1"]
+
+
+def test_router_filters_keep_handler_choice(run, dispatcher, send):
+    """С фильтрами роутеров для каждого callback выбирается тот же хендлер, что и без них"""
+    chosen = []
+
+    async def record_handler(handler, event, data):
+        # Хендлер не вызывается: проверяется только выбор
+        chosen.append((event.data, data["handler"].callback.__qualname__))
+
+    strings = _callback_strings(dispatcher) + _UNHANDLED
+
+    dispatcher.callback_query.middleware.register(record_handler)
+    try:
+        for data in strings:
+            send(f"cb:{data}")
+        without_filters, chosen[:] = list(chosen), []
+
+        filter_routers_by_callback(dispatcher)
+        for data in strings:
+            send(f"cb:{data}")
+    finally:
+        dispatcher.callback_query.middleware.unregister(record_handler)
+
+    assert chosen == without_filters
+    # Каждая кнопка и каждый тип callback_data дошли до своего хендлера
+    assert sorted(set(strings) - {data for data, _ in chosen}) == sorted(_UNHANDLED)
@@ -0,0 +1,74 @@
+import random
+from datetime import date, timedelta
+
+import pytest
+
+from database import create_answer, create_question, delete_answer, get_or_create_user, get_user_stats
+from database.db import AsyncSessionLocal
+from database.stats import current_streak, rebuild_user_stats
+
+
+async def _out_of_sync(user_id: int) -> bool:
+    """Отличается ли сохранённая статистика от пересчитанной с нуля"""
+    async with AsyncSessionLocal() as session:
+        changed = await rebuild_user_stats(session, user_id)
+        await session.rollback()
+    return changed
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_incremental_stats_match_rebuild(run, user_id, seed):
+    """Статистика, которую ведут create_answer/delete_answer, совпадает с пересчётом"""
+    rng = random.Random(seed)
+
+    async def scenario():
+        user = await get_or_create_user(user_id)
+        # Три недели в двух годах: достаточно близко, чтобы серии дней сливались и рвались
+        days = [date(2023, 2, 20) + timedelta(days=offset) for offset in range(21)]
+        days += [day.replace(year=2024) for day in days]
+        questions = {}
+        answers = {}
+
+        for _ in range(60):
+            if answers and rng.random() < 0.35:
+                key = rng.choice(sorted(answers))
+                assert await delete_answer(answers.pop(key))
+            else:
+                day = rng.choice(days)
+                date_key = day.strftime("%m-%d")
+                if date_key not in questions:
+                    questions[date_key] = (await create_question(user.id, date_key, f"Вопрос {date_key}")).id
+                key = (date_key, day.year)
+                if key in answers:
+                    continue
+                answer = await create_answer(
+                    user.id, questions[date_key], f"Ответ {day}", day.isoformat(), day.year
+                )
+                answers[key] = answer.id
+            assert not await _out_of_sync(user.id)
+
+        stats = await get_user_stats(user.id)
+        assert stats.total_answers == len(answers)
+        assert sum(stats.answers_by_year.values()) == len(answers)
+
+    run(scenario())
+
+
+def test_current_streak(run, user_id):
+    async def scenario():
+        user = await get_or_create_user(user_id)
+        questions = {}
+        for date_key in ("05-01", "05-02", "05-03"):
+            questions[date_key] = (await create_question(user.id, date_key, "Вопрос")).id
+        # Отдельный день двумя годами раньше, потом серия из трёх дней
+        for day in (date(2022, 5, 1), date(2024, 5, 1), date(2024, 5, 2), date(2024, 5, 3)):
+            await create_answer(user.id, questions[day.strftime("%m-%d")], "Ответ", day.isoformat(), day.year)
+
+        stats = await get_user_stats(user.id)
+        assert stats.longest_run == 3
+        assert stats.dates_by_years == {"1": 2, "2": 1}
+        assert current_streak(stats, date(2024, 5, 3)) == 3
+        assert current_streak(stats, date(2024, 5, 4)) == 3
+        assert current_streak(stats, date(2024, 5, 5)) == 0
+
+    run(scenario())
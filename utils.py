@@ -1,6 +1,15 @@
+from collections import OrderedDict
 from datetime import datetime, timedelta
+from typing import Optional
 from database.models import Answer
-from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
+from aiogram.exceptions import TelegramBadRequest
+from aiogram.types import InlineKeyboardMarkup, Message
+from monitoring.metrics import CACHE_REQUESTS
+from i18n import Catalog
+
+# Отпечатки последнего отрисованного содержимого сообщений бота: (chat_id, message_id) -> hash
+_RENDERED_CACHE_SIZE = 5000
+_rendered: OrderedDict[tuple[int, int], int] = OrderedDict()
 
 
 def is_editable(answer: Answer) -> bool:
@@ -22,33 +31,34 @@ def is_editable(answer: Answer) -> bool:
     return time_passed <= timedelta(hours=24)
 
 
-def get_time_left_str(answer: Answer) -> str:
+def get_time_left_str(answer: Answer, i18n: Catalog) -> str:
     """
     Возвращает строку с оставшимся временем для редактирования
     
     Args:
         answer: Объект Answer из БД
+        i18n: Каталог сообщений пользователя
         
     Returns:
-        Строка вида "осталось 5 часов" или "время истекло"
+        Строка вида "осталось 5 ч." или "время истекло"
     """
     if not answer or not answer.created_at:
-        return "неизвестно"
+        return i18n("time_left.unknown")
     
     now = datetime.utcnow()
     deadline = answer.created_at + timedelta(hours=24)
     time_left = deadline - now
     
     if time_left.total_seconds() <= 0:
-        return "время истекло"
+        return i18n("time_left.expired")
     
     hours = int(time_left.total_seconds() // 3600)
     
     if hours >= 1:
-        return f"осталось {hours} ч."
+        return i18n("time_left.hours", hours=hours)
     else:
         minutes = int(time_left.total_seconds() // 60)
-        return f"осталось {minutes} мин."
+        return i18n("time_left.minutes", minutes=minutes)
     
 def is_leap_year(year: int) -> bool:
     """
@@ -66,29 +76,65 @@ def is_leap_year(year: int) -> bool:
     return (year % 400 == 0) or (year % 4 == 0 and year % 100 != 0)
 
 
-def get_year_keyboard(start_year: int = 2019, buttons_per_row: int = 3) -> InlineKeyboardMarkup:
+def _fingerprint(text: str, reply_markup: Optional[InlineKeyboardMarkup], parse_mode: Optional[str]) -> int:
+    markup = reply_markup.model_dump_json(exclude_none=True) if reply_markup else None
+    return hash((text, markup, parse_mode))
+
+
+def remember_rendered(
+    message: Message,
+    text: str,
+    reply_markup: Optional[InlineKeyboardMarkup] = None,
+    parse_mode: Optional[str] = None
+) -> None:
     """
-    Создаёт inline-клавиатуру с кнопками годов от start_year до текущего года
-    
+    Запоминает, что сейчас отображается в сообщении бота
+
     Args:
-        start_year: Начальный год (по умолчанию 2019)
-        buttons_per_row: Количество кнопок в ряду (по умолчанию 3)
-        
+        message: Сообщение бота (например, результат message.answer)
+        text: Текст, с которым оно отправлено или отредактировано
+        reply_markup: Клавиатура сообщения
+        parse_mode: Режим разметки текста
+    """
+    key = (message.chat.id, message.message_id)
+    _rendered[key] = _fingerprint(text, reply_markup, parse_mode)
+    _rendered.move_to_end(key)
+    while len(_rendered) > _RENDERED_CACHE_SIZE:
+        _rendered.popitem(last=False)
+
+
+async def edit_text_if_changed(
+    message: Message,
+    text: str,
+    reply_markup: Optional[InlineKeyboardMarkup] = None,
+    parse_mode: Optional[str] = None
+) -> bool:
+    """
+    Редактирует сообщение бота, только если текст или клавиатура отличаются от отображаемых
+
+    Args:
+        message: Сообщение бота, которое нужно отредактировать
+        text: Новый текст
+        reply_markup: Новая клавиатура
+        parse_mode: Режим разметки текста
+
     Returns:
-        InlineKeyboardMarkup с кнопками годов
+        True если сообщение отредактировано, False если содержимое не изменилось
     """
-    current_year = datetime.now().year
-    years = list(range(start_year, current_year + 1))
-    
-    buttons = []
-    for i in range(0, len(years), buttons_per_row):
-        row = years[i:i + buttons_per_row]
-        buttons.append([
-            InlineKeyboardButton(
-                text=str(year),
-                callback_data=f"select_year:{year}"
-            )
-            for year in row
-        ])
-    
-    return InlineKeyboardMarkup(inline_keyboard=buttons)    
\ No newline at end of file
+    key = (message.chat.id, message.message_id)
+    if _rendered.get(key) == _fingerprint(text, reply_markup, parse_mode):
+        CACHE_REQUESTS.inc(cache="rendered", result="hit")
+        return False
+    CACHE_REQUESTS.inc(cache="rendered", result="miss")
+
+    try:
+        await message.edit_text(text, parse_mode=parse_mode, reply_markup=reply_markup)
+    except TelegramBadRequest as e:
+        # Отпечатка не было (например, после перезапуска), а содержимое то же самое
+        if "message is not modified" not in e.message:
+            raise
+        remember_rendered(message, text, reply_markup, parse_mode)
+        return False
+
+    remember_rendered(message, text, reply_markup, parse_mode)
+    return True